@@ -23,26 +23,43 @@
 
 Description
 -----------
-Class for a Collision Engine """
+Class for a Collision Engine.
+Colliders are bucketed by an integer cell id, the index of the tile they are
+centered on; collisions are only resolved on tile centers where they are
+acted upon. Buckets are only updated for colliders that moved """
 
+from Engine.LibHexagonalPosition import calc_tile_index_from_xyz
 
-class CollisionEngine(object):
-    """The engine managing all pheromones on the map
-    """
+from Engine.SharedInstance import SharedInstance
+from Engine.GameSettings import MAPSIZE
 
-    _instance = None
 
-    def __new__(cls, *args, **kwargs):
-        """ Called when creating new instance, return existing instance
-        otherwise create new one, singleton pattern """
-        if not cls._instance:
-            cls._instance = super(CollisionEngine, cls).__new__(
-                                cls, *args, **kwargs)
-        return cls._instance
+class CollisionEngine(SharedInstance):
+    """The engine managing all pheromones on the map
+    """
 
     def __init__(self):
 
         self.colliders = []
+        self.rings = MAPSIZE
+
+        # Per collider the last seen position and its cell
+        self.last_xyz = []
+        self.cells = []
+
+        # Members per cell and the cells with more than one member
+        self.buckets = dict()
+        self.crowded = set()
+
+    def set_map_size(self, rings):
+        """ Sets the number of rings of the map used for the cell id,
+        all colliders are bucketed again on the next update """
+
+        self.rings = rings
+
+        for index, obj in enumerate(self.colliders):
+            self.leave_cell(index, obj)
+            self.last_xyz[index] = None
 
     def add_component(self, game_object):
         """ If a object has a collider and a position component it is added
@@ -52,36 +69,92 @@ class CollisionEngine(object):
             if 'collision' in game_object.components and \
                     'position' in game_object.components:
                 self.colliders.append(game_object)
+                self.last_xyz.append(None)
+                self.cells.append(None)
         except AttributeError:
             pass
 
+    def remove_component(self, game_object):
+        """ Removes a collider and leaves the bucket of its cell """
+
+        try:
+            index = self.colliders.index(game_object)
+        except ValueError:
+            return
+
+        self.leave_cell(index, game_object)
+
+        del self.colliders[index]
+        del self.last_xyz[index]
+        del self.cells[index]
+
+    def get_cell(self, pos_comp):
+        """ Returns the cell id of a position, None if the position is not
+        on a tile center of the map """
+
+        if not pos_comp.center_of_tile():
+            return None
+
+        cell = calc_tile_index_from_xyz(pos_comp.pos.xyz, self.rings)
+
+        return cell if cell >= 0 else None
+
+    def enter_cell(self, index, obj, cell):
+        """ Adds a collider to the bucket of a cell """
+
+        bucket = self.buckets.setdefault(cell, [])
+        bucket.append(obj)
+
+        if len(bucket) == 2:
+            self.crowded.add(cell)
+
+        self.cells[index] = cell
+        obj.components['collision'].group = bucket
+
+    def leave_cell(self, index, obj):
+        """ Removes a collider from the bucket of its cell """
+
+        cell = self.cells[index]
+
+        if cell is None:
+            return
+
+        bucket = self.buckets[cell]
+        bucket.remove(obj)
+
+        if len(bucket) == 1:
+            self.crowded.discard(cell)
+        elif not bucket:
+            del self.buckets[cell]
+
+        self.cells[index] = None
+        obj.components['collision'].group = None
+
     def update(self):
-        """ Check for collisions """
+        """ Moves colliders that changed position to their new cell """
 
-        collide = dict()
+        last_xyz = self.last_xyz
 
-        collisions = []
+        for index, obj in enumerate(self.colliders):
 
-        for obj in self.colliders:
+            pos_comp = obj.components['position']
+            xyz = pos_comp.pos.xyz
 
-            xyz = obj.components['position'].xyz()
-            key = "%+.1f%+.1f%+.1f" % (xyz[0], xyz[1], xyz[2])
+            # Positions are replaced, not changed, when an object moves
+            if xyz is last_xyz[index]:
+                continue
+            last_xyz[index] = xyz
 
-            obj.components['collision'].objects_collided_with = []
+            cell = self.get_cell(pos_comp)
 
-            try:
-                collide[key].append(obj)
-                collisions.append(key)
-            except KeyError:
-                collide[key] = [obj]
+            if cell != self.cells[index]:
+                self.leave_cell(index, obj)
 
-        # If a collision happened there is an entry
-        for key in collisions:
-            # tell every object
-            colliders = collide[key]
+                if cell is not None:
+                    self.enter_cell(index, obj, cell)
 
-            for obj in colliders:
-                obj.components['collision'].objects_collided_with =  \
-                    [collidee for collidee in
-                        colliders if collidee is not obj]
+    def get_collisions(self):
+        """ Returns a (cell, members) pair for every cell holding more than
+        one collider, the members list must not be modified """
 
+        return [(cell, self.buckets[cell]) for cell in self.crowded]
@@ -27,29 +27,54 @@ Class for a Artificial Intelligence component """
 
 from Engine.Components.Component import Component
 from Engine.Components.PheromoneActorComponent import PheromoneActorComponent
-from random import random, randint
 from Engine.GameSettings import ANT_DEFAULTS
 
+import random
+
+
+class Stats(object):
+    """The food found, carried and returned by an ant
+    """
+
+    __slots__ = ('found_food', 'carrying_food', 'returned_food')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """ Sets all counts to zero """
+
+        self.found_food = 0
+        self.carrying_food = 0
+        self.returned_food = 0
+
 
 class AiComponent(Component):
     """An Ai component
     """
 
-    def __init__(self, parent):
+    __slots__ = ('interested_in', 'chances', 'pheromone_deposit_delta',
+                 'deposit_defaults', 'feeding_speed', 'rng', 'stats')
+
+    def __init__(self, parent, ant_defaults=ANT_DEFAULTS):
         self.parent = parent
-        self.interested_in = ANT_DEFAULTS["BEHAVIOUR"]["interested_in"]
+        self.interested_in = ant_defaults["BEHAVIOUR"]["interested_in"]
 
-        self.chances = ANT_DEFAULTS["BEHAVIOUR"]
-        self.pheromone_deposit_delta = ANT_DEFAULTS["DEPOSIT"]["delta"]
+        self.chances = ant_defaults["BEHAVIOUR"]
+        self.pheromone_deposit_delta = ant_defaults["DEPOSIT"]["delta"]
 
-        self.deposit_defaults = ANT_DEFAULTS["DEPOSIT"]
+        self.deposit_defaults = ant_defaults["DEPOSIT"]
+        self.feeding_speed = ant_defaults["FEEDING"]["speed"]
 
-        class Stats(object): pass
+        self.rng = random
 
         self.stats = Stats()
-        self.stats.found_food = 0
-        self.stats.carrying_food = 0
-        self.stats.returned_food = 0
+
+    def recycle(self):
+        """ Forgets the found food and looks for food again """
+
+        self.interested_in = self.chances["interested_in"]
+        self.stats.reset()
 
     def update(self):
         """ Takes the information and updates the actions """
@@ -61,14 +86,14 @@ class AiComponent(Component):
             pos_comp.orientation = self.choose_orientation()
 
     def choose_orientation(self):
-        dice = random()
+        dice = self.rng.random()
 
         orientation = -1
 
         if dice <= self.chances["listen_to_pheromone"]:
             orientation = self.get_direction_using_pheromone()
         else:
-            orientation = randint(0, 5)
+            orientation = self.rng.randint(0, 5)
 
         return orientation
 
@@ -109,7 +134,7 @@ class AiComponent(Component):
         if self.interested_in == "food":
 
             food_comp = food_obj.components['food']
-            food = food_comp.take_food(ANT_DEFAULTS["FEEDING"]["speed"])
+            food = food_comp.take_food(self.feeding_speed)
 
             self.stats.found_food += food
             self.stats.carrying_food += food
@@ -25,7 +25,9 @@ Description
 -----------
 Class for a Collision component.
 Collision component gives game_objects the ability
-to collide with other colliding objects """
+to collide with other colliding objects.
+The collision engine shares the members of the cell the object is in,
+the collided objects are derived from it when asked for """
 
 from Engine.Components.Component import Component
 
@@ -34,8 +36,30 @@ class CollisionComponent(Component):
     """An Collision component
     """
 
+    __slots__ = ('group',)
+
     def __init__(self, parent):
         super(CollisionComponent, self).__init__(parent)
         self.parent = parent
 
-        self.objects_collided_with = []
+        self.group = None
+
+    def recycle(self):
+        """ Leaves the group of colliding objects """
+
+        self.group = None
+
+    @property
+    def objects_collided_with(self):
+        """ The other objects in the same cell """
+
+        group = self.group
+
+        if group is None or len(group) < 2:
+            return []
+
+        return [obj for obj in group if obj is not self.parent]
+
+    @objects_collided_with.setter
+    def objects_collided_with(self, objects):
+        self.group = [self.parent] + list(objects)
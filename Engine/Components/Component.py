@@ -30,6 +30,16 @@ class Component(object):
     """A component is a base class for features of gameobjects
     """
 
+    __slots__ = ('parent', 'components')
+
+    # Scheduled components are updated by the systems of the game engine
+    scheduled = True
+
     def __init__(self, parent, components=dict()):
         self.parent = parent
         self.components = components
+
+    def recycle(self):
+        """ Sets the state back to that of a new component, so the object
+        owning it can be reused """
+        pass
@@ -26,15 +26,20 @@ Description
 Class for a Food component.
 Food component gives game_objects the ability to hold food """
 
+import random
+
 from .Component import Component
 from Engine.LibHexagonalPosition import random_coordinate_center_of_tile
-from random import randint
+from Engine.LibPalette import food_color
+from Engine.GameSettings import MAPSIZE
 
 
 class FoodComponent(Component):
     """An Food component
     """
 
+    __slots__ = ('start_amount', 'amount', 'rng', 'max_coord')
+
     def __init__(self, parent):
         super(FoodComponent, self).__init__(parent)
         self.parent = parent
@@ -42,6 +47,16 @@ class FoodComponent(Component):
         self.start_amount = 0
         self.amount = 0
 
+        # Where and how much food appears after it is eaten
+        self.rng = random
+        self.max_coord = MAPSIZE - 1
+
+    def recycle(self):
+        """ Empties the food, reset is the respawn of eaten food """
+
+        self.start_amount = 0
+        self.amount = 0
+
     def set_start_amount(self, amount):
         self.start_amount = amount
         self.amount = amount
@@ -61,14 +76,12 @@ class FoodComponent(Component):
 
     def update_color(self):
 
-        red = int(255 * ((self.amount *1.0) / self.start_amount))
-        green = int(red / 2)
-        blue = 0
-        self.components['render'].fill = "#%02x%02x%02x" % (red, green, blue)
+        self.components['render'].fill = food_color(self.amount,
+                                                    self.start_amount)
 
     def reset(self):
 
-        pos = random_coordinate_center_of_tile()
+        pos = random_coordinate_center_of_tile(self.max_coord, self.rng)
         self.components['position'].pos.set_position_xyz(pos[0], pos[1], pos[2])
 
-        self.set_start_amount(randint(50,500))
+        self.set_start_amount(self.rng.randint(50,500))
@@ -27,20 +27,26 @@ Base class for a move component """
 
 from Engine.Components.Component import Component
 
-from Engine.LibCommon import add_delta_to_pos_if_valid
-
-from Engine.GameSettings import EPSILON
+from Engine.GameSettings import EPSILON, MAPSIZE
 
 
 class MoveComponent(Component):
     """A Move component
     """
 
+    __slots__ = ('speed', 'max_coord', 'epsilon')
+
     def __init__(self, parent, speed=0.0):
         super(MoveComponent, self).__init__(parent)
         self.parent = parent
         self.speed = speed
 
+        # The highest coordinate on the map
+        self.max_coord = MAPSIZE - 1
+
+        # Slower objects do not move
+        self.epsilon = EPSILON
+
     def get_xyz_speed(self, orientation):
         """ Get the speed in x y z coordinates """
 
@@ -61,16 +67,9 @@ class MoveComponent(Component):
         pos_comp = self.components['position']
 
         # Only do the move computations if there is a movement
-        if self.speed >= EPSILON:
+        if self.speed >= self.epsilon:
 
-            deltas = self.get_xyz_speed(pos_comp.orientation)
-            xyz = pos_comp.xyz()
-
-            try:
-                xyz = add_delta_to_pos_if_valid(xyz, deltas)
-
-            except ValueError:
-                # Turn around if trying to walk off map
+            # Turn around if trying to walk off map
+            if not pos_comp.pos.move(pos_comp.orientation, self.speed,
+                                     self.max_coord):
                 pos_comp.orientation = (pos_comp.orientation + 3) % 6
-
-            pos_comp.set_position_xyz(xyz)
@@ -33,6 +33,8 @@ class NestComponent(Component):
     """An Nest component
     """
 
+    __slots__ = ('amount_of_ants',)
+
     def __init__(self, parent):
         super(NestComponent, self).__init__(parent)
         self.parent = parent
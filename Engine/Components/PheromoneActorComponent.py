@@ -27,6 +27,8 @@ Class for a Pheromone Actor component
 Gives gameobject the ability to sense pheromone levels around
 it and to deposit pheromones """
 
+import random
+
 from Engine.Components.Component import Component
 from Engine.LibCommon import highest_in_list
 
@@ -35,6 +37,8 @@ class PheromoneActorComponent(Component):
     """An Pheromone sense component
     """
 
+    __slots__ = ('neighbour_levels', 'deposit', 'rng')
+
     def __init__(self, parent):
         super(PheromoneActorComponent, self).__init__(parent)
         self.parent = parent
@@ -44,12 +48,25 @@ class PheromoneActorComponent(Component):
                                  "home": [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]}
         self.deposit = {"food": 0.0, "home": 0.0}
 
+        # Breaks ties between equal levels
+        self.rng = random
+
+    def recycle(self):
+        """ Clears the sensed levels and the deposit """
+
+        for levels in self.neighbour_levels.values():
+            levels[:] = [0.0] * len(levels)
+
+        for kind in self.deposit:
+            self.deposit[kind] = 0.0
+
     def direction_of_highest(self):
         """ Returns a dict with the indices of the highest levels """
 
         directions = {}
 
         for key in self.neighbour_levels.keys():
-            directions[key] = highest_in_list(self.neighbour_levels[key])
+            directions[key] = highest_in_list(self.neighbour_levels[key],
+                                              self.rng)
 
         return directions
@@ -24,25 +24,56 @@
 Description
 -----------
 Class for a Pheromone Holder component.
-Pheromone component gives game_objects the ability to have a pherome level """
+Pheromone component gives game_objects the ability to have a pherome level.
+Once bound to a PheromoneField the levels live in the field and the
+component is a view onto its slot """
 
 from .Component import Component
+from Engine.PheromoneField import PheromoneLevels
 
 
 class PheromoneHolderComponent(Component):
     """An Pheromone component
     """
 
+    __slots__ = ('field', 'index', '_levels', 'decay')
+
     def __init__(self, parent):
         super(PheromoneHolderComponent, self).__init__(parent)
         self.parent = parent
 
-        self.levels = {"food": 0.0, "home": 0.0}
+        self.field = None
+        self.index = -1
+
+        self._levels = {"food": 0.0, "home": 0.0}
         self.decay = {'food': {'relative': 0.00,
                                'abs_minimum': 0},
                       'home': {'relative': 0.0,
                                'abs_minimum': 0}}
 
+    @property
+    def levels(self):
+        """ The pheromone levels, a view on the field slot when bound """
+        return self._levels
+
+    @levels.setter
+    def levels(self, levels):
+        if self.field is None:
+            self._levels = levels
+        else:
+            self.field.set_levels(self.index, levels)
+
+    def bind(self, field, index):
+        """ Moves the levels and decay of this holder into a slot of
+        the pheromone field, after which levels is a view on that slot """
+
+        field.set_levels(index, self._levels)
+        field.set_decay(index, self.decay)
+
+        self.field = field
+        self.index = index
+        self._levels = PheromoneLevels(field, index)
+
     def update(self):
         """ This will update the level of this holder """
 
@@ -28,19 +28,25 @@ Class for a position component """
 from Engine.Components.Component import Component
 from ..HexagonalPosition import HexagonalPosition
 
-from Engine.LibCommon import is_float_int
-
 
 class PositionComponent(Component):
     """A Move component has a position
     """
 
+    __slots__ = ('pos', 'orientation')
+
     def __init__(self, parent):
         super(PositionComponent, self).__init__(parent)
         self.parent = parent
         self.pos = HexagonalPosition(self)
         self.orientation = 0
 
+    def recycle(self):
+        """ Moves back to the center, facing the first direction """
+
+        self.pos.set_steps(0, 0, 0)
+        self.orientation = 0
+
     def xyz(self):
         """ Returns the xyz position as list"""
 
@@ -57,6 +63,4 @@ class PositionComponent(Component):
         """ Returns a boolean which indicates if the current coordinate
         is in the center of a tile"""
 
-        return (is_float_int(self.pos.x) and
-                is_float_int(self.pos.y) and
-                is_float_int(self.pos.z))
+        return self.pos.center_of_tile()
@@ -26,7 +26,11 @@
 
 Description
 -----------
-Base class for a Render component """
+Base class for a Render component.
+Changes to the fill and visibility are remembered until the graphics
+engine has drawn them, static objects are never moved after creation.
+Every change is also counted, so other engines can tell what changed
+since they last drew without clearing the flags of the graphics engine """
 
 from .Component import Component
 
@@ -34,12 +38,51 @@ class RenderComponent( Component ):
     """A Render component has a color and a shape
     """
 
+    __slots__ = ('_visible', 'color', '_fill', 'width', 'polygon', 'static',
+                 'dirty', 'changes', 'renderID')
+
     def __init__(self, parent):
         self.parent = parent
-        self.visible = True
+        self._visible = True
         self.color = "#ffff00"
-        self.fill = "#ffffff"
+        self._fill = "#ffffff"
         self.width = 0.5
         self.polygon = [ 0, 0, 10, 0, 10, 10, 0, 10 ]
         self.renderID = -1
-      
+
+        # Drawing state kept by the graphics engine
+        self.static = False
+        self.dirty = set()
+        self.changes = 0
+
+    def recycle(self):
+        """ Forgets the drawing state, the object is drawn anew """
+
+        self._visible = True
+        self.renderID = -1
+        self.dirty.clear()
+        self.changes += 1
+
+    @property
+    def fill(self):
+        """ The fill color """
+        return self._fill
+
+    @fill.setter
+    def fill(self, fill):
+        if fill != self._fill:
+            self._fill = fill
+            self.dirty.add('fill')
+            self.changes += 1
+
+    @property
+    def visible(self):
+        """ True if the object is drawn """
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible):
+        if visible != self._visible:
+            self._visible = visible
+            self.dirty.add('visible')
+            self.changes += 1
@@ -0,0 +1,236 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Swarm Component Classes
+
+########################################################################
+
+Description
+-----------
+Per-ant views on the arrays of the SwarmEngine.
+An ant adopted by the swarm engine gets these components instead of its
+position, ai and move components. They read and write the state of the
+ant in the swarm arrays, all ants are advanced by the swarm engine """
+
+from Engine.Components.AiComponent import AiComponent
+from Engine.Components.MoveComponent import MoveComponent
+from Engine.Components.PositionComponent import PositionComponent
+
+from Engine.LibHexagonalPosition import calc_ring_side_tile_from_xyz
+from Engine.LibCommon import to_position_steps, from_position_steps
+from Engine.GameSettings import POSITION_STEPS
+
+
+class SwarmPosition(object):
+    """A HexagonalPosition stored in the swarm arrays
+    """
+
+    __slots__ = ('parent', 'swarm', 'index')
+
+    def __init__(self, swarm, index):
+        self.parent = None
+        self.swarm = swarm
+        self.index = index
+
+    @property
+    def x(self):  # pylint: disable=C0103
+        """ The x coordinate """
+        return from_position_steps(self.swarm.steps.item(self.index, 0))
+
+    @property
+    def y(self):  # pylint: disable=C0103
+        """ The y coordinate """
+        return from_position_steps(self.swarm.steps.item(self.index, 1))
+
+    @property
+    def z(self):  # pylint: disable=C0103
+        """ The z coordinate """
+        return from_position_steps(self.swarm.steps.item(self.index, 2))
+
+    @property
+    def steps(self):
+        """ The x y z coordinate in steps as tuple """
+        return tuple(self.swarm.steps[self.index].tolist())
+
+    @property
+    def xyz(self):
+        """ The x y z coordinate as tuple """
+        return tuple(from_position_steps(coord) for coord in self.steps)
+
+    @property
+    def ring(self):
+        """ The ring of the position """
+        return self.ring_side_tile()[0]
+
+    @property
+    def side(self):
+        """ The side of the position """
+        return self.ring_side_tile()[1]
+
+    @property
+    def tile(self):
+        """ The tile of the position """
+        return self.ring_side_tile()[2]
+
+    def ring_side_tile(self):
+        """ Returns the ring, side and tile of the current position """
+        return calc_ring_side_tile_from_xyz(self.xyz)
+
+    def center_of_tile(self):
+        """ Returns a boolean which indicates if the position
+        is in the center of a tile """
+
+        return all(coord % POSITION_STEPS == 0 for coord in self.steps)
+
+    def set_position_xyz(self, x, y, z, epsilon=None):  # pylint: disable=C0103
+        """Sets the position in X Y Z coordinates,
+        Returns a boolean if it was a valid position.
+        Coordinates are rounded to steps and compared exactly,
+        epsilon is only kept for compatibility
+        """
+
+        steps = (to_position_steps(x),
+                 to_position_steps(y),
+                 to_position_steps(z))
+
+        if sum(steps) == 0:
+            self.swarm.steps[self.index] = steps
+            return True
+        else:
+            return False
+
+
+class SwarmStats(object):
+    """The statistics of an ant stored in the swarm arrays
+    """
+
+    __slots__ = ('swarm', 'index')
+
+    def __init__(self, swarm, index):
+        self.swarm = swarm
+        self.index = index
+
+    @property
+    def found_food(self):
+        """ The amount of food found """
+        return self.swarm.stats.item(self.index, 0)
+
+    @found_food.setter
+    def found_food(self, amount):
+        self.swarm.stats[self.index, 0] = amount
+
+    @property
+    def carrying_food(self):
+        """ The amount of food carried to the nest """
+        return self.swarm.stats.item(self.index, 1)
+
+    @carrying_food.setter
+    def carrying_food(self, amount):
+        self.swarm.stats[self.index, 1] = amount
+
+    @property
+    def returned_food(self):
+        """ The amount of food returned to the nest """
+        return self.swarm.stats.item(self.index, 2)
+
+    @returned_food.setter
+    def returned_food(self, amount):
+        self.swarm.stats[self.index, 2] = amount
+
+
+class SwarmPositionComponent(PositionComponent):
+    """A Position component of an ant in the swarm
+    """
+
+    __slots__ = ('swarm', 'index')
+
+    def __init__(self, parent, swarm, index):
+        self.swarm = swarm
+        self.index = index
+
+        super(SwarmPositionComponent, self).__init__(parent)
+        self.pos = SwarmPosition(swarm, index)
+
+    @property
+    def orientation(self):
+        """ The orientation, same as in hexagonal position """
+        return self.swarm.orientation.item(self.index)
+
+    @orientation.setter
+    def orientation(self, orientation):
+        self.swarm.orientation[self.index] = orientation
+
+
+class SwarmAiComponent(AiComponent):
+    """An Ai component of an ant in the swarm, the decisions of all
+    ants are taken at once by the swarm engine
+    """
+
+    __slots__ = ('swarm', 'index')
+
+    scheduled = False
+
+    def __init__(self, parent, swarm, index):
+        self.swarm = swarm
+        self.index = index
+
+        super(SwarmAiComponent, self).__init__(parent)
+        self.stats = SwarmStats(swarm, index)
+
+    @property
+    def interested_in(self):
+        """ The pheromone type the ant is looking for """
+        return self.swarm.kinds[self.swarm.interested.item(self.index)]
+
+    @interested_in.setter
+    def interested_in(self, kind):
+        self.swarm.interested[self.index] = self.swarm.kinds.index(kind)
+
+    def update(self):
+        """ Decisions are taken by SwarmEngine.update """
+        pass
+
+
+class SwarmMoveComponent(MoveComponent):
+    """A Move component of an ant in the swarm, all ants are moved at
+    once by the swarm engine
+    """
+
+    __slots__ = ('swarm', 'index')
+
+    scheduled = False
+
+    def __init__(self, parent, swarm, index):
+        self.swarm = swarm
+        self.index = index
+
+        super(SwarmMoveComponent, self).__init__(parent)
+
+    @property
+    def speed(self):
+        """ The distance moved per update """
+        return from_position_steps(self.swarm.speed_steps.item(self.index))
+
+    @speed.setter
+    def speed(self, speed):
+        self.swarm.speed_steps[self.index] = to_position_steps(speed)
+
+    def update(self):
+        """ Moves are done by SwarmEngine.update """
+        pass
@@ -38,3 +38,6 @@ from Engine.Components.PositionComponent import PositionComponent
 from Engine.Components.FoodComponent import FoodComponent
 from Engine.Components.CollisionComponent import CollisionComponent
 from Engine.Components.NestComponent import NestComponent
+from Engine.Components.SwarmComponents import SwarmPositionComponent
+from Engine.Components.SwarmComponents import SwarmAiComponent
+from Engine.Components.SwarmComponents import SwarmMoveComponent
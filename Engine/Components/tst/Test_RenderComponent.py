@@ -63,5 +63,37 @@ class TestRenderComponent(unittest.TestCase):
 
         self.assertEqual( self.rndrComp.polygon,  [0,0,10,0,10,10,0,10] )
 
+    def test_changed_fill_is_dirty(self):
+        """ Only a fill different from the current one needs drawing """
+
+        rend_comp = RenderComponent(None)
+
+        rend_comp.fill = "#ffffff"
+        self.assertEqual(rend_comp.dirty, set())
+
+        rend_comp.fill = "#000000"
+        self.assertEqual(rend_comp.dirty, set(['fill']))
+
+    def test_changed_visibility_is_dirty(self):
+        """ Hiding an object needs drawing """
+
+        rend_comp = RenderComponent(None)
+        rend_comp.visible = False
+
+        self.assertFalse(rend_comp.visible)
+        self.assertEqual(rend_comp.dirty, set(['visible']))
+
+    def test_changes_are_counted(self):
+        """ Every change is counted, clearing dirty keeps the count """
+
+        rend_comp = RenderComponent(None)
+
+        rend_comp.fill = "#ffffff"
+        rend_comp.fill = "#000000"
+        rend_comp.visible = False
+        rend_comp.dirty.clear()
+
+        self.assertEqual(rend_comp.changes, 2)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
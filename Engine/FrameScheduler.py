@@ -0,0 +1,81 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Frame Scheduler Class
+
+########################################################################
+
+Description
+-----------
+Decides how many turns are simulated per drawn frame.
+Either a fixed number of turns per frame, or as many turns as fit in
+a frame of the target frame rate after drawing """
+
+from time import time
+
+from Engine.GameSettings import TICKS_PER_FRAME, TARGET_FPS
+
+
+class FrameScheduler(object):
+    """Runs the turns of a single frame
+    """
+
+    def __init__(self, ticks_per_frame=TICKS_PER_FRAME,
+                 target_fps=TARGET_FPS, clock=time):
+        self.ticks_per_frame = max(int(ticks_per_frame), 1)
+        self.target_fps = target_fps
+        self.clock = clock
+
+        # Estimated time needed to draw a frame
+        self.render_seconds = 0.0
+
+    def advance(self, update, max_ticks=-1):
+        """ Calls update for the turns of one frame, at least once and at
+        most max_ticks times when not negative. Returns the number of turns """
+
+        if max_ticks == 0:
+            return 0
+
+        if not self.target_fps:
+            ticks = self.ticks_per_frame
+            if max_ticks > 0:
+                ticks = min(ticks, max_ticks)
+
+            for _ in range(ticks):
+                update()
+
+            return ticks
+
+        deadline = self.clock() + 1.0 / self.target_fps - self.render_seconds
+
+        ticks = 0
+        while ticks != max_ticks:
+            update()
+            ticks += 1
+
+            if self.clock() >= deadline:
+                break
+
+        return ticks
+
+    def rendered(self, seconds):
+        """ Updates the estimated drawing time with the time the
+        last frame took to draw """
+
+        self.render_seconds = 0.8 * self.render_seconds + 0.2 * seconds
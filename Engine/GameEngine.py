@@ -30,34 +30,81 @@ from Engine.GameObjectFactory import GameObjectFactory
 
 from Engine.CollisionEngine import CollisionEngine
 from Engine.PheromoneEngine import PheromoneEngine
+from Engine.SwarmEngine import SwarmEngine
+from Engine.Profiler import Profiler
+from Engine.RandomStreams import RandomStreams
+from Engine.SharedInstance import SharedInstance
+from Engine.Settings import Settings
 
 from Engine.LibHexagonalPosition import random_coordinate_center_of_tile
+from Engine.LibHexagonalPosition import get_neighbour_table
 
-from Engine.GameSettings import MAPSIZE, NUMBER_OF_ANTS, PIECES_OF_FOOD
+from Engine.GameSettings import SWARM_ENGINE, SEED
+from functools import partial
 
-from random import randint
 
-
-class GameEngine(object):
-    """The engine containing all gameobjects and tiles
-    (following the singleton pattern)
+class GameEngine(SharedInstance):
+    """The engine containing all gameobjects and tiles,
+    every game engine owns its own engines
     """
 
-    _instance = None
-
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = super(GameEngine, cls).__new__(
-                                cls, *args, **kwargs)
-        return cls._instance
+    def __init__(self, swarm=SWARM_ENGINE, seed=SEED, settings=None):
+        """ Initializes all the member variables,
+        with swarm all ants are advanced by the swarm engine.
+        Runs with the same seed are the same. Given settings replace
+        swarm and seed """
+        if settings is None:
+            settings = Settings(swarm=swarm, seed=seed)
 
-    def __init__(self):
-        """ Initializes all the member variables """
+        self.settings = settings
         self.objects = dict()
-        self.game_object_factory = GameObjectFactory(self)
+        self.random = RandomStreams(settings.seed)
+        self.game_object_factory = GameObjectFactory(self, self.random,
+                                                     settings)
         self.collision_engine = CollisionEngine()
         self.pheromone_engine = PheromoneEngine()
+        self.swarm_engine = None
+        self.profiler = Profiler()
         self.callbacks_for_new_object = []
+        self.callbacks_for_removed_object = []
+        self.neighbour_table = None
+
+        # Objects per component type and the systems updating them
+        self.members = dict()
+        self.systems = []
+
+        if settings.swarm:
+            # The swarm adopts ants before any other engine sees them
+            self.swarm_engine = SwarmEngine()
+            self.swarm_engine.set_settings(settings)
+            self.swarm_engine.rng = self.random.ai.batch
+            self.callback_for_new_object(self.swarm_engine.add_component)
+            self.callback_for_removed_object(
+                self.swarm_engine.remove_component)
+
+        self.callback_for_new_object(self.track_components)
+        self.callback_for_removed_object(self.untrack_components)
+
+        self.register_system('pheromone_actors',
+                             self.pheromone_engine.update_actors)
+        self.register_system('collision', self.collision_engine.update)
+        self.register_system('ai', self.update_ai)
+        self.register_system('move', self.update_move)
+
+        if settings.swarm:
+            self.register_system('swarm', partial(self.swarm_engine.update,
+                                                  self.pheromone_engine))
+
+        self.register_system('pheromone_holders',
+                             self.pheromone_engine.update_holders)
+
+        if settings.swarm:
+            self.register_system('swarm_deposit',
+                                 partial(self.swarm_engine.deposit_pheromones,
+                                         self.pheromone_engine))
+
+        self.register_system('pheromone_history',
+                             self.pheromone_engine.update_recorder)
 
     def initialize(self):
         """ Perform all initializations """
@@ -71,27 +118,64 @@ class GameEngine(object):
         self.callback_for_new_object(self.collision_engine.add_component)
         self.callback_for_new_object(self.pheromone_engine.add_component)
 
-    def initialize_objects(self):
-        """ All objects in the world will be initialized here """
+        self.callback_for_removed_object(
+            self.collision_engine.remove_component)
+        self.callback_for_removed_object(
+            self.pheromone_engine.remove_component)
+
+    def initialize_objects(self, rings=None, ants=None, pieces_of_food=None):
+        """ All objects in the world will be initialized here,
+        by default as many as the settings describe """
+
+        self.create_map(rings)
+        self.create_colony(ants, pieces_of_food, rings)
+
+    def set_settings(self, settings):
+        """ Uses new settings for the objects created from now on """
+
+        self.settings = settings
+        self.game_object_factory.set_settings(settings)
+
+        if self.swarm_engine is not None:
+            self.swarm_engine.set_settings(settings)
+
+    def use_map_size(self, rings):
+        """ Changes the map size of the settings, if given and different """
+
+        if rings is not None and rings != self.settings.rings:
+            self.set_settings(self.settings.replace(rings=rings))
+
+    def create_colony(self, ants=None, pieces_of_food=None, rings=None):
+        """ Creates a nest with ants near the center and food spread
+        over a map of a number of rings """
+
+        self.use_map_size(rings)
 
-        self.create_map(MAPSIZE)
+        settings = self.settings
+        rng = self.random.map
+
+        if ants is None:
+            ants = settings.ants
+        if pieces_of_food is None:
+            pieces_of_food = settings.pieces_of_food
 
         nest = self.game_object_factory.create_nest()
-        nest_pos = random_coordinate_center_of_tile(max_coord=3)
+        nest_pos = random_coordinate_center_of_tile(max_coord=3, rng=rng)
         nest.components['position'].pos.set_position_xyz(nest_pos[0],
                                                          nest_pos[1],
                                                          nest_pos[2])
         self.add_game_object(nest)
 
-        for i in range(NUMBER_OF_ANTS):
+        for i in range(ants):
             ant = self.game_object_factory.create_ant()
             ant.components['position'].pos.set_position_xyz(nest_pos[0], nest_pos[1], nest_pos[2])
             self.add_game_object(ant)
 
-        for i in range(PIECES_OF_FOOD):
+        for i in range(pieces_of_food):
             food = self.game_object_factory.create_food()
-            food.components['food'].set_start_amount(randint(50, 500))
-            pos = random_coordinate_center_of_tile()
+            food.components['food'].set_start_amount(rng.randint(50, 500))
+            pos = random_coordinate_center_of_tile(
+                max_coord=settings.max_coord, rng=rng)
             food.components['position'].pos.set_position_xyz(pos[0], pos[1], pos[2])
             self.add_game_object(food)
 
@@ -102,6 +186,40 @@ class GameEngine(object):
         if callable(method_to_call):
             self.callbacks_for_new_object.append(method_to_call)
 
+    def callback_for_removed_object(self, method_to_call):
+        """ Methods registered here will be called
+            when an object is removed """
+
+        if callable(method_to_call):
+            self.callbacks_for_removed_object.append(method_to_call)
+
+    def register_system(self, name, update):
+        """ Registers a system, the update method of every system is called
+        once per update in the order the systems were registered """
+
+        if callable(update):
+            self.systems.append((name, update))
+
+    def track_components(self, game_object):
+        """ Adds a new object to the member list of each of its component
+        types, components that are not scheduled are left out """
+
+        for name, component in game_object.components.items():
+            if getattr(component, 'scheduled', True):
+                self.members.setdefault(name, []).append(game_object)
+
+    def untrack_components(self, game_object):
+        """ Removes an object from the member lists it is on """
+
+        for members in self.members.values():
+            if game_object in members:
+                members.remove(game_object)
+
+    def get_members(self, component_name):
+        """ Returns all objects owning a component of the given type """
+
+        return self.members.get(component_name, [])
+
     def add_game_object(self, game_object):
         """ Add a game object and call all the methods registered
             to this event with the game_obj handle """
@@ -112,8 +230,35 @@ class GameEngine(object):
             for method in self.callbacks_for_new_object:
                 method(game_object)
 
-    def create_map(self, rings):
-        """ Creates a map consisting of a number of rings """
+    def remove_game_object(self, game_object):
+        """ Removes a game object from the world and every engine, removed
+        ants and food are reused by the factory for the next ones """
+
+        if str(game_object.object_id) not in self.objects:
+            return
+
+        for method in self.callbacks_for_removed_object:
+            method(game_object)
+
+        del self.objects[str(game_object.object_id)]
+        self.game_object_factory.release(game_object)
+
+    def create_map(self, rings=None):
+        """ Creates a map consisting of a number of rings,
+        by default the map size of the settings """
+
+        self.use_map_size(rings)
+        rings = self.settings.rings
+
+        self.neighbour_table = get_neighbour_table(rings)
+
+        self.pheromone_engine.set_map_size(rings, self.neighbour_table)
+        self.pheromone_engine.field.set_uniform_decay(
+            self.settings.decay_relative, self.settings.decay_abs_minimum)
+        self.collision_engine.set_map_size(rings)
+
+        if self.swarm_engine is not None:
+            self.swarm_engine.set_map_size(rings)
 
         # Create the center tile
         tile_obj = self.game_object_factory.create_tile()
@@ -128,37 +273,69 @@ class GameEngine(object):
 
                     self.add_game_object(tile_obj)
 
+    def get_neighbour_table(self):
+        """ Returns the neighbour table of the map, an int array of
+        shape [tiles, 6] indexed by tile index and direction holding the
+        tile index of the neighbour or OFF_MAP """
+
+        return self.neighbour_table
+
     def get_stats(self):
+        """ Returns the stats of all objects with an ai component, the
+        ants of the swarm engine included """
 
-        all_stats = []
-        for obj in self.objects:
-            try:
-                all_stats += [obj.components['ai'].stats]
-            except KeyError:
-                pass
+        stats = [obj.components['ai'].stats
+                 for obj in self.get_members('ai')]
 
+        if self.swarm_engine is not None:
+            stats += [ant.components['ai'].stats
+                      for ant in self.swarm_engine.ants]
 
+        return stats
 
-    def update(self):
-        """ Updates all the components in the proper order
-        , called as part of the main game loop """
+    def update_ai(self):
+        """ Updates the decisions of all objects with an ai component """
+
+        for obj in self.get_members('ai'):
+            obj.components['ai'].update()
+
+    def update_move(self):
+        """ Moves all objects with a move component """
+
+        for obj in self.get_members('move'):
+            obj.components['move'].update()
 
-        self.pheromone_engine.update_actors()
-        self.collision_engine.update()
+    def count_tick(self):
+        """ Adds the counters of the last update to the profiler """
 
-        for obj_id, obj in self.objects.items():
+        profiler = self.profiler
 
-            # Update all sensors
+        centered_actors = self.pheromone_engine.centered_actors
+        collisions = len(self.collision_engine.crowded)
+
+        # Ants of the swarm are neither actors nor colliders
+        if self.swarm_engine is not None:
+            centered_actors += len(self.swarm_engine.centered_keys)
+            collisions = self.swarm_engine.count_crowded(
+                [cell for cell, bucket in self.collision_engine.buckets.items()
+                 for _ in bucket])
+
+        profiler.count('centered_actors', centered_actors)
+        profiler.count('collisions', collisions)
+        profiler.count('holder_updates',
+                       len(self.pheromone_engine.field.active_keys))
+
+    def update(self):
+        """ Updates all the systems in the proper order
+        , called as part of the main game loop """
 
-            # Update all decisions
-            try:
-               obj.components['ai'].update()
-            except KeyError:
-               pass
+        if not self.profiler.enabled:
+            for name, system in self.systems:
+                system()
+            return
 
-            try:
-               obj.components['move'].update()
-            except KeyError:
-               pass
+        for name, system in self.systems:
+            self.profiler.time(name, system)
 
-        self.pheromone_engine.update_holders()
+        self.count_tick()
+        self.profiler.end_tick()
@@ -33,6 +33,8 @@ class GameObject(object):
         Has a position and a visible attribute.
     """
 
+    __slots__ = ('parent', 'name', 'object_id', 'components')
+
     def __init__(self, parent):
         self.parent = parent
         self.name = "Default"
@@ -40,18 +40,64 @@ from Engine.Components import FoodComponent
 from Engine.Components import CollisionComponent
 from Engine.Components import NestComponent
 
-from Engine.GameSettings import HEX_RADIUS, ANT_DEFAULTS, TILE_DEFAULTS
+from Engine.Settings import Settings
+from Engine.GameSettings import HEX_RADIUS
 
 
 class GameObjectFactory(object):
     """The ObjectFactory which construcs game objects
     """
 
-    def __init__(self, parent):
+    def __init__(self, parent, random_streams=None, settings=None):
         self.parent = parent
         self.hex_radius = HEX_RADIUS
         self.next_object_id = 0
 
+        # Components drawing random numbers use these streams if given
+        self.random_streams = random_streams
+
+        # The settings of the world the objects are created for
+        self.settings = settings if settings is not None else Settings()
+
+        # Released ants and food, reused before new ones are built
+        self.pools = {"ant": [], "food": []}
+
+    def set_settings(self, settings):
+        """ Creates objects for new settings, pooled objects were built for
+        the old ones and are dropped """
+
+        self.settings = settings
+
+        for pool in self.pools.values():
+            del pool[:]
+
+    def release(self, obj):
+        """ Keeps a removed ant or piece of food for reuse, ants of the
+        swarm engine and other objects are not pooled """
+
+        components = obj.components
+
+        if 'ai' in components and 'pheromone_actor' in components:
+            self.pools["ant"].append(obj)
+        elif 'food' in components:
+            self.pools["food"].append(obj)
+
+    def reuse(self, kind):
+        """ Returns a pooled object of a kind with its components set back
+        to their initial state, None if the pool is empty """
+
+        pool = self.pools[kind]
+
+        if not pool:
+            return None
+
+        obj = pool.pop()
+
+        for component in obj.components.values():
+            component.recycle()
+
+        return obj
+
     def create_game_object(self):
         """ Creates an emty object with an unique object_id"""
 
@@ -63,27 +109,41 @@ class GameObjectFactory(object):
         return obj
 
     def create_ant(self):
-        """ Returns a newly created ant with an unique object_id"""
+        """ Returns an ant with an unique object_id, a released ant
+        is reused if there is one """
 
-        obj = self.create_game_object()
-        obj.components['render'] = RenderComponent(obj)
-        obj.components['render'].color = "#880000"
-        obj.components['render'].fill = "#001100"
+        ant_defaults = self.settings.ant_defaults
 
-        size = 0.4 * self.hex_radius
-        obj.components['render'].polygon = create_triangle(size)
+        obj = self.reuse("ant")
 
-        obj.components['position'] = PositionComponent(obj)
-        obj.components['position'].orientation = 3
+        if obj is None:
+            obj = self.create_game_object()
+            obj.components['render'] = RenderComponent(obj)
+            obj.components['render'].color = "#880000"
 
-        obj.add_component('move', MoveComponent(parent=obj,
-                                                speed=ANT_DEFAULTS['SPEED']))
+            size = 0.4 * self.hex_radius
+            obj.components['render'].polygon = create_triangle(size)
 
-        obj.components['collision'] = CollisionComponent(obj)
+            obj.components['position'] = PositionComponent(obj)
+
+            obj.add_component('move', MoveComponent(parent=obj))
+
+            obj.components['collision'] = CollisionComponent(obj)
+
+            obj.add_component('ai', AiComponent(obj, ant_defaults))
+
+            obj.components['pheromone_actor'] = PheromoneActorComponent(obj)
 
-        obj.add_component('ai', AiComponent(obj))
+        obj.components['render'].fill = "#001100"
+        obj.components['position'].orientation = 3
+
+        obj.components['move'].speed = ant_defaults['SPEED']
+        obj.components['move'].max_coord = self.settings.max_coord
+        obj.components['move'].epsilon = self.settings.epsilon
 
-        obj.components['pheromone_actor'] = PheromoneActorComponent(obj)
+        if self.random_streams is not None:
+            obj.components['ai'].rng = self.random_streams.ai
+            obj.components['pheromone_actor'].rng = self.random_streams.ai
 
         return obj
 
@@ -95,33 +155,44 @@ class GameObjectFactory(object):
         obj.components['render'].color = "#005500"
         obj.components['render'].fill = "#220000"
         obj.components['render'].polygon = create_hexagon(self.hex_radius)
+        obj.components['render'].static = True
 
         obj.components['position'] = PositionComponent(obj)
 
         obj.components['pheromone_holder'] = PheromoneHolderComponent(obj)
-        obj.components['pheromone_holder'].decay = TILE_DEFAULTS["DECAY"]
+        obj.components['pheromone_holder'].decay = \
+            self.settings.tile_defaults["DECAY"]
 
         return obj
 
     def create_food(self):
-        """ Returns a piece of food """
+        """ Returns a piece of food, released food is reused if there is """
 
-        obj = self.create_game_object()
-        obj.components['render'] = RenderComponent(obj)
-        obj.components['render'].color = "#ff6600"
-        obj.components['render'].fill = "#220000"
+        obj = self.reuse("food")
 
-        size = 0.4 * self.hex_radius
-        obj.components['render'].polygon = create_octagon(size)
+        if obj is None:
+            obj = self.create_game_object()
+            obj.components['render'] = RenderComponent(obj)
+            obj.components['render'].color = "#ff6600"
 
-        obj.components['position'] = PositionComponent(obj)
+            size = 0.4 * self.hex_radius
+            obj.components['render'].polygon = create_octagon(size)
 
-        obj.add_component('food', FoodComponent(obj))
+            obj.components['position'] = PositionComponent(obj)
 
-        obj.components['collision'] = CollisionComponent(obj)
+            obj.add_component('food', FoodComponent(obj))
+
+            obj.components['collision'] = CollisionComponent(obj)
+
+            obj.components['pheromone_actor'] = PheromoneActorComponent(obj)
+
+        obj.components['render'].fill = "#220000"
+        obj.components['food'].max_coord = self.settings.max_coord
+
+        if self.random_streams is not None:
+            obj.components['food'].rng = self.random_streams.food
 
-        obj.components['pheromone_actor'] = PheromoneActorComponent(obj)
-        obj.components['pheromone_actor'].deposit["food"] = TILE_DEFAULTS['DECAY']['food']['abs_minimum'] * 10 
+        obj.components['pheromone_actor'].deposit["food"] = self.settings.tile_defaults['DECAY']['food']['abs_minimum'] * 10 
 
         return obj
 
@@ -32,6 +32,9 @@ HEX_RADIUS = 12
 # The precision used when comparing ints and floats
 EPSILON = 1.0e-3
 
+# Positions are stored as integer steps of 1 / POSITION_STEPS tile
+POSITION_STEPS = 1000
+
 # Ants
 NUMBER_OF_ANTS = 150
 PIECES_OF_FOOD = 5
@@ -42,6 +45,20 @@ MAPSIZE = 15
 # The number of turns for the game 0 = infinite
 TURNS=1000
 
+# Turns simulated per drawn frame, with a target frame rate (frames per
+# second, 0 = none) the turns per frame are adapted to the time left
+TICKS_PER_FRAME = 1
+TARGET_FPS = 0
+
+# Number of ticks kept for the rolling report of the profiler
+PROFILE_WINDOW = 1000
+
+# Seed of the random streams of a run, None for a different run every time
+SEED = None
+
+# Advance all ants at once with the vectorized swarm engine
+SWARM_ENGINE = False
+
 ANT_DEFAULTS = {'SPEED': (0.5),
                 'DEPOSIT': {'home': 550,
                             'food': 550,
@@ -23,7 +23,11 @@
 
 Description
 -----------
-Base class for a Graphics Engine """
+Base class for a Graphics Engine.
+Only canvas items of objects that moved or changed their fill or
+visibility since the last frame are updated. Moving objects are kept in
+batches per polygon, the coordinates of a whole batch are projected to
+the screen in a few array operations """
 try:
     from Tkinter import *
 except ImportError:
@@ -32,27 +36,27 @@ except ImportError:
 from math import sqrt
 from copy import deepcopy
 
+from Engine.LibProjection import project_xyz, place_polygons, PolygonBatch
+from Engine.SharedInstance import SharedInstance
 from Engine.GameSettings import HEX_RADIUS, WINDOW_SIZE
 
 
-class GraphicsEngine(Frame):
+class GraphicsEngine(Frame, SharedInstance):
     """The engine managing all drawing to screen
     """
 
-    def __new__(cls, *args, **kwargs):
-        """ There shoud only be one GraphicsEngine, so return
-        the existing instance if a new one is requested """
+    def __init__(self, master=None, canvas=None):
+        """ Draws in a new window of master, or on a given canvas
+        without creating any window, e.g. the StubCanvas of Engine.bench """
 
-        self = "__self__"
-        if not hasattr(cls, self):
-            instance = object.__new__(cls)
-            setattr(cls, self, instance)
+        if canvas is None:
+            Frame.__init__(self, master)
+        else:
+            self.master = canvas
 
-        return getattr(cls, self)
-
-    def __init__(self, master=None):
-        Frame.__init__(self, master)
         self.objects = []
+        self.batches = {}
+        self.callbacks_before_draw = []
 
         self.win = None
         self.turn_text = None
@@ -69,11 +73,41 @@ class GraphicsEngine(Frame):
 
         self.set_window_size(WINDOW_SIZE[0], WINDOW_SIZE[1])
         self.set_hex_radius(HEX_RADIUS)
-        self.setup_window()
+
+        if canvas is None:
+            self.setup_window()
+        else:
+            self.win = canvas
 
         assert(self.size[0] == WINDOW_SIZE[0])
         assert(self.size[1] == WINDOW_SIZE[1])
 
+    def callback_before_draw(self, method_to_call):
+        """ Methods registered here will be called before every frame is
+        drawn, to derive colors from the state of the simulation """
+
+        if callable(method_to_call):
+            self.callbacks_before_draw.append(method_to_call)
+
+    def clear_objects(self):
+        """ Forgets all objects to render """
+
+        self.objects = []
+        self.batches = {}
+
+    def remove_component(self, gameObject):
+        """ Deletes the canvas item of a removed object """
+
+        for entry in self.objects:
+            if entry[0] is gameObject.components.get('render'):
+                self.win.delete(entry[0].renderID)
+                self.objects.remove(entry)
+
+                for batch in self.batches.values():
+                    if batch.remove(entry[0]):
+                        break
+                return
+
     def setup_window(self):
         """ Creates the specific Tkinter components"""
 
@@ -124,8 +158,10 @@ class GraphicsEngine(Frame):
             rend = gameObject.components['render']
             pos = gameObject.components['position'].pos
 
+            xyz = (pos.x, pos.y, pos.z)
+
             # Find out where to draw
-            [s_x, s_y] = self.game_to_screen_coordinates(pos.x, pos.y, pos.z)
+            [s_x, s_y] = self.game_to_screen_coordinates(*xyz)
 
             # Find out what to draw there
             coords_placed = self.place_object(rend.polygon,
@@ -136,8 +172,17 @@ class GraphicsEngine(Frame):
                                                     outline=rend.color,
                                                     width=rend.width,
                                                     fill=rend.fill,
+                                                    state=self.state(rend),
                                                     tag=gameObject.name)
 
+            rend.dirty.clear()
+
+            if not rend.static:
+                key = tuple(rend.polygon)
+                if key not in self.batches:
+                    self.batches[key] = PolygonBatch(rend.polygon)
+                self.batches[key].add(rend, pos, xyz)
+
             self.objects.append([rend, pos])
 
         except AttributeError:
@@ -164,11 +209,18 @@ class GraphicsEngine(Frame):
     def place_object_xyz(self, coordinates, x, y, z):
         """ Updates a list of coordinates assuming [x0,y0,x1,y1,...xN,yN]"""
 
-        screen_x = self.size[0]/2 + self.screen_x_offset * y
-        screen_y = self.size[1]/2 - self.screen_y_offset * (2 * x + y)
-        moved_coordinates = [coord + (screen_y if i%2 else screen_x) for i, coord in enumerate(coordinates)]
+        [screen_x, screen_y] = self.game_to_screen_coordinates(x, y, z)
 
-        return moved_coordinates
+        return self.place_object(coordinates, screen_x, screen_y)
+
+    def place_batch(self, batch, xyz):
+        """ Returns the placed coordinates of a batch polygon for an array
+        of game coordinates, one row of [x0,y0,x1,y1,...xN,yN] per object """
+
+        screen = project_xyz(xyz, self.center_screen_coordinate,
+                             self.screen_x_offset, self.screen_y_offset)
+
+        return place_polygons(screen, batch.offsets)
 
     def game_to_screen_coordinates(self, x, y, z):
         """ Translates the game 3-axis coordinates to screen coordinates
@@ -179,19 +231,52 @@ class GraphicsEngine(Frame):
 
         return [screen_x, screen_y]
 
+    @staticmethod
+    def state(rend_comp):
+        """ Returns the canvas state of a render component """
+        return DISABLED if rend_comp.visible else HIDDEN
+
     def updateScreen(self):
+        """ Draws all changes since the last frame, returns the number of
+        canvas items updated """
+
+        for method in self.callbacks_before_draw:
+            method()
+
+        updated = 0
+
+        for batch in self.batches.values():
+            xyz = batch.gather()
+            moved = batch.moved(xyz)
+
+            if len(moved) == 0:
+                continue
+
+            # Find out where to draw all moved objects at once
+            coordinates_placed = self.place_batch(batch, xyz[moved])
+
+            # Move the objects
+            for index, coordinates in zip(moved.tolist(),
+                                          coordinates_placed.tolist()):
+                self.win.coords(batch.renders[index].renderID, *coordinates)
+
+            updated += len(moved)
 
         for [rend_comp, pos] in self.objects:
 
-            # Find out where to draw
-            coordinates_placed = self.place_object_xyz(rend_comp.polygon,pos.x, pos.y, pos.z)
+            if rend_comp.dirty:
+                options = {}
 
-            # Move the object
-            self.win.coords(rend_comp.renderID, *coordinates_placed)
+                if 'fill' in rend_comp.dirty:
+                    options['fill'] = rend_comp.fill
+                if 'visible' in rend_comp.dirty:
+                    options['state'] = self.state(rend_comp)
 
-            self.win.itemconfig(rend_comp.renderID,
-                                fill=rend_comp.fill,
-                                state=(DISABLED if rend_comp.visible else HIDDEN))
+                self.win.itemconfig(rend_comp.renderID, **options)
+                rend_comp.dirty.clear()
+                updated += 1
 
         self.master.update_idletasks()  # redraw
         self.master.update() # process events
+
+        return updated
@@ -25,7 +25,9 @@ Description
 
 Position based on three-axis coordinate system.
 Each coordinate sums up to zero.
-There are two systems, XYZ and ring, side and tile
+There are two systems, XYZ and ring, side and tile.
+XYZ is stored as integer steps of 1 / POSITION_STEPS tile, so the
+center of a tile is an exact multiple and moves never drift
 
  _______      +X      _______/ x1 y1 z-2 \________/ x0 y3 z-3  \________
         \       \    /       \ r2 s1 t1  /        \ r3 s2 t0   /
@@ -50,7 +52,8 @@ r2 s5 t1  /        \ r0 s0 t0  /       \            /        \
 """
 
 from Engine.LibHexagonalPosition import *
-from Engine.GameSettings import MAPSIZE, EPSILON
+from Engine.LibCommon import to_position_steps, from_position_steps
+from Engine.GameSettings import MAPSIZE, POSITION_STEPS
 
 
 class HexagonalPosition(object):
@@ -59,41 +62,127 @@ class HexagonalPosition(object):
         for in depth description
     """
 
+    __slots__ = ('parent', 'steps', 'xyz', '_rst', '_rst_xyz')
+
     def __init__(self, parent):
         """ Default initialization function """
         self.parent = parent
-        self.x = 0 # pylint: disable=C0103
-        self.y = 0 # pylint: disable=C0103
-        self.z = 0 # pylint: disable=C0103
 
+        # The position in steps, xyz holds the same position in tiles
+        self.steps = (0, 0, 0)
         self.xyz = (0, 0, 0)
 
-        self.ring = 0
-        self.side = 0
-        self.tile = 0
+        # Ring side and tile are derived from xyz when first read
+        self._rst = (0, 0, 0)
+        self._rst_xyz = self.xyz
+
+    @property
+    def x(self):  # pylint: disable=C0103
+        """ The x coordinate """
+        return self.xyz[0]
+
+    @x.setter
+    def x(self, x):  # pylint: disable=C0103
+        self.set_steps(to_position_steps(x), self.steps[1], self.steps[2])
+
+    @property
+    def y(self):  # pylint: disable=C0103
+        """ The y coordinate """
+        return self.xyz[1]
+
+    @y.setter
+    def y(self, y):  # pylint: disable=C0103
+        self.set_steps(self.steps[0], to_position_steps(y), self.steps[2])
+
+    @property
+    def z(self):  # pylint: disable=C0103
+        """ The z coordinate """
+        return self.xyz[2]
+
+    @z.setter
+    def z(self, z):  # pylint: disable=C0103
+        self.set_steps(self.steps[0], self.steps[1], to_position_steps(z))
+
+    @property
+    def ring(self):
+        """ The ring of the position """
+        return self.ring_side_tile()[0]
+
+    @property
+    def side(self):
+        """ The side of the position """
+        return self.ring_side_tile()[1]
+
+    @property
+    def tile(self):
+        """ The tile of the position """
+        return self.ring_side_tile()[2]
+
+    def ring_side_tile(self):
+        """ Returns the ring, side and tile of the current position """
+
+        if self._rst_xyz is not self.xyz:
+            self._rst = calc_ring_side_tile_from_xyz(self.xyz)
+            self._rst_xyz = self.xyz
+
+        return self._rst
 
     ####################################################################
 
-    def set_position_xyz(self, x, y, z, epsilon=EPSILON):  # pylint: disable=C0103
+    def set_steps(self, x, y, z):  # pylint: disable=C0103
+        """ Sets the position in steps without checking it """
+
+        self.steps = (x, y, z)
+        self.xyz = (from_position_steps(x),
+                    from_position_steps(y),
+                    from_position_steps(z))
+
+    def set_position_xyz(self, x, y, z, epsilon=None):  # pylint: disable=C0103
         """Sets the position in X Y Z coordinates,
-        Updates the ring, side and tile variables
-        Returns a boolean if it was a valid position
+        Returns a boolean if it was a valid position.
+        Coordinates are rounded to steps and compared exactly,
+        epsilon is not used and kept for compatibility
         """
 
-        x, y, z = float(x), float(y), float(z)
+        steps = (to_position_steps(x),
+                 to_position_steps(y),
+                 to_position_steps(z))
 
         # See file header for explanation of coordinate system
         # The sum must be zero to be a valid coordinate
-        if abs(x + y) - abs(z) <= epsilon:
-
-            self.x, self.y, self.z = x, y, z  # pylint: disable=C0103
-            self.xyz = (x, y, z)
-            (self.ring, self.side, self.tile) = \
-                calc_ring_side_tile_from_xyz(self.xyz)
+        if sum(steps) == 0:
+            self.set_steps(*steps)
             return True
         else:
             return False
 
+    def move(self, direction, distance, max_coord=MAPSIZE-1):
+        """Moves a distance in tiles towards a neighbour direction,
+        Returns False without moving if the new position is off the map
+        """
+
+        step = to_position_steps(distance)
+        max_steps = to_position_steps(max_coord)
+        d_x, d_y, d_z = NEIGHBOUR_DELTAS[direction]
+
+        x = self.steps[0] + d_x * step  # pylint: disable=C0103
+        y = self.steps[1] + d_y * step  # pylint: disable=C0103
+        z = self.steps[2] + d_z * step  # pylint: disable=C0103
+
+        if abs(x) > max_steps or abs(y) > max_steps or abs(z) > max_steps:
+            return False
+
+        self.set_steps(x, y, z)
+        return True
+
+    def center_of_tile(self):
+        """ Returns a boolean which indicates if the position
+        is in the center of a tile """
+
+        return (self.steps[0] % POSITION_STEPS == 0 and
+                self.steps[1] % POSITION_STEPS == 0 and
+                self.steps[2] % POSITION_STEPS == 0)
+
     def set_position_rst(self, ring, side, tile):
         """Sets the position in Ring Side Tile coordinates,
         Updates the x, y and z variables
@@ -112,6 +201,6 @@ class HexagonalPosition(object):
         if side < 0 or side > 5:
             return False
 
-        [self.x, self.y, self.z] = calc_xyz_from_rst(ring, side, tile)
-        self.xyz = (self.x, self.y, self.z)
+        xyz = calc_xyz_from_rst(ring, side, tile)
+        self.set_steps(*[to_position_steps(coord) for coord in xyz])
         return True
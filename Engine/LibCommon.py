@@ -25,13 +25,14 @@ Description
 -----------
 Module that contains common functionality """
 
-from Engine.GameSettings import MAPSIZE, EPSILON
-from random import randint
+import random
 
+from Engine.GameSettings import MAPSIZE, EPSILON, POSITION_STEPS
 
-def highest_in_list(seq):
+
+def highest_in_list(seq, rng=random):
     """ Calculates the index of the last maximum
-        value in an iterable item"""
+        value in an iterable item, ties are broken with rng"""
 
     max_value = seq[0]
     max_index = []
@@ -49,7 +50,7 @@ def highest_in_list(seq):
     nr_of_solutions = len(max_index)
 
     if nr_of_solutions > 1:
-        max_index[0] = max_index[randint(0, nr_of_solutions-1)]
+        max_index[0] = max_index[rng.randint(0, nr_of_solutions-1)]
 
     return max_index[0]
 
@@ -61,23 +62,37 @@ def is_float_int(number):
     #return ( self.round_float( number, 3 ) == float( int( number)))
 
 
+def to_position_steps(coord):
+    """ Returns a coordinate as integer number of position steps """
+    return int(round(coord * POSITION_STEPS))
+
+
+def from_position_steps(steps):
+    """ Returns a number of position steps as coordinate """
+    return float(steps) / POSITION_STEPS
+
+
 def add_delta_to_pos_if_valid(xyz, deltas, max_coord=MAPSIZE-1.0):
-    """ Update position with deltas """
+    """ Update position with deltas, computed in position steps """
+
+    delta_steps = [to_position_steps(delta) for delta in deltas]
 
-    if sum(deltas) >= EPSILON:
+    if sum(delta_steps) != 0:
         print("Sum of deltas not equal to zero x:%f y:%f z:%f" % (deltas[0],
                                                                   deltas[1],
                                                                   deltas[2]))
         return xyz
 
+    max_steps = to_position_steps(max_coord)
+
     new_xyz = []
 
-    for index, delta in enumerate(deltas):
+    for index, delta in enumerate(delta_steps):
 
-        new_xyz.append(xyz[index] + delta)
+        new_steps = to_position_steps(xyz[index]) + delta
+        new_xyz.append(from_position_steps(new_steps))
 
-        if abs(new_xyz[index]) >= max_coord + EPSILON:
-            new_xyz = xyz
+        if abs(new_steps) > max_steps:
             raise ValueError("""Trying to walk out of bounds %d :
                                            trying: %f
                                            max: %f""" % (index,
@@ -49,12 +49,25 @@ r2 s5 t1  /        \ r0 s0 t0  /       \            /        \
         \            /       \ r2  s3 t1 /        \            /
 """
 
-from random import random, randint
+import random
+import numpy
+
 from Engine.GameSettings import MAPSIZE
 
 
 TOPLEFT, TOP, TOPRIGHT, BOTTOMRIGHT, BOTTOM, BOTTOMLEFT = range(6)
 
+# Step in x y z to the neighbour in every direction
+NEIGHBOUR_DELTAS = ((1, -1, 0),   # Top-left
+                    (1, 0, -1),   # Top
+                    (0, 1, -1),   # Top-right
+                    (-1, 1, 0),   # Bottom-right
+                    (-1, 0, 1),   # Bottom
+                    (0, -1, 1))   # Bottom-left
+
+# Tile index of a neighbour that is not on the map
+OFF_MAP = -1
+
 
 def calc_xyz_from_rst(ring, side, tile):
     """ Calculates the xyz coordinates from
@@ -92,24 +105,116 @@ def calc_xyz_from_rst(ring, side, tile):
     return (x_pos, y_pos, z_pos)
 
 
+def calc_tile_count(rings=MAPSIZE):
+    """ Returns the number of tiles of a map consisting of a number of
+    rings, the center tile is ring 0 """
+
+    return 1 + 3 * rings * (rings - 1)
+
+
+def calc_tile_index_from_rst(ring, side, tile):
+    """ Calculates the dense tile index from the ring side and tile
+    coordinates, tiles are numbered in the order the map is created """
+
+    if ring == 0:
+        return 0
+
+    return 1 + 3 * ring * (ring - 1) + side * ring + tile
+
+
+_TILE_INDEX_TABLES = {}
+
+
+def get_tile_index_tables(rings=MAPSIZE):
+    """ Returns the tables mapping cube coordinates to tile indices and
+    back for a map of a number of rings. The first table is indexed with
+    [x + offset, y + offset] and holds OFF_MAP outside the map, the second holds
+    the xyz coordinate of every tile index. Tables are built once per map
+    size and shared, they must not be modified """
+
+    try:
+        return _TILE_INDEX_TABLES[rings]
+    except KeyError:
+        pass
+
+    offset = max(rings - 1, 0)
+    width = 2 * offset + 1
+
+    index_of_xy = numpy.full((width, width), OFF_MAP, dtype=numpy.int64)
+    xyz_of_index = numpy.zeros((calc_tile_count(rings), 3), dtype=numpy.int64)
+
+    # The center tile is always part of the map
+    index_of_xy[offset, offset] = 0
+
+    for ring in range(1, rings):
+        for side in range(6):
+            for tile in range(ring):
+                xyz = calc_xyz_from_rst(ring, side, tile)
+                index = calc_tile_index_from_rst(ring, side, tile)
+
+                index_of_xy[xyz[0] + offset, xyz[1] + offset] = index
+                xyz_of_index[index] = xyz
+
+    _TILE_INDEX_TABLES[rings] = (index_of_xy, xyz_of_index)
+
+    return _TILE_INDEX_TABLES[rings]
+
+
+def calc_tile_index_from_xyz(xyz, rings=MAPSIZE):
+    """ Returns the dense tile index of the tile nearest to xyz,
+    or OFF_MAP if that tile is not on the map """
+
+    index_of_xy = get_tile_index_tables(rings)[0]
+    offset = max(rings - 1, 0)
+
+    pos_x = int(round(xyz[0])) + offset
+    pos_y = int(round(xyz[1])) + offset
+
+    if 0 <= pos_x <= 2 * offset and 0 <= pos_y <= 2 * offset:
+        return index_of_xy.item(pos_x, pos_y)
+
+    return OFF_MAP
+
+
+_NEIGHBOUR_TABLES = {}
+
+
+def get_neighbour_table(rings=MAPSIZE):
+    """ Returns an int array of shape [tiles, 6] with the tile index of the
+    neighbour of every tile in every direction, OFF_MAP for neighbours
+    outside of the map. Tables are built once per map size and shared,
+    they must not be modified """
+
+    try:
+        return _NEIGHBOUR_TABLES[rings]
+    except KeyError:
+        pass
+
+    index_of_xy, xyz_of_index = get_tile_index_tables(rings)
+    width = index_of_xy.shape[0]
+    offset = max(rings - 1, 0)
+
+    deltas = numpy.array(NEIGHBOUR_DELTAS, dtype=numpy.int64)
+
+    # Coordinates of all neighbours, shape [tiles, 6]
+    pos_x = xyz_of_index[:, 0, None] + deltas[None, :, 0] + offset
+    pos_y = xyz_of_index[:, 1, None] + deltas[None, :, 1] + offset
+
+    on_table = (pos_x >= 0) & (pos_x < width) & (pos_y >= 0) & (pos_y < width)
+
+    table = numpy.full(pos_x.shape, OFF_MAP, dtype=numpy.int64)
+    table[on_table] = index_of_xy[pos_x[on_table], pos_y[on_table]]
+
+    _NEIGHBOUR_TABLES[rings] = table
+
+    return table
+
+
 def get_neighbour_xyz(xyz, direction):
     """Returns the neighbour as mentioned in the direction"""
-    pos_x, pos_y, pos_z = xyz
-
-    if direction == TOPLEFT:
-        neighbour_xyz = (pos_x+1, pos_y-1, pos_z)
-    elif direction == TOP:
-        neighbour_xyz = (pos_x+1, pos_y, pos_z-1)
-    elif direction == TOPRIGHT:
-        neighbour_xyz = (pos_x, pos_y+1, pos_z-1)
-    elif direction == BOTTOMRIGHT:
-        neighbour_xyz = (pos_x-1, pos_y+1, pos_z)
-    elif direction == BOTTOM:
-        neighbour_xyz = (pos_x-1, pos_y, pos_z+1)
-    elif direction == BOTTOMLEFT:
-        neighbour_xyz = (pos_x, pos_y-1, pos_z+1)
+    d_x, d_y, d_z = NEIGHBOUR_DELTAS[direction]
 
-    return neighbour_xyz
+    return (xyz[0] + d_x, xyz[1] + d_y, xyz[2] + d_z)
 
 
 def get_distance_between(a_xyz, b_xyz):
@@ -138,119 +243,78 @@ def calc_ring_from_xyz(xyz):
     return max((abs(xyz[0]), abs(xyz[1]), abs(xyz[2])))
 
 
-    # TODO( Ben ) : Write a full covering test case set
-    # TODO( Ben ) : Instead of conditional branches use math
-def calc_side_from_xyz(xyz, ring):
+def calc_side_from_xyz(xyz, ring=None):
     """" Calculates on which side as seen from the center
-    @(0,0,0) the position is located
-    The calculation is now done by a lot of if-branches but should
-    be converted to math, to reduce complexity"""
-
-    temp_pos = xyz
-    unknown, pos_x, pos_y, pos_z = range(-1, 3)
-
-    side = TOPLEFT
-
-    # Catch the center tile case
-    if xyz[pos_x] == xyz[pos_y] == xyz[pos_z] == 0:
-        return side
-
-    #Calculate the lowest value to see which of two sides it is
-    index_of_lowest = 0
-    index_of_highest = 0
-    index_of_equal = unknown
-    index_of_abs_equal = unknown
-    index_of_abs_highest = 0
-
-    for i in range(3):
-
-        #Check if current value is the lowest
-        if temp_pos[i] < temp_pos[index_of_lowest]:
-            index_of_lowest = i
-
-        #Check if current value is the highest
-        if temp_pos[i] > temp_pos[index_of_highest]:
-            index_of_highest = i
-
-        #Check if current value is equal
-        # There can only be two equal values
-        # Because the sum has to be 0
-        # Equal values are always adjacent when seen as continous
-        # ring memory so check if next neighbour
-        # is equal and store the first index
-        if temp_pos[i] == temp_pos[(i+1) % 3]:
-            index_of_equal = i
-
-        # Check if current value is absolute equal
-        if abs(temp_pos[i]) == abs(temp_pos[(i+1) % 3]):
-            index_of_abs_equal = i
-
-        # Check the highest value
-        if abs(temp_pos[i]) == ring:
-            index_of_abs_highest = i
-
-    #If there are no equal coordinates
-    if index_of_equal == index_of_abs_equal == unknown:
-        if index_of_abs_highest == pos_x:
-            if index_of_highest == pos_x:
-                side = TOPLEFT
-            else:
-                side = BOTTOMRIGHT
-        else:
-            if index_of_abs_highest == pos_y:
-                if index_of_highest == pos_y:
-                    side = TOPRIGHT
-                else:
-                    side = BOTTOMLEFT
-            else:
-                if index_of_highest == pos_z:
-                    side = BOTTOM
-                else:
-                    side = TOP
-    # If there are equal coordinates
+    @(0,0,0) the position is located.
+    The side is the one of the coordinate with the highest absolute value,
+    +x is side 0, -z side 1, +y side 2 and so on. On the corner of two
+    sides both coordinates are highest, the side starting at the corner
+    is taken. The ring argument is not needed and kept for compatibility """
+
+    abs_x, abs_y, abs_z = abs(xyz[0]), abs(xyz[1]), abs(xyz[2])
+
+    if abs_x >= abs_y and abs_x > abs_z:
+        axis = 0
+    elif abs_y > abs_x and abs_y >= abs_z:
+        axis = 1
+    elif abs_z > abs_y:
+        axis = 2
     else:
+        # Only the center has no highest coordinate
+        return TOPLEFT
 
-        side = 2 * index_of_abs_equal + 1
-
-        if index_of_equal == unknown:
-            side -= 1
-
-        #Flip side if coordinates are negative
-        if temp_pos[index_of_abs_equal] < 0:
-            side = (side + 3) % 6
+    if xyz[axis] > 0:
+        return 2 * axis
 
-    return side
+    return (2 * axis + 3) % 6
 
 
 def calc_tile_from_xyz(xyz, ring, side):
     """ Calculates the tile offset as seen from the tile on the same
     ring and same sector"""
 
-    pos_x, pos_y, pos_z = 0, 0, 0
+    corner_x, corner_y, corner_z = calc_xyz_from_rst(1, side, 0)
+
+    return max(abs(xyz[0] - ring * corner_x),
+               abs(xyz[1] - ring * corner_y),
+               abs(xyz[2] - ring * corner_z))
+
+
+_RING_SIDE_TILE_OF_XYZ = {}
 
-    if side == TOPLEFT:
-        pos_x, pos_y = ring, -ring
-    elif side == TOP:
-        pos_x, pos_z = ring, -ring
-    elif side == TOPRIGHT:
-        pos_y, pos_z = ring, -ring
-    elif side == BOTTOMRIGHT:
-        pos_x, pos_y = -ring, ring
-    elif side == BOTTOM:
-        pos_x, pos_z = -ring, ring
-    elif side == BOTTOMLEFT:
-        pos_y, pos_z = -ring, ring
 
-    tile = get_distance_between(xyz, (pos_x, pos_y, pos_z))
+def get_ring_side_tile_table(rings=MAPSIZE):
+    """ Returns a dict holding the ring, side and tile of every tile
+    center on a map of a number of rings, indexed by the xyz tuple.
+    Tile centers of all requested map sizes share the same dict """
 
-    return tile
+    if (rings - 1, 0, 1 - rings) not in _RING_SIDE_TILE_OF_XYZ:
+
+        _RING_SIDE_TILE_OF_XYZ[(0, 0, 0)] = (0, 0, 0)
+
+        for ring in range(1, rings):
+            for side in range(6):
+                for tile in range(ring):
+                    xyz = calc_xyz_from_rst(ring, side, tile)
+                    _RING_SIDE_TILE_OF_XYZ[xyz] = (ring, side, tile)
+
+    return _RING_SIDE_TILE_OF_XYZ
 
 
 def calc_ring_side_tile_from_xyz(xyz):
     """Calculates the ring, side and tile from XYZ coordinate.
-    The position is on a hexagonal grid
+    The position is on a hexagonal grid, tile centers are looked up
     """
 
+    table = _RING_SIDE_TILE_OF_XYZ or get_ring_side_tile_table()
+
+    xyz = tuple(xyz)
+
+    try:
+        return table[xyz]
+    except KeyError:
+        pass
+
     ring = calc_ring_from_xyz(xyz)
     side = calc_side_from_xyz(xyz, ring)
     tile = calc_tile_from_xyz(xyz, ring, side)
@@ -258,27 +322,27 @@ def calc_ring_side_tile_from_xyz(xyz):
     return (ring, side, tile)
 
 
-def random_coordinate(max_coord=MAPSIZE):
+def random_coordinate(max_coord=MAPSIZE, rng=random):
     """ Returns random coordinate within max_coord """
-    a = (2.0 * random() - 0.5) * max_coord
-    b = (2.0 * random() - 0.5) * max_coord
+    a = (2.0 * rng.random() - 0.5) * max_coord
+    b = (2.0 * rng.random() - 0.5) * max_coord
     c = -(a + b)
 
     return [a, b, c]
 
 
-def random_coordinate_center_of_tile(max_coord=MAPSIZE-1):
+def random_coordinate_center_of_tile(max_coord=MAPSIZE-1, rng=random):
     """ Returns random coordinate within max_coord that
      is on center of a tile """
 
     xyz = [0, 0, 0]
-    index = randint(0, 2)
+    index = rng.randint(0, 2)
 
-    xyz[index] = randint(-max_coord, max_coord)
+    xyz[index] = rng.randint(-max_coord, max_coord)
 
     max_coord = max_coord - abs(xyz[index])
 
-    xyz[(index + 1) % 3] = randint(-max_coord, max_coord)
+    xyz[(index + 1) % 3] = rng.randint(-max_coord, max_coord)
     xyz[(index + 2) % 3] = -xyz[index] - xyz[(index + 1) % 3]
 
     return xyz
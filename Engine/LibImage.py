@@ -0,0 +1,133 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Image library
+
+########################################################################
+
+Description
+-----------
+Module that writes RGB images, held as numpy arrays of shape
+[height, width, 3], as PNG files or as an uncompressed frame stream.
+Only zlib is needed. A frame stream can be played or encoded with
+
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s WIDTHxHEIGHT -i frames.rgb out.mp4
+"""
+
+import struct
+import zlib
+
+import numpy
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def png_chunk(chunk_type, data):
+    """ Returns a PNG chunk: length, type, data and checksum """
+
+    checksum = zlib.crc32(chunk_type + data) & 0xffffffff
+
+    return struct.pack(">I", len(data)) + chunk_type + data + \
+        struct.pack(">I", checksum)
+
+
+def encode_png(rgb, level=6):
+    """ Returns the bytes of an 8 bit RGB PNG image of an array """
+
+    rgb = numpy.ascontiguousarray(rgb, dtype=numpy.uint8)
+    height, width = rgb.shape[:2]
+
+    # Every scanline starts with filter type 0, no filtering
+    scanlines = numpy.zeros((height, 1 + 3 * width), dtype=numpy.uint8)
+    scanlines[:, 1:] = rgb.reshape(height, 3 * width)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+
+    return PNG_SIGNATURE + \
+        png_chunk(b"IHDR", header) + \
+        png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), level)) + \
+        png_chunk(b"IEND", b"")
+
+
+def write_png(path, rgb, level=6):
+    """ Writes an array as PNG image to a file """
+
+    with open(path, "wb") as png_file:
+        png_file.write(encode_png(rgb, level))
+
+
+class FrameStream(object):
+    """Appends RGB frames of the same size to a file, without any
+    header or compression
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.frames = 0
+        self.shape = None
+        self.stream = open(path, "wb")
+
+    def write(self, rgb):
+        """ Appends a frame """
+
+        rgb = numpy.ascontiguousarray(rgb, dtype=numpy.uint8)
+
+        if self.shape is None:
+            self.shape = rgb.shape
+        elif rgb.shape != self.shape:
+            raise ValueError("Frame of shape %s does not match %s" %
+                             (rgb.shape, self.shape))
+
+        self.stream.write(rgb.tobytes())
+        self.frames += 1
+
+    def close(self):
+        """ Closes the file """
+        self.stream.close()
+
+
+class FrameWriter(object):
+    """Writes frames to a path ending in .rgb as one FrameStream, to any
+    other path as PNG images named path % turn
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.stream = None
+
+        if path.endswith(".rgb"):
+            self.stream = FrameStream(path)
+        elif "%" not in path:
+            raise ValueError("PNG frame path %r needs a %%d for the turn" %
+                             (path,))
+
+    def write(self, rgb, turn):
+        """ Writes the frame of a turn """
+
+        if self.stream is not None:
+            self.stream.write(rgb)
+        else:
+            write_png(self.path % turn, rgb)
+
+    def close(self):
+        """ Closes the stream, if any """
+
+        if self.stream is not None:
+            self.stream.close()
@@ -0,0 +1,83 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Palette library
+
+########################################################################
+
+Description
+-----------
+Module that maps pheromone levels and food amounts to colors through
+fixed palettes. Levels are quantised to a bucket, the index of a
+precomputed color string, so no colors are formatted while simulating
+and a fill only changes when its bucket does """
+
+import numpy
+
+# A pheromone bucket is red * PHEROMONE_CHANNEL + blue
+PHEROMONE_CHANNEL = 256
+PHEROMONE_GREEN = 10
+
+FOOD_BUCKETS = 256
+
+FOOD_COLORS = tuple("#%02x%02x00" % (red, int(red / 2))
+                    for red in range(FOOD_BUCKETS))
+
+_PHEROMONE_COLORS = []
+
+
+def get_pheromone_palette():
+    """ Returns the color string of every pheromone bucket. The palette is
+    built once and shared, it must not be modified """
+
+    if not _PHEROMONE_COLORS:
+        _PHEROMONE_COLORS.extend(
+            "#%02x%02x%02x" % (red, PHEROMONE_GREEN, blue)
+            for red in range(PHEROMONE_CHANNEL)
+            for blue in range(PHEROMONE_CHANNEL))
+
+    return _PHEROMONE_COLORS
+
+
+def pheromone_buckets(home, food):
+    """ Returns the bucket of the levels of every slot from arrays of the
+    home and food levels. Red grows with the home level and blue with the
+    food level, both with the square root up to 255 """
+
+    red = numpy.minimum(numpy.sqrt(home), PHEROMONE_CHANNEL - 1)
+    blue = numpy.minimum(numpy.sqrt(food), PHEROMONE_CHANNEL - 1)
+
+    return red.astype(numpy.int64) * PHEROMONE_CHANNEL + \
+        blue.astype(numpy.int64)
+
+
+def pheromone_color(home, food):
+    """ Returns the color string of a single home and food level """
+
+    bucket = pheromone_buckets(numpy.float64(home), numpy.float64(food))
+
+    return get_pheromone_palette()[int(bucket)]
+
+
+def food_color(amount, start_amount):
+    """ Returns the color string of food with amount left of start_amount,
+    bright when full and black when empty """
+
+    return FOOD_COLORS[int(255 * ((amount * 1.0) / start_amount))]
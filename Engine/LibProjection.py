@@ -0,0 +1,216 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Projection library
+
+########################################################################
+
+Description
+-----------
+Module that projects game coordinates to screen coordinates for many
+objects at once. Objects drawn with the same polygon are kept in a
+PolygonBatch, the polygon offsets are added to all projected centers
+in a single broadcast """
+
+import numpy
+
+
+def project_xyz(xyz, center, x_offset, y_offset):
+    """ Returns the screen coordinates of an array of game coordinates
+    as an array of [screen_x, screen_y] rows, the game center 0,0,0 is
+    placed on the center coordinate """
+
+    xyz = numpy.asarray(xyz, dtype=numpy.float64).reshape(-1, 3)
+
+    screen = numpy.empty((len(xyz), 2), dtype=numpy.float64)
+    screen[:, 0] = center[0] + x_offset * xyz[:, 1]
+    screen[:, 1] = center[1] - y_offset * (2 * xyz[:, 0] + xyz[:, 1])
+
+    return screen
+
+
+def polygon_offsets(polygon):
+    """ Returns a polygon formatted as [ x0, y0, x1, y1, ... xN, yN ]
+    as an array of [x, y] rows """
+
+    return numpy.array(polygon, dtype=numpy.float64).reshape(-1, 2)
+
+
+def place_polygons(screen, offsets):
+    """ Returns the flat coordinates [ x0, y0, ... xN, yN ] of a polygon
+    placed on every screen coordinate, one row per screen coordinate """
+
+    placed = screen[:, None, :] + offsets[None, :, :]
+
+    return placed.reshape(len(screen), -1)
+
+
+class RowArrays(object):
+    """Render components with a row each in a set of arrays, the arrays
+    are grown geometrically like the arrays of the SwarmEngine
+    """
+
+    # Name, row shape and dtype of every array with a row per object
+    ROW_ARRAYS = ()
+
+    def __init__(self):
+        self.renders = []
+        self.capacity = 0
+
+        for name, _, _ in self.ROW_ARRAYS:
+            setattr(self, name, None)
+
+        self.resize(16)
+
+    def __len__(self):
+        return len(self.renders)
+
+    def resize(self, capacity):
+        """ Grows the row arrays to hold at least capacity objects """
+
+        if capacity <= self.capacity:
+            return
+
+        size = len(self.renders)
+
+        for name, shape, dtype in self.ROW_ARRAYS:
+            grown = numpy.zeros((capacity,) + shape, dtype=dtype)
+            array = getattr(self, name)
+            if array is not None:
+                grown[:size] = array[:size]
+            setattr(self, name, grown)
+
+        self.capacity = capacity
+
+    def append_row(self, rend_comp):
+        """ Adds a render component, returns its row """
+
+        index = len(self.renders)
+        if index == self.capacity:
+            self.resize(2 * self.capacity)
+
+        self.renders.append(rend_comp)
+
+        return index
+
+    def find(self, rend_comp):
+        """ Returns the row of an object, -1 if it is not in the rows """
+
+        for index, entry in enumerate(self.renders):
+            if entry is rend_comp:
+                return index
+
+        return -1
+
+    def delete_row(self, index):
+        """ Removes the row of an object, later rows move up """
+
+        size = len(self.renders)
+        for name, _, _ in self.ROW_ARRAYS:
+            array = getattr(self, name)
+            array[index:size - 1] = array[index + 1:size]
+
+        del self.renders[index]
+
+
+class PolygonBatch(RowArrays):
+    """The moving objects drawn with the same polygon and the game
+    coordinates they were last drawn at
+    """
+
+    # Never drawn objects are placed at NaN, which differs from any
+    # game coordinate
+    ROW_ARRAYS = (('_placed', (3,), numpy.float64),)
+
+    def __init__(self, polygon):
+        super(PolygonBatch, self).__init__()
+
+        self.offsets = polygon_offsets(polygon)
+        self.positions = []
+
+        # Rows of the swarm arrays when all positions are swarm views
+        self.swarm_rows = None
+
+    @property
+    def placed(self):
+        """ The game coordinates every object was last drawn at """
+        return self._placed[:len(self.renders)]
+
+    def add(self, rend_comp, pos, xyz=None):
+        """ Adds an object, xyz is where it is drawn already if known """
+
+        index = self.append_row(rend_comp)
+        self.positions.append(pos)
+
+        self._placed[index] = numpy.nan if xyz is None else xyz
+        self.swarm_rows = None
+
+    def remove(self, rend_comp):
+        """ Removes an object, returns False if it is not in the batch """
+
+        index = self.find(rend_comp)
+
+        if index < 0:
+            return False
+
+        self.delete_row(index)
+        del self.positions[index]
+        self.swarm_rows = None
+
+        return True
+
+    def find_swarm_rows(self):
+        """ Returns the swarm and the rows of all positions if they are
+        all views on the arrays of the same swarm, else None """
+
+        swarm = getattr(self.positions[0], 'swarm', None) \
+            if self.positions else None
+
+        if swarm is None or \
+                any(getattr(pos, 'swarm', None) is not swarm
+                    for pos in self.positions):
+            return None
+
+        return swarm, numpy.array([pos.index for pos in self.positions],
+                                  dtype=numpy.int64)
+
+    def gather(self):
+        """ Returns the current game coordinates of all objects """
+
+        if self.swarm_rows is None:
+            self.swarm_rows = self.find_swarm_rows() or False
+
+        if self.swarm_rows:
+            swarm, rows = self.swarm_rows
+            return swarm.get_xyz(rows)
+
+        xyz = numpy.array([pos.xyz for pos in self.positions],
+                          dtype=numpy.float64)
+
+        return xyz.reshape(-1, 3)
+
+    def moved(self, xyz):
+        """ Returns the indices of the objects that moved since they
+        were last drawn and remembers their new coordinates """
+
+        moved = numpy.flatnonzero((xyz != self.placed).any(axis=1))
+        self.placed[moved] = xyz[moved]
+
+        return moved
@@ -0,0 +1,371 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Snapshot library
+
+########################################################################
+
+Description
+-----------
+Writes the state of a world to a compact binary file and restores it.
+The file holds a json header followed by raw arrays, one per column:
+
+    magic "HEXACOSN", uint32 version, uint32 header length, json header,
+    arrays aligned to SNAPSHOT_ALIGNMENT bytes
+
+The header describes the dtype, shape and offset of every array, so
+they can be memory mapped with read_snapshot. Positions are stored in
+position steps, so a restored world continues exactly. The header also
+holds the settings and seed of the world, a snapshot is only restored
+into a world with the same settings. The seed may differ, the random
+streams are restored """
+
+import json
+import os
+import struct
+
+import numpy
+
+from Engine.LibCommon import to_position_steps, from_position_steps
+from Engine.PheromoneField import PHEROMONE_TYPES
+from Engine.RandomStreams import STREAMS
+
+SNAPSHOT_MAGIC = b"HEXACOSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def _align(offset):
+    """ Returns the offset rounded up to the alignment """
+    return -(-offset // SNAPSHOT_ALIGNMENT) * SNAPSHOT_ALIGNMENT
+
+
+def _sorted_objects(game_engine, component_name):
+    """ Returns the objects with a component in order of creation """
+
+    objects = [obj for obj in game_engine.objects.values()
+               if component_name in obj.components]
+
+    return sorted(objects, key=lambda obj: obj.object_id)
+
+
+def _position_steps(objects):
+    """ Returns the positions of objects as array of steps """
+
+    steps = numpy.zeros((len(objects), 3), dtype=numpy.int64)
+
+    for row, obj in enumerate(objects):
+        steps[row] = [to_position_steps(coord)
+                      for coord in obj.components['position'].xyz()]
+
+    return steps
+
+
+def _deposit(ant):
+    """ Returns the pheromone deposit of an ant, the swarm engine keeps
+    it in its arrays """
+
+    ai_comp = ant.components['ai']
+
+    if 'pheromone_actor' in ant.components:
+        return ant.components['pheromone_actor'].deposit
+
+    return dict(zip(ai_comp.swarm.kinds,
+                    ai_comp.swarm.deposit[ai_comp.index]))
+
+
+def _random_state(game_engine):
+    """ Returns the state of all random streams as json data """
+
+    state = {}
+
+    for name in STREAMS:
+        stream = getattr(game_engine.random, name)
+        version, internal, gauss = stream.getstate()
+        kind, keys, pos, has_gauss, cached = stream.batch.get_state()
+
+        state[name] = {"python": [version, list(internal), gauss],
+                       "numpy": [kind, keys.tolist(), pos, has_gauss, cached]}
+
+    return state
+
+
+def _set_random_state(game_engine, state):
+    """ Restores the state of all random streams """
+
+    for name in STREAMS:
+        stream = getattr(game_engine.random, name)
+        version, internal, gauss = state[name]["python"]
+        kind, keys, pos, has_gauss, cached = state[name]["numpy"]
+
+        stream.setstate((version, tuple(internal), gauss))
+        stream.batch.set_state((kind, numpy.array(keys, dtype=numpy.uint32),
+                                pos, has_gauss, cached))
+
+
+def _settings_data(settings):
+    """ Returns the settings of a world as json data """
+
+    return json.loads(json.dumps(settings.values(), sort_keys=True))
+
+
+def collect_snapshot(game_engine, turn=0):
+    """ Returns the header data and the arrays describing a world """
+
+    ants = _sorted_objects(game_engine, 'ai')
+    food = _sorted_objects(game_engine, 'food')
+    nests = _sorted_objects(game_engine, 'nest')
+
+    field = game_engine.pheromone_engine.field
+    kinds = list(PHEROMONE_TYPES)
+
+    arrays = {}
+
+    for kind in kinds:
+        arrays["tiles." + kind] = field.levels[kind]
+
+    arrays["ants.position"] = _position_steps(ants)
+    arrays["ants.orientation"] = numpy.array(
+        [ant.components['position'].orientation for ant in ants],
+        dtype=numpy.int8)
+    arrays["ants.interested_in"] = numpy.array(
+        [kinds.index(ant.components['ai'].interested_in) for ant in ants],
+        dtype=numpy.int8)
+    arrays["ants.deposit"] = numpy.array(
+        [[_deposit(ant).get(kind, 0.0) for kind in kinds] for ant in ants],
+        dtype=numpy.float64).reshape(-1, len(kinds))
+    arrays["ants.stats"] = numpy.array(
+        [(ant.components['ai'].stats.found_food,
+          ant.components['ai'].stats.carrying_food,
+          ant.components['ai'].stats.returned_food) for ant in ants],
+        dtype=numpy.int64).reshape(-1, 3)
+
+    arrays["food.position"] = _position_steps(food)
+    arrays["food.amount"] = numpy.array(
+        [(obj.components['food'].amount, obj.components['food'].start_amount)
+         for obj in food], dtype=numpy.int64).reshape(-1, 2)
+
+    arrays["nests.position"] = _position_steps(nests)
+    arrays["nests.amount_of_ants"] = numpy.array(
+        [obj.components['nest'].amount_of_ants for obj in nests],
+        dtype=numpy.int64)
+
+    header = {"turn": turn,
+              "rings": game_engine.pheromone_engine.rings,
+              "kinds": kinds,
+              "seed": game_engine.settings.seed,
+              "settings": _settings_data(game_engine.settings),
+              "random": _random_state(game_engine)}
+
+    return header, arrays
+
+
+def write_snapshot(game_engine, path, turn=0):
+    """ Writes the state of a world to a file, the file is replaced
+    at once so a crash while writing leaves the previous one intact """
+
+    header, arrays = collect_snapshot(game_engine, turn)
+
+    offset = 0
+    header["arrays"] = {}
+
+    for name in sorted(arrays):
+        array = numpy.ascontiguousarray(arrays[name])
+        arrays[name] = array
+
+        header["arrays"][name] = {"dtype": array.dtype.str,
+                                  "shape": list(array.shape),
+                                  "offset": offset}
+        offset = _align(offset + array.nbytes)
+
+    header_bytes = json.dumps(header, sort_keys=True).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header_bytes))
+
+    temporary = path + ".tmp"
+
+    with open(temporary, "wb") as snapshot_file:
+        snapshot_file.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION,
+                                           len(header_bytes)))
+        snapshot_file.write(header_bytes)
+
+        for name in sorted(arrays):
+            snapshot_file.seek(data_start + header["arrays"][name]["offset"])
+            snapshot_file.write(arrays[name].tobytes())
+
+    if hasattr(os, "replace"):
+        os.replace(temporary, path)
+    else:
+        os.rename(temporary, path)
+
+
+def read_snapshot(path):
+    """ Returns the header and the arrays of a snapshot file, the arrays
+    are memory mapped read only """
+
+    with open(path, "rb") as snapshot_file:
+        magic, version, header_length = _PREAMBLE.unpack(
+            snapshot_file.read(_PREAMBLE.size))
+
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("%s is not a version %d snapshot" %
+                             (path, SNAPSHOT_VERSION))
+
+        header = json.loads(snapshot_file.read(header_length).decode("utf-8"))
+
+    data_start = _align(_PREAMBLE.size + header_length)
+    arrays = {}
+
+    for name, description in header["arrays"].items():
+        shape = tuple(description["shape"])
+
+        if 0 in shape:
+            arrays[name] = numpy.zeros(shape, dtype=description["dtype"])
+            continue
+
+        arrays[name] = numpy.memmap(path, dtype=description["dtype"],
+                                    mode="r", shape=shape,
+                                    offset=data_start + description["offset"])
+
+    return header, arrays
+
+
+def _set_position(obj, steps):
+    """ Moves an object to a position in steps """
+
+    obj.components['position'].set_position_xyz(
+        [from_position_steps(step) for step in steps.tolist()])
+
+
+def _move_holder(game_engine, obj, steps):
+    """ Moves a pheromone holder placed over a tile, like a nest, to a
+    position in steps. It takes the slot of the tile it moves to, the
+    tile it leaves gets its slot and decay back """
+
+    pheromone_engine = game_engine.pheromone_engine
+    old_key = pheromone_engine.get_holder_key(
+        obj.components['position'].xyz())
+
+    pheromone_engine.remove_component(obj)
+    _set_position(obj, steps)
+    pheromone_engine.add_component(obj)
+
+    if old_key < 0 or old_key in pheromone_engine.holders:
+        return
+
+    for tile in _sorted_objects(game_engine, 'pheromone_holder'):
+        if tile is not obj and pheromone_engine.get_holder_key(
+                tile.components['position'].xyz()) == old_key:
+            pheromone_engine.add_component(tile)
+            return
+
+
+def _check_settings(game_engine, header):
+    """ Raises a ValueError if the world has other settings than the
+    snapshot, the seed may differ """
+
+    saved = dict(header.get("settings", {}))
+    if not saved:
+        return
+
+    current = _settings_data(game_engine.settings)
+
+    saved.pop("seed", None)
+    current.pop("seed", None)
+
+    for name in sorted(set(saved) | set(current)):
+        if saved.get(name) != current.get(name):
+            raise ValueError("Snapshot has the setting %s %r, the world %r" %
+                             (name, saved.get(name), current.get(name)))
+
+
+def restore_snapshot(game_engine, path):
+    """ Restores a snapshot into an initialized world with the same
+    settings, the seed may differ. Returns the turn of the snapshot """
+
+    header, arrays = read_snapshot(path)
+
+    ants = _sorted_objects(game_engine, 'ai')
+    food = _sorted_objects(game_engine, 'food')
+    nests = _sorted_objects(game_engine, 'nest')
+
+    expected = {"ants.position": len(ants), "food.position": len(food),
+                "nests.position": len(nests)}
+
+    for name, count in expected.items():
+        if len(arrays[name]) != count:
+            raise ValueError("Snapshot has %d %s, the world %d" %
+                             (len(arrays[name]), name.split(".")[0], count))
+
+    if header["rings"] != game_engine.pheromone_engine.rings:
+        raise ValueError("Snapshot has a map of %d rings, the world %d" %
+                         (header["rings"], game_engine.pheromone_engine.rings))
+
+    _check_settings(game_engine, header)
+
+    # Nests take the pheromone slot of their tile, they are moved before
+    # the levels are restored
+    for row, obj in enumerate(nests):
+        _move_holder(game_engine, obj, arrays["nests.position"][row])
+        obj.components['nest'].amount_of_ants = \
+            int(arrays["nests.amount_of_ants"][row])
+
+    field = game_engine.pheromone_engine.field
+    kinds = header["kinds"]
+
+    for kind in kinds:
+        field.levels[kind][:] = arrays["tiles." + kind]
+    field.refresh_active()
+
+    for row, ant in enumerate(ants):
+        _set_position(ant, arrays["ants.position"][row])
+        ant.components['position'].orientation = \
+            int(arrays["ants.orientation"][row])
+
+        ai_comp = ant.components['ai']
+        ai_comp.interested_in = kinds[arrays["ants.interested_in"][row]]
+
+        found, carrying, returned = arrays["ants.stats"][row].tolist()
+        ai_comp.stats.found_food = found
+        ai_comp.stats.carrying_food = carrying
+        ai_comp.stats.returned_food = returned
+
+        if ai_comp.interested_in == "home":
+            ant.components['render'].fill = "#000066"
+
+        deposit = arrays["ants.deposit"][row].tolist()
+
+        if 'pheromone_actor' in ant.components:
+            ant.components['pheromone_actor'].deposit.update(
+                zip(kinds, deposit))
+        else:
+            ai_comp.swarm.deposit[ai_comp.index] = deposit
+
+    for row, obj in enumerate(food):
+        _set_position(obj, arrays["food.position"][row])
+
+        amount, start_amount = arrays["food.amount"][row].tolist()
+        obj.components['food'].start_amount = start_amount
+        obj.components['food'].amount = amount
+        obj.components['food'].update_color()
+
+    _set_random_state(game_engine, header["random"])
+
+    return header["turn"]
@@ -23,31 +23,68 @@
 
 Description
 -----------
-Class for a Pheromone Engine """
+Class for a Pheromone Engine.
+The levels of all holders are kept in a PheromoneField so decay is applied
+to the whole map at once. Holders are keyed by their integer tile index and
+the levels around actors are gathered with the neighbour table of the map """
 
-from math import sqrt
-from Engine.LibHexagonalPosition import get_neighbour_xyz
+import numpy
 
+from Engine.LibHexagonalPosition import calc_tile_count
+from Engine.LibHexagonalPosition import get_neighbour_table
+from Engine.LibHexagonalPosition import calc_tile_index_from_xyz
+from Engine.PheromoneField import PheromoneField
+from Engine.PheromoneHistory import PheromoneRecorder
+from Engine.LibPalette import get_pheromone_palette, pheromone_buckets
+from Engine.LibPalette import pheromone_color
 
-class PheromoneEngine(object):
-    """The engine managing all pheromones on the map
-    """
+from Engine.SharedInstance import SharedInstance
+from Engine.GameSettings import MAPSIZE
 
-    _instance = None
 
-    def __new__(cls, *args, **kwargs):
-        """ Called when creating new instance, return existing instance
-        otherwise create new one, singleton pattern """
-        if not cls._instance:
-            cls._instance = super(PheromoneEngine, cls).__new__(
-                                cls, *args, **kwargs)
-        return cls._instance
+class PheromoneEngine(SharedInstance):
+    """The engine managing all pheromones on the map
+    """
 
     def __init__(self):
 
         self.holders = dict()
         self.actors = []
 
+        # Number of actors on a tile center in the last update
+        self.centered_actors = 0
+
+        self.rings = MAPSIZE
+        self.field = PheromoneField(calc_tile_count(self.rings))
+        self.present = numpy.zeros(self.field.size, dtype=bool)
+        self.neighbours = get_neighbour_table(self.rings)
+
+        # Palette bucket of the fill of every holder, -1 if not yet set
+        self.buckets = numpy.full(self.field.size, -1, dtype=numpy.int64)
+
+        # Writes the levels to a history file while recording
+        self.recorder = None
+
+    def set_map_size(self, rings, neighbours=None):
+        """ Sizes the pheromone field for a map of a number of rings,
+        holders that were already added are moved to the new field.
+        neighbours is the neighbour table of the map """
+
+        holders = list(self.holders.values())
+
+        self.rings = rings
+        self.field = PheromoneField(calc_tile_count(rings))
+        self.present = numpy.zeros(self.field.size, dtype=bool)
+        self.buckets = numpy.full(self.field.size, -1, dtype=numpy.int64)
+        self.holders = dict()
+
+        if neighbours is None:
+            neighbours = get_neighbour_table(rings)
+        self.neighbours = neighbours
+
+        for holder in holders:
+            self.add_component(holder)
+
     def add_component(self, game_object):
         """ If a object has a pheromone and a position component it is added
         to the list of objects to update """
@@ -56,8 +93,16 @@ class PheromoneEngine(object):
             if 'pheromone_holder' in game_object.components and \
                     'position' in game_object.components:
                 xyz = game_object.components['position'].xyz()
-                key = "%+.0f%+.0f%+.0f" % (xyz[0], xyz[1], xyz[2])
-                self.holders[key] = game_object
+                key = self.get_holder_key(xyz)
+
+                # Holders outside of the map have no slot in the field
+                if key >= 0:
+                    self.holders[key] = game_object
+                    self.present[key] = True
+                    self.buckets[key] = -1
+
+                    ph_hold_comp = game_object.components['pheromone_holder']
+                    ph_hold_comp.bind(self.field, key)
 
             if 'pheromone_actor' in game_object.components and \
                     'position' in game_object.components:
@@ -65,19 +110,78 @@ class PheromoneEngine(object):
         except AttributeError:
             pass
 
+    def remove_component(self, game_object):
+        """ Removes an actor or holder, the slot of a removed holder keeps
+        its levels but is no longer sensed """
+
+        if game_object in self.actors:
+            self.actors.remove(game_object)
+
+        for key, holder in list(self.holders.items()):
+            if holder is game_object:
+                del self.holders[key]
+                self.present[key] = False
+
     def pheromone_levels_to_color(self, levels):
         """ Returns a TKinter rgb color string """
 
-        red = int(min(sqrt(levels["home"]), 255))
-        green = 10
-        blue = int(min(sqrt(levels["food"]), 255))
-        return "#%02x%02x%02x" % (red, green, blue)
+        return pheromone_color(levels["home"], levels["food"])
+
+    def field_buckets(self):
+        """ Returns the palette bucket of the levels of every slot """
+
+        return pheromone_buckets(self.field.levels["home"],
+                                 self.field.levels["food"])
+
+    def field_colors(self):
+        """ Returns the TKinter rgb color string of every slot in the field,
+        the same colors as pheromone_levels_to_color """
+
+        palette = get_pheromone_palette()
+
+        return [palette[bucket] for bucket in self.field_buckets().tolist()]
+
+    def update_colors(self):
+        """ Sets the fill of the holders whose levels moved to another
+        palette bucket, returns the number of changed fills. Not part of
+        a tick, renderers call it before drawing a frame """
+
+        buckets = self.field_buckets()
+
+        changed = numpy.flatnonzero((buckets != self.buckets) & self.present)
+        self.buckets = buckets
+
+        palette = get_pheromone_palette()
+
+        for key, bucket in zip(changed.tolist(), buckets[changed].tolist()):
+            self.holders[key].components['render'].fill = palette[bucket]
+
+        return len(changed)
+
+    def start_recording(self, path, stride=1, first_tick=0):
+        """ Records the levels of every stride ticks to a history file,
+        see Engine.PheromoneHistory """
+
+        self.stop_recording()
+        self.recorder = PheromoneRecorder(path, self.rings, self.field.kinds,
+                                          stride, first_tick)
+
+    def stop_recording(self):
+        """ Closes the history file, if recording """
+
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def update_recorder(self):
+        """ Records the levels of this tick, after all deposits """
+
+        if self.recorder is not None:
+            self.recorder.record(self.field)
 
     def get_holder_key(self, xyz):
-        """ Get a pheromone holder key using the coordinate """
-        key = "%+.0f%+.0f%+.0f" % (xyz[0], xyz[1], xyz[2])
-        key = key.replace("-0", "+0")
-        return key
+        """ Get a pheromone holder key, the tile index, using the coordinate """
+        return calc_tile_index_from_xyz(xyz, self.rings)
 
     def get_holder(self, xyz):
         """ Get a pheromone holder using the coordinate """
@@ -87,44 +191,63 @@ class PheromoneEngine(object):
     def get_levels_xyz(self, xyz):
         """ Returns all levels of the adjacent tiles of position x, y ,z """
 
-        pheromone_levels = {"food": [], "home": []}
+        return self.get_levels_keys([self.get_holder_key(xyz)])[0]
 
-        for direction in range(6):
+    def gather_levels(self, keys):
+        """ Gathers the levels of the adjacent tiles for an array of holder
+        keys at once with the neighbour table. Returns a dict with a level
+        array of shape [keys, 6] per pheromone type and a boolean array of
+        the same shape that is False for neighbours without a holder """
 
-            nghbr_xyz = get_neighbour_xyz(xyz, direction)
+        keys = numpy.asarray(keys, dtype=numpy.int64)
 
-            try:
-                holder = self.get_holder(nghbr_xyz)
-                levels = holder.levels
-                pheromone_levels["food"].append(levels["food"])
-                pheromone_levels["home"].append(levels["home"])
-            except KeyError:
-                pheromone_levels["food"].append(None)
-                pheromone_levels["home"].append(None)
+        neighbours = self.neighbours[keys]
+        valid = (neighbours >= 0) & self.present[neighbours]
+        valid &= (keys >= 0)[:, None]
 
-        return pheromone_levels
+        levels = {}
+        for kind in self.field.kinds:
+            levels[kind] = self.field.levels[kind][neighbours]
+
+        return levels, valid
+
+    def get_levels_keys(self, keys):
+        """ Returns all levels of the adjacent tiles for a list of
+        holder keys. The level is None for neighbours without a holder """
+
+        levels, valid = self.gather_levels(keys)
+
+        per_kind = {}
+        for kind in levels:
+            with_none = levels[kind].astype(object)
+            with_none[~valid] = None
+            per_kind[kind] = with_none.tolist()
+
+        return [{kind: per_kind[kind][i] for kind in per_kind}
+                for i in range(len(keys))]
 
     def update_actors(self):
         """ Update the objects that need pheromone data """
 
-        for actor in self.actors:
-            pos_comp = actor.components['position']
+        centered = [actor for actor in self.actors
+                    if actor.components['position'].center_of_tile()]
 
-            if pos_comp.center_of_tile():
-                ph_comp = actor.components['pheromone_actor']
-                ph_comp.neighbour_levels = self.get_levels_xyz(pos_comp.xyz())
+        self.centered_actors = len(centered)
 
-    def update_holders(self):
-        """ Update the objects that take pheromones """
+        if not centered:
+            return
 
-        for hold_pos in self.holders:
+        keys = [self.get_holder_key(actor.components['position'].xyz())
+                for actor in centered]
 
-            holder = self.holders[hold_pos]
-            ph_hold_comp = holder.components['pheromone_holder']
-            ph_hold_comp.update()
+        for actor, levels in zip(centered, self.get_levels_keys(keys)):
+            actor.components['pheromone_actor'].neighbour_levels = levels
+
+    def update_holders(self):
+        """ Update the objects that take pheromones, their colors are
+        derived when drawn, see update_colors """
 
-            color = self.pheromone_levels_to_color(ph_hold_comp.levels)
-            holder.components['render'].fill = color
+        self.field.update()
 
         for actor in self.actors:
             pos_comp = actor.components['position']
@@ -0,0 +1,224 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Pheromone Field Class
+
+########################################################################
+
+Description
+-----------
+Class holding the pheromone levels of all holders in contiguous arrays.
+Each tile owns one slot in the field, the decay of all slots is
+applied as a single vectorized operation per pheromone type.
+Only slots with a level other than zero decay, a zero level stays zero.
+The field keeps the set of these active slots, levels written directly
+into the arrays must be followed by refresh_active """
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+import numpy
+
+PHEROMONE_TYPES = ("food", "home")
+
+# Above this fraction of active slots decaying the whole field is faster
+DENSE_FRACTION = 0.125
+
+
+class PheromoneField(object):
+    """The levels and decay constants of all pheromone holders,
+    slot i holds the levels of the tile with tile index i
+    """
+
+    def __init__(self, size, kinds=PHEROMONE_TYPES):
+        self.kinds = tuple(kinds)
+        self.size = size
+
+        self.levels = {}
+        self.relative = {}
+        self.abs_minimum = {}
+
+        for kind in self.kinds:
+            self.levels[kind] = numpy.zeros(size, dtype=numpy.float64)
+            self.relative[kind] = numpy.zeros(size, dtype=numpy.float64)
+            self.abs_minimum[kind] = numpy.zeros(size, dtype=numpy.float64)
+
+        self._delta = numpy.zeros(size, dtype=numpy.float64)
+
+        # True for the slots in the active set, which are the slots in
+        # active_keys and the slots activated since the last update
+        self.active = numpy.zeros(size, dtype=bool)
+        self.active_keys = numpy.zeros(0, dtype=numpy.int64)
+        self._activated = []
+        self._activated_slots = []
+
+    def activate_slot(self, index):
+        """ Adds a single slot to the active set """
+
+        if not self.active.item(index):
+            self.active[index] = True
+            self._activated_slots.append(index)
+
+    def activate(self, keys):
+        """ Adds an array of slots to the active set """
+
+        keys = numpy.unique(numpy.asarray(keys, dtype=numpy.int64))
+        keys = keys[~self.active[keys]]
+
+        if len(keys):
+            self.active[keys] = True
+            self._activated.append(keys)
+
+    def refresh_active(self):
+        """ Rebuilds the active set from the levels, after they were
+        written directly into the arrays """
+
+        active = numpy.zeros(self.size, dtype=bool)
+        for kind in self.kinds:
+            active |= self.levels[kind] != 0.0
+
+        self.active = active
+        self.active_keys = numpy.flatnonzero(active)
+        self._activated = []
+        self._activated_slots = []
+
+    def get_active_keys(self):
+        """ Returns the slots of the active set """
+
+        if self._activated_slots:
+            self._activated.append(numpy.array(self._activated_slots,
+                                               dtype=numpy.int64))
+            self._activated_slots = []
+
+        if self._activated:
+            self.active_keys = numpy.concatenate([self.active_keys] +
+                                                 self._activated)
+            self._activated = []
+
+        return self.active_keys
+
+    def set_levels(self, index, levels):
+        """ Copies the levels of a dict into a slot, pheromone types
+        missing from the dict are set to zero """
+
+        for kind in self.kinds:
+            self.levels[kind][index] = levels.get(kind, 0.0)
+
+        self.activate_slot(index)
+
+    def add_levels(self, kind, keys, amounts):
+        """ Adds amounts to the levels of a pheromone type in an array of
+        slots, a slot may be given more than once """
+
+        numpy.add.at(self.levels[kind], keys, amounts)
+        self.activate(keys)
+
+    def set_decay(self, index, decay):
+        """ Copies the decay constants of a holder into a slot,
+        a holder without a valid decay description does not decay """
+
+        for kind in self.kinds:
+            try:
+                relative = decay[kind]['relative']
+                abs_minimum = decay[kind]['abs_minimum']
+            except (KeyError, TypeError):
+                relative, abs_minimum = 0.0, 0.0
+
+            self.relative[kind][index] = relative
+            self.abs_minimum[kind][index] = abs_minimum
+
+    def set_uniform_decay(self, relative, abs_minimum):
+        """ Sets the decay constants of all slots at once, from arrays
+        holding a constant per pheromone type in the order of kinds """
+
+        for column, kind in enumerate(self.kinds):
+            self.relative[kind][:] = relative[column]
+            self.abs_minimum[kind][:] = abs_minimum[column]
+
+    def update(self):
+        """ Decays all active slots, equal to PheromoneHolderComponent.update
+        applied to every holder. Slots that reached zero leave the active
+        set. With many slots active the whole field is decayed at once """
+
+        keys = self.get_active_keys()
+        dense = len(keys) > DENSE_FRACTION * self.size
+
+        if dense:
+            self.update_all()
+
+        still_active = numpy.zeros(len(keys), dtype=bool)
+
+        for kind in self.kinds:
+            levels = self.levels[kind][keys]
+
+            if not dense:
+                delta = levels * self.relative[kind][keys]
+                numpy.maximum(delta, self.abs_minimum[kind][keys], out=delta)
+                numpy.subtract(levels, delta, out=levels)
+                numpy.maximum(levels, 0.0, out=levels)
+
+                self.levels[kind][keys] = levels
+
+            still_active |= levels != 0.0
+
+        self.active[keys[~still_active]] = False
+        self.active_keys = keys[still_active]
+
+    def update_all(self):
+        """ Decays every slot, active or not """
+
+        delta = self._delta
+
+        for kind in self.kinds:
+            levels = self.levels[kind]
+
+            numpy.multiply(levels, self.relative[kind], out=delta)
+            numpy.maximum(delta, self.abs_minimum[kind], out=delta)
+            numpy.subtract(levels, delta, out=levels)
+            numpy.maximum(levels, 0.0, out=levels)
+
+
+class PheromoneLevels(MutableMapping):
+    """Dict-like view on the levels of a single slot in a field
+    """
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+
+    def __getitem__(self, kind):
+        return self.field.levels[kind].item(self.index)
+
+    def __setitem__(self, kind, value):
+        self.field.levels[kind][self.index] = value
+        self.field.activate_slot(self.index)
+
+    def __delitem__(self, kind):
+        raise TypeError("Pheromone types of a field can not be removed")
+
+    def __iter__(self):
+        return iter(self.field.kinds)
+
+    def __len__(self):
+        return len(self.field.kinds)
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -0,0 +1,174 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Pheromone History Classes
+
+########################################################################
+
+Description
+-----------
+Records the pheromone levels of every tick to a file for offline analysis.
+Frames are appended to the file as they are recorded, so long histories
+never have to fit in memory, and read_history maps them back with numpy:
+
+    magic "HEXACOPH", uint32 version, uint32 header length, json header,
+    xyz of every tile index, frames of [kinds, tiles] float64 levels
+
+The header holds the map size, the pheromone types, the stride in ticks
+and the offsets of the tile table and the first frame, counted from the
+aligned end of the header. Frame i holds the
+levels after tick first_tick + (i + 1) * stride """
+
+import json
+import os
+import struct
+
+import numpy
+
+from Engine.LibHexagonalPosition import calc_tile_count
+from Engine.LibHexagonalPosition import get_tile_index_tables
+from Engine.PheromoneField import PHEROMONE_TYPES
+
+HISTORY_MAGIC = b"HEXACOPH"
+HISTORY_VERSION = 1
+HISTORY_ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<8sII")
+_LEVEL_DTYPE = numpy.dtype("<f8")
+_XYZ_DTYPE = numpy.dtype("<i8")
+
+
+def _align(offset):
+    """ Returns the first aligned offset at or after offset """
+    return -(-offset // HISTORY_ALIGNMENT) * HISTORY_ALIGNMENT
+
+
+class PheromoneRecorder(object):
+    """Appends the levels of a pheromone field to a history file,
+    every stride ticks
+    """
+
+    def __init__(self, path, rings, kinds=PHEROMONE_TYPES, stride=1,
+                 first_tick=0):
+        self.path = path
+        self.rings = rings
+        self.kinds = tuple(kinds)
+        self.stride = max(int(stride), 1)
+        self.first_tick = first_tick
+
+        self.tiles = calc_tile_count(rings)
+        self.ticks = 0
+        self.frames = 0
+
+        self.history = open(path, "wb")
+        self.write_header()
+
+    def write_header(self):
+        """ Writes the preamble, the json header and the tile table """
+
+        xyz_of_index = get_tile_index_tables(self.rings)[1]
+
+        header = {"version": HISTORY_VERSION,
+                  "rings": self.rings,
+                  "kinds": list(self.kinds),
+                  "stride": self.stride,
+                  "first_tick": self.first_tick,
+                  "dtype": _LEVEL_DTYPE.str,
+                  "frame_shape": [len(self.kinds), self.tiles]}
+
+        # Offsets are relative to the aligned end of the header
+        header["tile_xyz"] = {"dtype": _XYZ_DTYPE.str,
+                              "shape": [self.tiles, 3],
+                              "offset": 0}
+        header["frame_offset"] = _align(self.tiles * 3 * _XYZ_DTYPE.itemsize)
+
+        encoded = json.dumps(header, sort_keys=True).encode("utf-8")
+        data_start = _align(_PREAMBLE.size + len(encoded))
+
+        self.history.write(_PREAMBLE.pack(HISTORY_MAGIC, HISTORY_VERSION,
+                                          len(encoded)))
+        self.history.write(encoded)
+        self.history.write(b"\0" * (data_start - self.history.tell()))
+        self.history.write(xyz_of_index.astype(_XYZ_DTYPE).tobytes())
+        self.history.write(b"\0" * (data_start + header["frame_offset"] -
+                                    self.history.tell()))
+
+    def record(self, field):
+        """ Counts a tick and appends the levels of the field when it is
+        one of the recorded ticks """
+
+        self.ticks += 1
+
+        if self.ticks % self.stride:
+            return
+
+        for kind in self.kinds:
+            self.history.write(field.levels[kind].astype(_LEVEL_DTYPE,
+                                                         copy=False)
+                               .tobytes())
+
+        self.frames += 1
+
+    def close(self):
+        """ Flushes and closes the history file """
+
+        if not self.history.closed:
+            self.history.close()
+
+
+def read_history(path):
+    """ Returns the header, the xyz of every tile index and the levels of
+    all complete frames in shape [frames, kinds, tiles]. The arrays are
+    read only memory maps of the file """
+
+    with open(path, "rb") as history:
+        magic, version, length = _PREAMBLE.unpack(
+            history.read(_PREAMBLE.size))
+
+        if magic != HISTORY_MAGIC:
+            raise ValueError("%s is not a pheromone history" % path)
+
+        if version != HISTORY_VERSION:
+            raise ValueError("Unsupported pheromone history version %d" %
+                             version)
+
+        header = json.loads(history.read(length).decode("utf-8"))
+
+    data_start = _align(_PREAMBLE.size + length)
+    frame_start = data_start + header["frame_offset"]
+
+    tile_table = header["tile_xyz"]
+    tile_xyz = numpy.memmap(path, dtype=numpy.dtype(tile_table["dtype"]),
+                            mode="r", offset=data_start + tile_table["offset"],
+                            shape=tuple(tile_table["shape"]))
+
+    dtype = numpy.dtype(header["dtype"])
+    frame_shape = tuple(header["frame_shape"])
+    frame_bytes = frame_shape[0] * frame_shape[1] * dtype.itemsize
+
+    # A frame that is still being written is left out
+    frames = (os.path.getsize(path) - frame_start) // frame_bytes
+
+    if frames > 0:
+        levels = numpy.memmap(path, dtype=dtype, mode="r", offset=frame_start,
+                              shape=(frames,) + frame_shape)
+    else:
+        levels = numpy.zeros((0,) + frame_shape, dtype=dtype)
+
+    return header, tile_xyz, levels
@@ -0,0 +1,182 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Profiler Class
+
+########################################################################
+
+Description
+-----------
+Per-phase wall clock timers and counters of the game loop.
+The last PROFILE_WINDOW durations of every phase are kept for a rolling
+report, every tick can be streamed as a json line. A disabled profiler
+is never called by the game loop """
+
+import json
+
+from collections import deque
+from math import log
+from time import time
+
+from Engine.GameSettings import PROFILE_WINDOW
+
+# Histogram buckets are powers of two microseconds, from 1 us up to ~1 s
+HISTOGRAM_BUCKETS = 21
+
+
+class Profiler(object):
+    """Timings and counters of the phases of a tick
+    """
+
+    def __init__(self, window=PROFILE_WINDOW, stream=None):
+        self.enabled = False
+        self.window = window
+        self.stream = stream
+
+        self.ticks = 0
+        self.timings = dict()
+        self.counters = dict()
+
+        # Timings and counters of the current tick
+        self.tick_timings = dict()
+        self.tick_counters = dict()
+
+    def enable(self, stream=None):
+        """ Starts profiling, ticks are written to stream as json lines
+        if one is given """
+
+        self.enabled = True
+        self.stream = stream
+
+    def disable(self):
+        """ Stops profiling, the collected timings are kept """
+
+        self.enabled = False
+
+    def time(self, phase, function, *args):
+        """ Calls function and records its duration as phase,
+        returns the result of the function """
+
+        start = time()
+        result = function(*args)
+        self.record(phase, time() - start)
+
+        return result
+
+    def record(self, phase, seconds):
+        """ Adds a duration of a phase to the current tick """
+
+        self.tick_timings[phase] = self.tick_timings.get(phase, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        """ Adds to a counter of the current tick """
+
+        self.tick_counters[name] = self.tick_counters.get(name, 0) + amount
+
+    def end_tick(self):
+        """ Adds the current tick to the rolling window and writes it to
+        the stream """
+
+        self.ticks += 1
+
+        for phase, seconds in self.tick_timings.items():
+            if phase not in self.timings:
+                self.timings[phase] = deque(maxlen=self.window)
+            self.timings[phase].append(seconds)
+
+        for name, amount in self.tick_counters.items():
+            if name not in self.counters:
+                self.counters[name] = deque(maxlen=self.window)
+            self.counters[name].append(amount)
+
+        if self.stream is not None:
+            self.stream.write(json.dumps({"tick": self.ticks,
+                                          "seconds": self.tick_timings,
+                                          "counters": self.tick_counters},
+                                         sort_keys=True))
+            self.stream.write("\n")
+
+        self.tick_timings = dict()
+        self.tick_counters = dict()
+
+    def report(self):
+        """ Returns the statistics of every phase and counter over
+        the rolling window """
+
+        phases = dict()
+
+        for phase, durations in self.timings.items():
+            ordered = sorted(durations)
+            count = len(ordered)
+
+            histogram = [0] * HISTOGRAM_BUCKETS
+            for seconds in ordered:
+                histogram[histogram_bucket(seconds)] += 1
+
+            phases[phase] = {"count": count,
+                             "mean": sum(ordered) / count,
+                             "min": ordered[0],
+                             "p50": ordered[count // 2],
+                             "p95": ordered[min(int(0.95 * count), count - 1)],
+                             "max": ordered[-1],
+                             "histogram": histogram}
+
+        counters = dict()
+
+        for name, amounts in self.counters.items():
+            counters[name] = {"mean": float(sum(amounts)) / len(amounts),
+                              "max": max(amounts)}
+
+        return {"ticks": self.ticks, "phases": phases, "counters": counters}
+
+    def format_report(self):
+        """ Returns the report as a table of text """
+
+        report = self.report()
+
+        lines = ["%d ticks, last %d:" % (report["ticks"], self.window),
+                 "%-20s %10s %10s %10s %10s" % ("phase", "mean ms",
+                                               "p50 ms", "p95 ms", "max ms")]
+
+        for phase in sorted(report["phases"]):
+            stats = report["phases"][phase]
+            lines.append("%-20s %10.3f %10.3f %10.3f %10.3f" % (
+                phase, 1e3 * stats["mean"], 1e3 * stats["p50"],
+                1e3 * stats["p95"], 1e3 * stats["max"]))
+
+        lines.append("%-20s %10s %10s" % ("counter", "mean", "max"))
+
+        for name in sorted(report["counters"]):
+            stats = report["counters"][name]
+            lines.append("%-20s %10.1f %10d" % (name, stats["mean"],
+                                                 stats["max"]))
+
+        return "\n".join(lines)
+
+
+def histogram_bucket(seconds):
+    """ Returns the histogram bucket of a duration, bucket i holds
+    durations from 2^i up to 2^(i+1) microseconds """
+
+    microseconds = seconds * 1e6
+
+    if microseconds < 2.0:
+        return 0
+
+    return min(int(log(microseconds, 2)), HISTOGRAM_BUCKETS - 1)
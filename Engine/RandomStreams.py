@@ -0,0 +1,70 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Random Streams Class
+
+########################################################################
+
+Description
+-----------
+Seeded random number streams, one per subsystem, so a run with the same
+seed can be replayed exactly and one subsystem drawing more numbers does
+not change the draws of another. Every stream gives single draws like the
+random module and batched draws as numpy arrays """
+
+import random
+
+import numpy
+
+from Engine.GameSettings import SEED
+
+# The subsystems with their own stream, in the order their seeds are drawn
+STREAMS = ("ai", "food", "map")
+
+
+class RandomStream(random.Random):
+    """A random.Random for single draws with a numpy RandomState, batch,
+    for drawing arrays, both seeded from the same seed
+    """
+
+    def __init__(self, seed=None):
+        random.Random.__init__(self, seed)
+        self.batch = numpy.random.RandomState(seed)
+
+    def dice(self, count):
+        """ Returns an array of count floats in [0, 1) """
+        return self.batch.random_sample(count)
+
+    def integers(self, low, high, count):
+        """ Returns an array of count integers in [low, high] """
+        return self.batch.randint(low, high + 1, count)
+
+
+class RandomStreams(object):
+    """The random streams of all subsystems, seeded from a single seed.
+    Without seed the streams are seeded from the operating system
+    """
+
+    def __init__(self, seed=SEED):
+        self.seed = seed
+
+        seeds = random.Random(seed)
+
+        for name in STREAMS:
+            setattr(self, name, RandomStream(seeds.getrandbits(32)))
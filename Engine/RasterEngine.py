@@ -0,0 +1,447 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Raster Engine Class
+
+########################################################################
+
+Description
+-----------
+Draws the game into an RGB numpy array instead of a Tkinter canvas, so
+frames can be written without a display. Has the interface of the
+GraphicsEngine. The pixels covered by every polygon are computed once as
+a mask of offsets. Pixels are kept packed in one 32 bit integer each.
+Static objects, the tiles, are painted from a label image holding the
+object of every pixel, moving objects are painted per batch with one
+indexed assignment. Changed fills are found by the change count of the
+render components, their dirty flags are left to the GraphicsEngine """
+
+from math import sqrt
+
+import numpy
+
+from Engine.LibProjection import project_xyz, RowArrays, PolygonBatch
+from Engine.SharedInstance import SharedInstance
+from Engine.GameSettings import HEX_RADIUS, WINDOW_SIZE
+
+
+def rasterize_polygon(polygon):
+    """ Returns the x and y offsets of the pixels covered by a convex
+    polygon formatted as [ x0, y0, x1, y1, ... xN, yN ], pixels on the
+    edge are covered """
+
+    points = numpy.array(polygon, dtype=numpy.float64).reshape(-1, 2)
+
+    x_range = numpy.arange(numpy.floor(points[:, 0].min()),
+                           numpy.ceil(points[:, 0].max()) + 1)
+    y_range = numpy.arange(numpy.floor(points[:, 1].min()),
+                           numpy.ceil(points[:, 1].max()) + 1)
+    pixel_x, pixel_y = numpy.meshgrid(x_range, y_range)
+
+    # A pixel is inside if it lies on the same side of every edge
+    start = points
+    end = numpy.roll(points, -1, axis=0)
+
+    cross = (end[:, 0, None, None] - start[:, 0, None, None]) * \
+        (pixel_y[None] - start[:, 1, None, None]) - \
+        (end[:, 1, None, None] - start[:, 1, None, None]) * \
+        (pixel_x[None] - start[:, 0, None, None])
+
+    epsilon = 1e-9
+    inside = (cross >= -epsilon).all(axis=0) | \
+        (cross <= epsilon).all(axis=0)
+
+    return (pixel_x[inside].astype(numpy.int64),
+            pixel_y[inside].astype(numpy.int64))
+
+
+def color_to_rgb(color):
+    """ Returns the red, green and blue of a #rrggbb color string """
+
+    if len(color) != 7 or not color.startswith("#"):
+        raise ValueError("Unknown color %r, use #rrggbb" % (color,))
+
+    return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+
+def pack_color(color):
+    """ Returns a #rrggbb color string as the 32 bit integer of a packed
+    pixel """
+
+    packed = numpy.array(color_to_rgb(color) + (0,), dtype=numpy.uint8)
+
+    return packed.view(numpy.uint32).item()
+
+
+# Packed fill color, visibility and change count every object was
+# drawn with
+COLOR_ARRAYS = (('_colors', (), numpy.uint32), ('_shown', (), bool),
+                ('_changes', (), numpy.int64))
+
+
+class RasterBatch(PolygonBatch):
+    """A PolygonBatch that also keeps the packed color, visibility and
+    change count its objects were drawn with
+    """
+
+    ROW_ARRAYS = PolygonBatch.ROW_ARRAYS + COLOR_ARRAYS
+
+    @property
+    def colors(self):
+        """ The packed color of every object """
+        return self._colors[:len(self.renders)]
+
+    @property
+    def shown(self):
+        """ The visibility of every object """
+        return self._shown[:len(self.renders)]
+
+    @property
+    def changes(self):
+        """ The change count of every render component when drawn """
+        return self._changes[:len(self.renders)]
+
+    def add(self, rend_comp, pos, xyz=None, color=0):
+        """ Adds an object drawn in a packed color """
+
+        super(RasterBatch, self).add(rend_comp, pos, xyz)
+
+        index = len(self.renders) - 1
+        self._colors[index] = color
+        self._shown[index] = rend_comp.visible
+        self._changes[index] = rend_comp.changes
+
+
+class StaticLayer(RowArrays):
+    """The static objects, the pixels they cover and the packed color,
+    visibility and change count they were drawn with
+    """
+
+    ROW_ARRAYS = COLOR_ARRAYS
+
+    def __init__(self):
+        super(StaticLayer, self).__init__()
+
+        self.pixels = []
+
+    @property
+    def colors(self):
+        """ The packed color of every object """
+        return self._colors[:len(self.renders)]
+
+    @property
+    def shown(self):
+        """ The visibility of every object """
+        return self._shown[:len(self.renders)]
+
+    @property
+    def changes(self):
+        """ The change count of every render component when drawn """
+        return self._changes[:len(self.renders)]
+
+    def add(self, rend_comp, pixels, color):
+        """ Adds an object covering the flat image index pixels """
+
+        index = self.append_row(rend_comp)
+
+        self._colors[index] = color
+        self._shown[index] = rend_comp.visible
+        self._changes[index] = rend_comp.changes
+        self.pixels.append(pixels)
+
+    def remove(self, rend_comp):
+        """ Removes an object, returns False if it is not in the layer """
+
+        index = self.find(rend_comp)
+
+        if index < 0:
+            return False
+
+        self.delete_row(index)
+        del self.pixels[index]
+
+        return True
+
+
+class RasterEngine(SharedInstance):
+    """The engine drawing all objects into an RGB array
+    """
+
+    def __init__(self, width=WINDOW_SIZE[0], height=WINDOW_SIZE[1],
+                 hex_radius=HEX_RADIUS, background="#000000"):
+
+        self.hex_radius = hex_radius
+
+        self.hex_width = None
+        self.screen_x_offset = None
+
+        self.hex_height = None
+        self.screen_y_offset = None
+
+        self.size = None
+        self.center_screen_coordinate = None
+        self.packed = None
+        self.image = None
+
+        self.turn_text = None
+        self.callbacks_before_draw = []
+
+        # Packed pixel of every color string drawn so far
+        self.colors = {}
+
+        # Pixel offsets covered by every polygon drawn so far
+        self.masks = {}
+
+        self.background = pack_color(background)
+
+        self.set_window_size(width, height)
+        self.set_hex_radius(hex_radius)
+        self.clear_objects()
+
+    def callback_before_draw(self, method_to_call):
+        """ Methods registered here will be called before every frame is
+        drawn, to derive colors from the state of the simulation """
+
+        if callable(method_to_call):
+            self.callbacks_before_draw.append(method_to_call)
+
+    def clear_objects(self):
+        """ Forgets all objects to render """
+
+        self.objects = []
+        self.batches = {}
+
+        self.statics = StaticLayer()
+
+        # Index into statics of every pixel, len(statics) for background
+        self.labels = None
+
+    def set_hex_radius(self, hex_radius=HEX_RADIUS):
+        """ Sets the hex_radius and calculates the offsets
+        needed for rendering"""
+
+        self.hex_radius = hex_radius
+
+        self.hex_width = self.hex_radius * 2.0
+        self.screen_x_offset = 3 * self.hex_width / 4
+
+        self.hex_height = sqrt(3)/2 * self.hex_width
+        self.screen_y_offset = self.hex_height / 2
+
+        self.place_again()
+
+    def set_window_size(self, width, height):
+        """ Sets the size of the image """
+
+        self.size = [width, height]
+        self.center_screen_coordinate = [self.size[0]/2, self.size[1]/2]
+        self.packed = numpy.zeros(width * height, dtype=numpy.uint32)
+        self.image = self.packed.view(numpy.uint8)\
+            .reshape(height, width, 4)[:, :, :3]
+
+        self.place_again()
+
+    def place_again(self):
+        """ Adds all objects again, after the placement changed """
+
+        objects = getattr(self, 'objects', None)
+
+        if objects:
+            self.clear_objects()
+
+            for rend, pos in objects:
+                self.add_render(rend, pos)
+
+    def set_turn_text(self, turn_text):
+        """ Remembers the turn text, text is not drawn """
+        self.turn_text = turn_text
+
+    def pack(self, color):
+        """ Returns the packed pixel of a color string """
+
+        try:
+            return self.colors[color]
+        except KeyError:
+            packed = pack_color(color)
+            self.colors[color] = packed
+            return packed
+
+    def mask(self, polygon):
+        """ Returns the pixel offsets covered by a polygon """
+
+        key = tuple(polygon)
+
+        if key not in self.masks:
+            self.masks[key] = rasterize_polygon(polygon)
+
+        return self.masks[key]
+
+    def project(self, xyz):
+        """ Returns the pixel of the center of an array of game
+        coordinates, as x and y arrays """
+
+        screen = project_xyz(xyz, self.center_screen_coordinate,
+                             self.screen_x_offset, self.screen_y_offset)
+        pixels = numpy.rint(screen).astype(numpy.int64)
+
+        return pixels[:, 0], pixels[:, 1]
+
+    def pixels(self, polygon, xyz):
+        """ Returns the flat image index of every pixel covered by a
+        polygon placed on an array of game coordinates, one row per
+        coordinate, and whether each pixel lies on the image """
+
+        offset_x, offset_y = self.mask(polygon)
+        center_x, center_y = self.project(xyz)
+
+        pixel_x = center_x[:, None] + offset_x[None, :]
+        pixel_y = center_y[:, None] + offset_y[None, :]
+
+        on_image = (pixel_x >= 0) & (pixel_x < self.size[0]) & \
+            (pixel_y >= 0) & (pixel_y < self.size[1])
+
+        return pixel_y * self.size[0] + pixel_x, on_image
+
+    def add_component(self, gameObject):
+        """ If a component has a render and a position component it is
+        added to the list of objects to render """
+
+        try:
+            rend = gameObject.components['render']
+            pos = gameObject.components['position'].pos
+        except (AttributeError, KeyError, TypeError):
+            return
+
+        self.add_render(rend, pos)
+
+    def add_render(self, rend, pos):
+        """ Adds the render component of an object at a position """
+
+        color = self.pack(rend.fill)
+
+        if rend.static:
+            index, on_image = self.pixels(rend.polygon, [pos.xyz])
+
+            self.statics.add(rend, index[on_image], color)
+            self.labels = None
+        else:
+            key = tuple(rend.polygon)
+            if key not in self.batches:
+                self.batches[key] = RasterBatch(rend.polygon)
+            self.batches[key].add(rend, pos, pos.xyz, color)
+
+        self.objects.append([rend, pos])
+
+    def remove_component(self, gameObject):
+        """ Forgets the render component of a removed object """
+
+        rend = gameObject.components.get('render')
+
+        for entry in self.objects:
+            if entry[0] is rend:
+                self.objects.remove(entry)
+                break
+        else:
+            return
+
+        for batch in self.batches.values():
+            if batch.remove(rend):
+                return
+
+        if self.statics.remove(rend):
+            self.labels = None
+
+    def update_labels(self):
+        """ Computes the static object of every pixel, later objects
+        cover earlier ones """
+
+        self.labels = numpy.full(self.size[0] * self.size[1],
+                                 len(self.statics), dtype=numpy.int32)
+
+        for index, pixels in enumerate(self.statics.pixels):
+            self.labels[pixels] = index
+
+    @staticmethod
+    def update_colors(rows, pack):
+        """ Copies the fill and visibility of the render components that
+        changed since they were last drawn into the color and shown arrays
+        of a StaticLayer or RasterBatch, returns the number of changed
+        objects """
+
+        renders = rows.renders
+
+        changes = numpy.fromiter((rend_comp.changes for rend_comp in renders),
+                                 dtype=numpy.int64, count=len(renders))
+        changed = numpy.flatnonzero(changes != rows.changes).tolist()
+
+        colors = rows.colors
+        shown = rows.shown
+
+        for index in changed:
+            rend_comp = renders[index]
+            colors[index] = pack(rend_comp.fill)
+            shown[index] = rend_comp.visible
+
+        rows.changes[:] = changes
+
+        return len(changed)
+
+    def updateScreen(self):
+        """ Draws a new frame into the image, returns the number of
+        objects that moved or changed since the last frame """
+
+        for method in self.callbacks_before_draw:
+            method()
+
+        updated = self.update_colors(self.statics, self.pack)
+
+        if self.labels is None:
+            self.update_labels()
+
+        # Paint the static objects, hidden ones show the background
+        palette = numpy.append(self.statics.colors,
+                               numpy.uint32(self.background))
+        palette[:len(self.statics)][~self.statics.shown] = self.background
+
+        numpy.take(palette, self.labels, out=self.packed)
+
+        # Paint the moving objects over them
+        for polygon, batch in self.batches.items():
+            updated += self.update_colors(batch, self.pack)
+
+            xyz = batch.gather()
+            updated += len(batch.moved(xyz))
+
+            if not batch.shown.any():
+                continue
+
+            index, on_image = self.pixels(polygon, xyz[batch.shown])
+
+            colors = numpy.broadcast_to(batch.colors[batch.shown][:, None],
+                                        index.shape)
+
+            self.packed[index[on_image]] = colors[on_image]
+
+        return updated
+
+    def frame(self):
+        """ Returns the last drawn frame, an RGB array of shape
+        [height, width, 3] """
+        return self.image
@@ -0,0 +1,146 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Settings Class
+
+########################################################################
+
+Description
+-----------
+The settings of one world. Defaults are read from Engine.GameSettings
+when the settings are created, after that changing the module has no
+effect on the world. Values derived from the settings, like the number
+of tiles and the bounds of the coordinates, are computed once.
+Settings are not changed in place, replace and override return new
+settings so worlds sharing settings do not influence each other """
+
+import copy
+
+import numpy
+
+from Engine import GameSettings
+from Engine.LibHexagonalPosition import calc_tile_count
+from Engine.LibCommon import to_position_steps
+from Engine.PheromoneField import PHEROMONE_TYPES
+
+# The settings of a world and the name of their default in GameSettings
+SETTING_NAMES = {"rings": "MAPSIZE",
+                 "ants": "NUMBER_OF_ANTS",
+                 "pieces_of_food": "PIECES_OF_FOOD",
+                 "swarm": "SWARM_ENGINE",
+                 "seed": "SEED",
+                 "epsilon": "EPSILON",
+                 "ant_defaults": "ANT_DEFAULTS",
+                 "tile_defaults": "TILE_DEFAULTS"}
+
+
+class Settings(object):
+    """The settings of a world and the values derived from them
+    """
+
+    def __init__(self, **values):
+        for name, default in SETTING_NAMES.items():
+            setattr(self, name, copy.deepcopy(getattr(GameSettings, default)))
+
+        for name, value in values.items():
+            if name not in SETTING_NAMES:
+                raise ValueError("Unknown setting %s" % name)
+
+            setattr(self, name, copy.deepcopy(value))
+
+        self.derive()
+
+    def derive(self):
+        """ Computes the values derived from the settings """
+
+        self.kinds = PHEROMONE_TYPES
+        self.tile_count = calc_tile_count(self.rings)
+
+        # Positions stay within these bounds on every axis
+        self.max_coord = self.rings - 1
+        self.max_steps = to_position_steps(self.max_coord)
+
+        decay = self.tile_defaults["DECAY"]
+        self.decay_relative = numpy.array(
+            [decay[kind]["relative"] for kind in self.kinds],
+            dtype=numpy.float64)
+        self.decay_abs_minimum = numpy.array(
+            [decay[kind]["abs_minimum"] for kind in self.kinds],
+            dtype=numpy.float64)
+
+        self.feeding_speed = self.ant_defaults["FEEDING"]["speed"]
+
+    def values(self):
+        """ Returns the settings, without the derived values """
+
+        return dict((name, getattr(self, name)) for name in SETTING_NAMES)
+
+    def replace(self, **values):
+        """ Returns new settings with some settings replaced """
+
+        settings = self.values()
+        settings.update(values)
+
+        return Settings(**settings)
+
+    def override(self, paths):
+        """ Returns new settings with the values of a dict of paths, a path
+        is a setting or its name in GameSettings followed by the keys of
+        the value within it:
+
+            rings
+            ANT_DEFAULTS.BEHAVIOUR.listen_to_pheromone """
+
+        values = copy.deepcopy(self.values())
+
+        for path, value in paths.items():
+            keys = path.split(".")
+            name = get_setting_name(keys[0])
+
+            if len(keys) == 1:
+                values[name] = value
+                continue
+
+            parent = values[name]
+
+            try:
+                for key in keys[1:-1]:
+                    parent = parent[key]
+
+                parent[keys[-1]]
+            except (KeyError, TypeError):
+                raise ValueError("Unknown setting %s" % path)
+
+            parent[keys[-1]] = value
+
+        return Settings(**values)
+
+
+def get_setting_name(name):
+    """ Returns the setting of a setting or of its name in GameSettings """
+
+    if name in SETTING_NAMES:
+        return name
+
+    for setting, default in SETTING_NAMES.items():
+        if default == name:
+            return setting
+
+    raise ValueError("Unknown setting %s, use one of %s" %
+                     (name, ", ".join(sorted(SETTING_NAMES))))
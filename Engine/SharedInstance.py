@@ -0,0 +1,53 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Shared Instance Class
+
+########################################################################
+
+Description
+-----------
+Opt-in replacement of the singleton pattern the engines used to follow.
+Constructing an engine always gives a new, independent engine; code that
+relies on one engine per process asks for Engine.instance() instead """
+
+
+class SharedInstance(object):
+    """Mixin giving a class one shared instance per process
+    """
+
+    @classmethod
+    def instance(cls, *args, **kwargs):
+        """ Returns the shared instance of the class, it is created with
+        the arguments of the first call """
+
+        shared = cls.__dict__.get('_shared_instance')
+
+        if shared is None:
+            shared = cls(*args, **kwargs)
+            cls._shared_instance = shared
+
+        return shared
+
+    @classmethod
+    def reset_instance(cls):
+        """ Forgets the shared instance, the next call of instance
+        creates a new one """
+
+        cls._shared_instance = None
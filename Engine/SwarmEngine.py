@@ -0,0 +1,411 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Swarm Engine Class
+
+########################################################################
+
+Description
+-----------
+Class for a Swarm Engine.
+Stores the state of all ants in parallel arrays (structure of arrays) and
+advances all ants at once: sensing, collisions with food and nest,
+deposit decay, orientation choice and movement. Adopted ants keep their
+position, ai and move components as views on these arrays.
+Positions and speeds are stored as integer steps of 1 / POSITION_STEPS
+tile, like HexagonalPosition, and compared exactly """
+
+import numpy
+
+from Engine.Components import SwarmPositionComponent
+from Engine.Components import SwarmAiComponent
+from Engine.Components import SwarmMoveComponent
+
+from Engine.LibHexagonalPosition import NEIGHBOUR_DELTAS
+from Engine.LibHexagonalPosition import get_tile_index_tables
+from Engine.PheromoneField import PHEROMONE_TYPES
+
+from Engine.SharedInstance import SharedInstance
+from Engine.LibCommon import to_position_steps
+from Engine.GameSettings import MAPSIZE, EPSILON, POSITION_STEPS
+from Engine.GameSettings import ANT_DEFAULTS
+
+# Columns of the stats array
+FOUND_FOOD, CARRYING_FOOD, RETURNED_FOOD = range(3)
+
+
+class SwarmEngine(SharedInstance):
+    """The engine moving all ants on the map
+    """
+
+    def __init__(self):
+
+        self.kinds = list(PHEROMONE_TYPES)
+        self.rings = MAPSIZE
+        self.epsilon = EPSILON
+        self.feeding_speed = ANT_DEFAULTS["FEEDING"]["speed"]
+
+        self.ants = []
+        self.targets = []
+
+        # Tile of every ant on a tile center in the last update
+        self.centered_keys = numpy.zeros(0, dtype=numpy.int64)
+
+        # Draws the batched dice of all ants
+        self.rng = numpy.random
+
+        self.size = 0
+        self.capacity = 0
+
+        self.steps = None
+        self.orientation = None
+        self.speed_steps = None
+        self.interested = None
+        self.deposit = None
+        self.deposit_defaults = None
+        self.deposit_delta = None
+        self.listen_to_pheromone = None
+        self.stats = None
+
+        self.resize(64)
+
+    def resize(self, capacity):
+        """ Grows the arrays to hold at least capacity ants """
+
+        if capacity <= self.capacity:
+            return
+
+        def grow(array, shape, dtype):
+            grown = numpy.zeros(shape, dtype=dtype)
+            if array is not None:
+                grown[:self.size] = array[:self.size]
+            return grown
+
+        kinds = len(self.kinds)
+
+        self.steps = grow(self.steps, (capacity, 3), numpy.int64)
+        self.orientation = grow(self.orientation, capacity, numpy.int64)
+        self.speed_steps = grow(self.speed_steps, capacity, numpy.int64)
+        self.interested = grow(self.interested, capacity, numpy.int64)
+        self.deposit = grow(self.deposit, (capacity, kinds), numpy.float64)
+        self.deposit_defaults = grow(self.deposit_defaults,
+                                     (capacity, kinds), numpy.float64)
+        self.deposit_delta = grow(self.deposit_delta, capacity, numpy.float64)
+        self.listen_to_pheromone = grow(self.listen_to_pheromone,
+                                        capacity, numpy.float64)
+        self.stats = grow(self.stats, (capacity, 3), numpy.int64)
+
+        self.capacity = capacity
+
+    def set_settings(self, settings):
+        """ Uses the map size, slowest moving speed and feeding speed
+        of settings """
+
+        self.rings = settings.rings
+        self.epsilon = settings.epsilon
+        self.feeding_speed = settings.feeding_speed
+
+    def set_map_size(self, rings):
+        """ Sets the number of rings of the map the ants walk on """
+
+        self.rings = rings
+
+    def add_component(self, game_object):
+        """ Ants are adopted by the swarm, food and nests are remembered
+        as targets to collide with """
+
+        try:
+            components = game_object.components
+
+            if 'position' not in components:
+                return
+
+            if 'food' in components or 'nest' in components:
+                self.targets.append(game_object)
+
+            if 'ai' in components and 'move' in components and \
+                    'pheromone_actor' in components and \
+                    not isinstance(components['ai'], SwarmAiComponent):
+                self.adopt(game_object)
+
+        except AttributeError:
+            pass
+
+    def remove_component(self, game_object):
+        """ Forgets a removed food or nest, ants of the swarm can not be
+        removed """
+
+        if any(ant is game_object for ant in self.ants):
+            raise ValueError("Ants advanced by the swarm engine can not be "
+                             "removed")
+
+        self.targets = [target for target in self.targets
+                        if target is not game_object]
+
+    def adopt(self, ant):
+        """ Moves the state of an ant into the swarm arrays and replaces
+        its position, ai and move components by views on the arrays.
+        Sensing, depositing and collisions of the ant are done by the
+        swarm so its pheromone actor and collision components are removed """
+
+        if self.size == self.capacity:
+            self.resize(2 * self.capacity)
+
+        index = self.size
+        self.size += 1
+
+        pos_comp = ant.components['position']
+        ai_comp = ant.components['ai']
+        move_comp = ant.components['move']
+        deposit = ant.components['pheromone_actor'].deposit
+
+        ant.components['position'] = SwarmPositionComponent(ant, self, index)
+        ant.add_component('ai', SwarmAiComponent(ant, self, index))
+        ant.add_component('move', SwarmMoveComponent(ant, self, index))
+
+        del ant.components['pheromone_actor']
+        ant.components.pop('collision', None)
+
+        self.steps[index] = pos_comp.pos.steps
+        self.orientation[index] = pos_comp.orientation
+        self.speed_steps[index] = to_position_steps(move_comp.speed)
+        self.interested[index] = self.kinds.index(ai_comp.interested_in)
+        self.deposit_delta[index] = ai_comp.pheromone_deposit_delta
+        self.listen_to_pheromone[index] = \
+            ai_comp.chances["listen_to_pheromone"]
+
+        for column, kind in enumerate(self.kinds):
+            self.deposit[index, column] = deposit.get(kind, 0.0)
+            self.deposit_defaults[index, column] = \
+                ai_comp.deposit_defaults[kind]
+
+        self.stats[index] = (ai_comp.stats.found_food,
+                             ai_comp.stats.carrying_food,
+                             ai_comp.stats.returned_food)
+
+        self.ants.append(ant)
+
+    def get_xyz(self, rows):
+        """ Returns the x y z coordinates in tiles of the ants at rows """
+
+        return self.steps[rows] / float(POSITION_STEPS)
+
+    def tile_keys(self, steps):
+        """ Returns the tile index of an array of tile center positions
+        in steps """
+
+        index_of_xy = get_tile_index_tables(self.rings)[0]
+        offset = max(self.rings - 1, 0)
+
+        pos = steps[:, :2] // POSITION_STEPS + offset
+
+        return index_of_xy[pos[:, 0], pos[:, 1]]
+
+    def centered(self):
+        """ Returns the indices of all ants that are on a tile center """
+
+        off_center = self.steps[:self.size] % POSITION_STEPS != 0
+
+        return numpy.flatnonzero(~off_center.any(axis=1))
+
+    def update(self, pheromone_engine):
+        """ Advances all ants, equal to calling update on the ai and move
+        component of every ant """
+
+        if self.size == 0:
+            return
+
+        centered = self.centered()
+        self.centered_keys = numpy.zeros(0, dtype=numpy.int64)
+
+        if len(centered):
+            keys = self.tile_keys(self.steps[centered])
+            self.centered_keys = keys
+
+            self.act_on_collisions(centered, keys)
+            self.update_deposit_levels(centered)
+            self.choose_orientations(centered, keys, pheromone_engine)
+
+        self.move()
+
+    def act_on_collisions(self, centered, keys):
+        """ Lets the ants on the tile of a food or nest act on it,
+        in the order the targets were added """
+
+        target_steps = [target.components['position'].pos.steps
+                        for target in self.targets]
+        target_keys = self.tile_keys(numpy.array(target_steps,
+                                                 dtype=numpy.int64)
+                                     .reshape(-1, 3)).tolist()
+
+        hits = numpy.flatnonzero(numpy.isin(keys, target_keys))
+
+        for hit in hits.tolist():
+            index = centered.item(hit)
+
+            for target, target_key in zip(self.targets, target_keys):
+                if target_key != keys.item(hit):
+                    continue
+
+                if 'food' in target.components:
+                    self.found_food(index, target)
+
+                if 'nest' in target.components:
+                    self.found_nest(index)
+
+    def found_food(self, index, food_obj):
+        """ Same as AiComponent.found_food for the ant at index """
+
+        if self.kinds[self.interested[index]] == "food":
+
+            food_comp = food_obj.components['food']
+            food = food_comp.take_food(self.feeding_speed)
+
+            self.stats[index, FOUND_FOOD] += food
+            self.stats[index, CARRYING_FOOD] += food
+
+            if food > 0:
+                self.interested[index] = self.kinds.index("home")
+                self.ants[index].components["render"].fill = "#000066"
+
+        self.reset_deposit_levels(index)
+
+    def found_nest(self, index):
+        """ Same as AiComponent.found_nest for the ant at index """
+
+        if self.kinds[self.interested[index]] == "home":
+            self.interested[index] = self.kinds.index("food")
+            self.ants[index].components["render"].fill = "#000000"
+
+            self.stats[index, RETURNED_FOOD] += self.stats[index,
+                                                           CARRYING_FOOD]
+            self.stats[index, CARRYING_FOOD] = 0
+
+        self.reset_deposit_levels(index)
+
+    def reset_deposit_levels(self, index):
+        """ Same as AiComponent.reset_pheromone_deposit_levels """
+
+        self.deposit[index] = self.deposit_defaults[index]
+        self.deposit[index, self.interested[index]] = 0.0
+
+    def update_deposit_levels(self, centered):
+        """ Same as AiComponent.update_pheromone_deposit_levels for all
+        centered ants """
+
+        deposit = self.deposit[centered]
+        deposit -= self.deposit_delta[centered, None]
+        numpy.maximum(deposit, 0.0, out=deposit)
+
+        deposit[numpy.arange(len(centered)), self.interested[centered]] = 0.0
+
+        self.deposit[centered] = deposit
+
+    def choose_orientations(self, centered, keys, pheromone_engine):
+        """ Chooses a new orientation for all centered ants, following
+        the pheromone they are interested in or at random. Ties between
+        the highest levels are broken at random, without any positive level
+        every direction is equally likely """
+
+        count = len(centered)
+        levels, valid = pheromone_engine.gather_levels(keys)
+
+        interested = self.interested[centered]
+        sensed = numpy.zeros((count, 6), dtype=numpy.float64)
+        for column, kind in enumerate(self.kinds):
+            rows = interested == column
+            sensed[rows] = levels[kind][rows]
+
+        sensed[~valid] = -numpy.inf
+
+        highest = sensed.max(axis=1)
+        candidates = (sensed == highest[:, None]) & (highest > 0.0)[:, None]
+        candidates[highest <= 0.0] = True
+
+        tie_breaks = numpy.where(candidates,
+                                 self.rng.random_sample((count, 6)), -1.0)
+        pheromone_direction = tie_breaks.argmax(axis=1)
+
+        random_direction = self.rng.randint(0, 6, count)
+
+        listen = self.rng.random_sample(count) <= \
+            self.listen_to_pheromone[centered]
+
+        self.orientation[centered] = numpy.where(listen,
+                                                 pheromone_direction,
+                                                 random_direction)
+
+    def move(self):
+        """ Moves all ants, ants that would walk off the map stay in
+        place and turn around """
+
+        size = self.size
+        steps = self.steps[:size]
+        orientation = self.orientation[:size]
+        speed_steps = self.speed_steps[:size]
+
+        moving = speed_steps >= self.epsilon * POSITION_STEPS
+
+        deltas = numpy.array(NEIGHBOUR_DELTAS, dtype=numpy.int64)
+        new_steps = steps + deltas[orientation] * speed_steps[:, None]
+
+        max_steps = to_position_steps(self.rings - 1)
+        off_map = (numpy.abs(new_steps) > max_steps).any(axis=1)
+
+        stepping = moving & ~off_map
+        steps[stepping] = new_steps[stepping]
+
+        turning = moving & off_map
+        orientation[turning] = (orientation[turning] + 3) % 6
+
+    def deposit_pheromones(self, pheromone_engine):
+        """ Deposits the pheromones of all centered ants on their tile,
+        called after the holders of the pheromone engine are updated """
+
+        if self.size == 0:
+            return
+
+        centered = self.centered()
+        keys = self.tile_keys(self.steps[centered])
+
+        for column, kind in enumerate(self.kinds):
+            pheromone_engine.field.add_levels(kind, keys,
+                                              self.deposit[centered, column])
+
+    def count_crowded(self, cells):
+        """ Returns the number of tiles holding more than one of the ants
+        centered in the last update and the colliders on a list of cells,
+        like the crowded cells of the CollisionEngine """
+
+        keys = numpy.concatenate((self.centered_keys,
+                                  numpy.array(cells, dtype=numpy.int64)))
+
+        if not len(keys):
+            return 0
+
+        return int((numpy.bincount(keys) > 1).sum())
+
+    def get_stats(self):
+        """ Returns the summed found, carried and returned food """
+
+        totals = self.stats[:self.size].sum(axis=0).tolist()
+
+        return {"found_food": totals[FOUND_FOOD],
+                "carrying_food": totals[CARRYING_FOOD],
+                "returned_food": totals[RETURNED_FOOD]}
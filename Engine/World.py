@@ -0,0 +1,89 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ World Class
+
+########################################################################
+
+Description
+-----------
+A world is one simulation: a map with a colony, the engines advancing it
+and the settings it was built with. Worlds share no state, so any number
+of them can be created and run side by side in one process """
+
+from Engine.GameEngine import GameEngine
+from Engine.Settings import Settings
+
+
+class World(object):
+    """A simulation owning its settings and game engine, and through it
+    all other engines. Settings given as keywords replace those of settings:
+
+        World(rings=30, ants=1000, seed=1)
+    """
+
+    def __init__(self, settings=None, **values):
+        if settings is None:
+            settings = Settings()
+
+        if values:
+            settings = settings.replace(**values)
+
+        self.settings = settings
+
+        self.turn = 0
+        self.game_engine = GameEngine(settings=settings)
+
+    @property
+    def pheromone_engine(self):
+        """ The pheromone engine of the world """
+        return self.game_engine.pheromone_engine
+
+    @property
+    def collision_engine(self):
+        """ The collision engine of the world """
+        return self.game_engine.collision_engine
+
+    @property
+    def swarm_engine(self):
+        """ The swarm engine of the world, None without swarm """
+        return self.game_engine.swarm_engine
+
+    @property
+    def profiler(self):
+        """ The profiler of the game loop of the world """
+        return self.game_engine.profiler
+
+    def initialize(self):
+        """ Sets up the engines and creates the map and colony """
+
+        self.game_engine.initialize_engines()
+        self.game_engine.initialize_objects()
+
+    def update(self):
+        """ Advances the world by one turn """
+
+        self.game_engine.update()
+        self.turn += 1
+
+    def run(self, turns):
+        """ Advances the world by a number of turns """
+
+        for _ in range(turns):
+            self.update()
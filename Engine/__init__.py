@@ -28,8 +28,8 @@ Description
 Needed for importing classes in the module """
 
 from Engine.GameEngine import GameEngine
-from Engine.GraphicsEngine import GraphicsEngine
 from Engine.PheromoneEngine import PheromoneEngine
+from Engine.World import World
 
 from Engine.GameObject import GameObject
 from Engine.GameObjectFactory import GameObjectFactory
@@ -0,0 +1,32 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Benchmark module init script
+
+########################################################################
+
+Description
+-----------
+Benchmarks of the engines over a grid of map sizes and ant counts,
+run with python -m Engine.bench """
+
+from Engine.bench.benchmark import run_case, run_benchmark, measure_memory
+from Engine.bench.benchmark import compare_results, find_regressions
+from Engine.bench.benchmark import run_decay_case, run_decay_benchmark
+from Engine.bench.stub import StubCanvas, create_stub_graphics_engine
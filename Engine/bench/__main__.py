@@ -0,0 +1,116 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Benchmark command line
+
+########################################################################
+
+Description
+-----------
+python -m Engine.bench --rings 15 30 --ants 150 1000 --output new.json \
+    --compare old.json
+
+Exits with 1 if a timing regressed compared to the baseline.
+With --trails the decay of large maps with pheromone trails of these
+lengths is timed instead:
+
+python -m Engine.bench --rings 60 120 240 --trails 100 1000 10000 """
+
+import argparse
+import sys
+
+from Engine.bench.benchmark import MAP_SIZES, ANT_COUNTS, REGRESSION_THRESHOLD
+from Engine.bench.benchmark import run_benchmark, find_regressions
+from Engine.bench.benchmark import run_decay_benchmark
+from Engine.bench.benchmark import load_results, write_results
+
+
+def parse_args(argv=None):
+    """ Returns the parsed command line arguments """
+
+    parser = argparse.ArgumentParser(
+        description="Times the engines over map sizes and ant counts")
+
+    parser.add_argument("--rings", type=int, nargs="+", default=MAP_SIZES,
+                        help="map sizes in rings")
+    parser.add_argument("--ants", type=int, nargs="+", default=ANT_COUNTS,
+                        help="numbers of ants")
+    parser.add_argument("--turns", type=int, default=10,
+                        help="turns timed per case")
+    parser.add_argument("--trails", type=int, nargs="+", default=None,
+                        help="time the pheromone decay of trails of these "
+                             "lengths instead")
+    parser.add_argument("--swarm", action="store_true",
+                        help="advance all ants with the swarm engine")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed of the random streams of every case")
+    parser.add_argument("--no-render", action="store_true",
+                        help="do not time drawing on a stub canvas")
+    parser.add_argument("--raster", action="store_true",
+                        help="time drawing with the RasterEngine")
+    parser.add_argument("--memory", action="store_true",
+                        help="also measure the bytes per game object")
+    parser.add_argument("--output", default="-",
+                        help="json file for the results, - for stdout")
+    parser.add_argument("--compare", default=None,
+                        help="json file of a baseline run")
+    parser.add_argument("--threshold", type=float,
+                        default=REGRESSION_THRESHOLD,
+                        help="allowed relative slowdown")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """ Runs the benchmark, returns the exit code """
+
+    args = parse_args(argv)
+
+    if args.trails:
+        write_results(run_decay_benchmark(args.rings, args.trails,
+                                          args.turns, log=sys.stderr,
+                                          seed=args.seed), args.output)
+        return 0
+
+    results = run_benchmark(args.rings, args.ants, args.turns,
+                            args.swarm, not args.no_render, log=sys.stderr,
+                            seed=args.seed, memory=args.memory,
+                            raster=args.raster)
+    write_results(results, args.output)
+
+    if args.compare is None:
+        return 0
+
+    regressions = find_regressions(load_results(args.compare), results,
+                                   args.threshold)
+
+    for rings, ants, swarm, name, old, new in regressions:
+        if name.startswith("memory."):
+            change = "%.0f bytes -> %.0f bytes" % (old, new)
+        else:
+            change = "%.3f ms -> %.3f ms" % (1e3 * old, 1e3 * new)
+
+        sys.stderr.write("rings %d ants %d swarm %s %s: %s\n"
+                         % (rings, ants, swarm, name, change))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,351 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Benchmark
+
+########################################################################
+
+Description
+-----------
+Builds worlds of a number of rings and ants, times creating them, every
+phase of a tick and drawing on a stub canvas or with the RasterEngine.
+Results are json so runs of different commits can be compared.
+The decay benchmark times the pheromone decay of large maps with a trail
+of a number of tiles, decaying only the trail against the whole map """
+
+import json
+import platform
+import subprocess
+import sys
+
+from time import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import numpy
+
+from Engine.GameEngine import GameEngine
+from Engine.PheromoneField import PheromoneField
+from Engine.LibHexagonalPosition import calc_tile_count
+from Engine.Settings import Settings
+
+MAP_SIZES = (15, 30, 60, 120)
+ANT_COUNTS = (150, 1000, 10000, 100000)
+TRAIL_LENGTHS = (100, 1000, 10000)
+
+# A case is slower if a timing grew by more than this fraction
+REGRESSION_THRESHOLD = 0.2
+
+
+def measure_memory(rings, ants, swarm=False, seed=0):
+    """ Returns the bytes allocated to build a world and the bytes per game
+    object, None without tracemalloc. Built apart from the timed world,
+    tracing slows down the allocations """
+
+    if tracemalloc is None:
+        return None
+
+    tracemalloc.start()
+
+    try:
+        game_engine = GameEngine(settings=Settings(rings=rings, ants=ants,
+                                                   swarm=swarm, seed=seed))
+        game_engine.initialize_engines()
+        game_engine.create_map()
+        game_engine.create_colony()
+
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return {"bytes": allocated,
+            "objects": len(game_engine.objects),
+            "bytes_per_object": float(allocated) / len(game_engine.objects)}
+
+
+def run_case(rings, ants, turns=10, swarm=False, render=True, seed=0,
+             memory=False, raster=False):
+    """ Builds a world and runs it for a number of turns, returns the
+    timings in seconds. Phases are the mean over the turns, every case
+    with the same seed runs the same world. With memory the bytes used
+    by the world are measured as well. With raster the frames are drawn
+    by the RasterEngine instead of on a stub canvas """
+
+    settings = Settings(rings=rings, ants=ants, swarm=swarm, seed=seed)
+    game_engine = GameEngine(settings=settings)
+
+    graphics_engine = None
+    if render and raster:
+        from Engine.RasterEngine import RasterEngine
+        graphics_engine = RasterEngine()
+        game_engine.callback_for_new_object(graphics_engine.add_component)
+    elif render:
+        try:
+            from Engine.bench.stub import create_stub_graphics_engine
+            graphics_engine = create_stub_graphics_engine()
+            game_engine.callback_for_new_object(graphics_engine.add_component)
+        except ImportError:
+            pass
+
+    if graphics_engine is not None:
+        graphics_engine.callback_before_draw(
+            game_engine.pheromone_engine.update_colors)
+
+    game_engine.initialize_engines()
+
+    start = time()
+    game_engine.create_map()
+    create_map = time() - start
+
+    start = time()
+    game_engine.create_colony()
+    create_colony = time() - start
+
+    profiler = game_engine.profiler
+    profiler.window = turns
+    profiler.enable()
+
+    render = 0.0
+    canvas_calls = 0
+
+    for turn in range(turns):
+        game_engine.update()
+
+        if graphics_engine is not None:
+            calls = 0 if raster else graphics_engine.win.calls
+
+            start = time()
+            graphics_engine.updateScreen()
+            render += time() - start
+
+            if not raster:
+                canvas_calls += graphics_engine.win.calls - calls
+
+    profiler.disable()
+    report = profiler.report()
+
+    phases = dict((phase, stats["mean"])
+                  for phase, stats in report["phases"].items())
+    counters = dict((name, stats["mean"])
+                    for name, stats in report["counters"].items())
+
+    if graphics_engine is not None:
+        phases['render'] = render / turns
+
+        if not raster:
+            counters['canvas_calls'] = float(canvas_calls) / turns
+
+    result = {"rings": rings,
+              "ants": ants,
+              "turns": turns,
+              "swarm": swarm,
+              "create_map": create_map,
+              "create_colony": create_colony,
+              "initialize_objects": create_map + create_colony,
+              "tick": sum(stats["mean"]
+                          for stats in report["phases"].values()),
+              "phases": phases,
+              "counters": counters}
+
+    if memory:
+        result["memory"] = measure_memory(rings, ants, swarm, seed)
+
+    return result
+
+
+def run_decay_case(rings, trail, turns=100, seed=0):
+    """ Times the decay of a field of a map of rings with pheromones on
+    trail random tiles, returns the mean seconds per update when only the
+    active tiles decay and when every tile decays """
+
+    settings = Settings(rings=rings)
+    tiles = calc_tile_count(rings)
+    trail = min(trail, tiles)
+
+    rng = numpy.random.RandomState(seed)
+    keys = rng.choice(tiles, trail, replace=False)
+
+    def create_field():
+        field = PheromoneField(tiles, settings.kinds)
+        field.set_uniform_decay(settings.decay_relative,
+                                settings.decay_abs_minimum)
+
+        # Levels high enough to stay on the trail while timed
+        for kind in field.kinds:
+            field.add_levels(kind, keys, numpy.full(trail, 1e9))
+
+        return field
+
+    timed = {}
+    for name in ("update", "update_all"):
+        field = create_field()
+        update = getattr(field, name)
+
+        start = time()
+        for turn in range(turns):
+            update()
+        timed[name] = (time() - start) / turns
+
+    return {"rings": rings,
+            "tiles": tiles,
+            "trail": trail,
+            "turns": turns,
+            "active": timed["update"],
+            "all": timed["update_all"]}
+
+
+def run_decay_benchmark(map_sizes=MAP_SIZES, trails=TRAIL_LENGTHS, turns=100,
+                        log=None, seed=0):
+    """ Runs a decay case for every combination of map size and trail
+    length, returns the results with a description of the machine """
+
+    results = []
+
+    for rings in map_sizes:
+        for trail in trails:
+            result = run_decay_case(rings, trail, turns, seed)
+            results.append(result)
+
+            if log is not None:
+                log.write("rings %4d trail %7d: active %8.3f ms, "
+                          "all %8.3f ms\n" %
+                          (rings, result["trail"], 1e3 * result["active"],
+                           1e3 * result["all"]))
+
+    return {"revision": get_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "decay": results}
+
+
+def get_revision():
+    """ Returns the git commit of the working directory, if known """
+
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.STDOUT).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(map_sizes=MAP_SIZES, ant_counts=ANT_COUNTS, turns=10,
+                  swarm=False, render=True, log=None, seed=0, memory=False,
+                  raster=False):
+    """ Runs a case for every combination of map size and ant count,
+    returns the results with a description of the machine """
+
+    results = []
+
+    for rings in map_sizes:
+        for ants in ant_counts:
+            result = run_case(rings, ants, turns, swarm, render, seed,
+                              memory, raster)
+            results.append(result)
+
+            if log is not None:
+                log.write("rings %4d ants %7d: tick %8.2f ms" %
+                          (rings, ants, 1e3 * result["tick"]))
+
+                if result.get("memory"):
+                    log.write(", %6.0f bytes per object" %
+                              result["memory"]["bytes_per_object"])
+
+                log.write("\n")
+
+    return {"revision": get_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results}
+
+
+def case_key(result):
+    """ Returns what identifies a case in the results """
+    return (result["rings"], result["ants"], result["swarm"])
+
+
+def timings(result):
+    """ Returns the compared timings of a case as a flat dict """
+
+    flat = {"create_map": result["create_map"],
+            "create_colony": result["create_colony"],
+            "tick": result["tick"]}
+
+    for phase, seconds in result["phases"].items():
+        flat["phases." + phase] = seconds
+
+    # Memory is compared like a timing, more is worse
+    if result.get("memory"):
+        flat["memory.bytes_per_object"] = result["memory"]["bytes_per_object"]
+
+    return flat
+
+
+def compare_results(baseline, current):
+    """ Returns a (rings, ants, swarm, timing, baseline, current) row for
+    every timing of the cases present in both results """
+
+    baseline_cases = dict((case_key(result), result)
+                          for result in baseline["results"])
+    rows = []
+
+    for result in current["results"]:
+        key = case_key(result)
+
+        if key not in baseline_cases:
+            continue
+
+        old = timings(baseline_cases[key])
+        new = timings(result)
+
+        for name in sorted(new):
+            if name in old:
+                rows.append(key + (name, old[name], new[name]))
+
+    return rows
+
+
+def find_regressions(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """ Returns the rows of compare_results that are slower than the
+    baseline by more than the threshold """
+
+    return [row for row in compare_results(baseline, current)
+            if row[4] > 0 and row[5] > row[4] * (1.0 + threshold)]
+
+
+def load_results(path):
+    """ Returns the results stored in a json file """
+
+    with open(path) as results_file:
+        return json.load(results_file)
+
+
+def write_results(results, path):
+    """ Stores results in a json file, - for stdout """
+
+    if path == "-":
+        json.dump(results, sys.stdout, indent=1, sort_keys=True)
+        sys.stdout.write("\n")
+        return
+
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=1, sort_keys=True)
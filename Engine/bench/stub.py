@@ -0,0 +1,71 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Stub canvas
+
+########################################################################
+
+Description
+-----------
+A canvas that counts the drawing calls instead of drawing, so the render
+path of the GraphicsEngine can be timed without a display """
+
+
+class StubCanvas(object):
+    """Counts the calls a Tkinter canvas would get
+    """
+
+    def __init__(self):
+        self.items = 0
+        self.calls = 0
+
+    def create_polygon(self, *args, **kwargs):
+        """ Returns the id of a new item """
+        self.items += 1
+        self.calls += 1
+        return self.items
+
+    def coords(self, *args, **kwargs):
+        """ Counts moving an item """
+        self.calls += 1
+
+    def itemconfig(self, *args, **kwargs):
+        """ Counts configuring an item """
+        self.calls += 1
+
+    itemconfigure = itemconfig
+
+    def delete(self, *args):
+        """ Counts deleting an item """
+        self.calls += 1
+
+    def update(self):
+        """ Nothing to process """
+        pass
+
+    update_idletasks = update
+
+
+def create_stub_graphics_engine():
+    """ Returns a GraphicsEngine drawing on a stub canvas, no window is
+    created. Tkinter must be installed, but no display is needed """
+
+    from Engine.GraphicsEngine import GraphicsEngine
+
+    return GraphicsEngine(canvas=StubCanvas())
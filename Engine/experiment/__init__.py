@@ -0,0 +1,30 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Experiment module init script
+
+########################################################################
+
+Description
+-----------
+Runs headless simulations over a grid of settings in a process pool,
+run with python -m Engine.experiment """
+
+from Engine.experiment.sweep import expand_grid
+from Engine.experiment.sweep import run_experiment, run_sweep, write_table
@@ -0,0 +1,114 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Experiment command line
+
+########################################################################
+
+Description
+-----------
+python -m Engine.experiment \
+    --set ANT_DEFAULTS.BEHAVIOUR.listen_to_pheromone=0.5,0.65,0.8 \
+    --set TILE_DEFAULTS.DECAY.food.relative=0.01,0.02 \
+    --seeds 0 1 2 --turns 1000 --output results.csv """
+
+import argparse
+import json
+import sys
+
+from Engine.experiment.sweep import run_sweep, write_table
+from Engine.GameSettings import MAPSIZE, NUMBER_OF_ANTS, PIECES_OF_FOOD
+
+
+def parse_value(text):
+    """ Returns a value of the command line as json, or as text """
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def parse_grid(assignments):
+    """ Returns the grid of a list of PATH=VALUE,VALUE assignments """
+
+    grid = {}
+
+    for assignment in assignments:
+        path, separator, values = assignment.partition("=")
+
+        if not separator or not values:
+            raise argparse.ArgumentTypeError(
+                "%s is not of the form PATH=VALUE,VALUE" % assignment)
+
+        grid[path] = [parse_value(value) for value in values.split(",")]
+
+    return grid
+
+
+def parse_args(argv=None):
+    """ Returns the parsed command line arguments """
+
+    parser = argparse.ArgumentParser(
+        description="Runs the simulation over a grid of settings")
+
+    parser.add_argument("--set", action="append", default=[],
+                        metavar="PATH=VALUE,VALUE", dest="settings",
+                        help="values of a setting, by its path like "
+                             "ANT_DEFAULTS.BEHAVIOUR.listen_to_pheromone")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0],
+                        help="every combination is run once per seed")
+    parser.add_argument("--turns", type=int, default=1000,
+                        help="turns per run")
+    parser.add_argument("--rings", type=int, default=MAPSIZE,
+                        help="map size in rings")
+    parser.add_argument("--ants", type=int, default=NUMBER_OF_ANTS,
+                        help="number of ants")
+    parser.add_argument("--food", type=int, default=PIECES_OF_FOOD,
+                        help="pieces of food")
+    parser.add_argument("--swarm", action="store_true",
+                        help="advance all ants with the swarm engine")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes, one per core by default")
+    parser.add_argument("--output", default="-",
+                        help="csv file for the results, - for stdout")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """ Runs the sweep and writes the results table, returns the exit code """
+
+    args = parse_args(argv)
+
+    try:
+        grid = parse_grid(args.settings)
+        rows = run_sweep(grid, args.seeds, args.turns, args.rings, args.ants,
+                         args.food, args.swarm, args.processes)
+    except (argparse.ArgumentTypeError, ValueError) as error:
+        sys.stderr.write("%s\n" % error)
+        return 2
+
+    write_table(rows, args.output)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
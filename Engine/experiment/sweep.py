@@ -0,0 +1,161 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Parameter sweep
+
+########################################################################
+
+Description
+-----------
+Expands a grid of settings into independent runs and runs them in a
+process pool, every run builds a world with its own settings. Settings are
+named by their path, see Engine.Settings.Settings.override:
+
+    MAPSIZE
+    ANT_DEFAULTS.BEHAVIOUR.listen_to_pheromone
+    TILE_DEFAULTS.DECAY.food.relative """
+
+import csv
+import itertools
+import multiprocessing
+import sys
+
+from time import time
+
+from Engine.World import World
+from Engine.Settings import Settings
+from Engine.GameSettings import MAPSIZE, NUMBER_OF_ANTS, PIECES_OF_FOOD
+from Engine.run import summarize_stats
+
+# Columns of the results table before the swept settings
+COLUMNS = ("run", "seed", "turns", "rings", "ants", "swarm")
+
+# Columns of the results table after the swept settings
+METRICS = ("found_food", "returned_food", "returned_food_per_tick",
+           "first_food_found", "first_food_returned", "seconds")
+
+
+def expand_grid(grid, seeds=(0,)):
+    """ Returns a dict of settings for every combination of the values in
+    the grid, a dict of setting path to list of values, once per seed """
+
+    names = sorted(grid)
+
+    runs = []
+    for values in itertools.product(*[grid[name] for name in names]):
+        for seed in seeds:
+            runs.append((dict(zip(names, values)), seed))
+
+    return runs
+
+
+def run_experiment(run):
+    """ Runs one world of a run description and returns its row of the
+    results table. Food is counted after every tick, the first found and
+    returned food are the tick numbers, None if it never happened """
+
+    paths = run["settings"]
+    turns = run["turns"]
+
+    settings = Settings(rings=run["rings"], ants=run["ants"],
+                        pieces_of_food=run["food"], swarm=run["swarm"],
+                        seed=run["seed"]).override(paths)
+
+    world = World(settings)
+    world.initialize()
+    game_engine = world.game_engine
+
+    first_found = None
+    first_returned = None
+
+    start = time()
+
+    for tick in range(1, turns + 1):
+        game_engine.update()
+
+        if first_returned is None:
+            stats = summarize_stats(game_engine)
+
+            if first_found is None and stats["found_food"]:
+                first_found = tick
+            if stats["returned_food"]:
+                first_returned = tick
+
+    seconds = time() - start
+    stats = summarize_stats(game_engine)
+
+    row = {"run": run["run"], "turns": turns, "rings": settings.rings,
+           "ants": settings.ants, "swarm": settings.swarm,
+           "seed": settings.seed}
+    row.update(paths)
+    row.update({"found_food": stats["found_food"],
+                "returned_food": stats["returned_food"],
+                "returned_food_per_tick":
+                    float(stats["returned_food"]) / turns if turns else 0.0,
+                "first_food_found": first_found,
+                "first_food_returned": first_returned,
+                "seconds": seconds})
+
+    return row
+
+
+def run_sweep(grid, seeds=(0,), turns=1000, rings=MAPSIZE,
+              ants=NUMBER_OF_ANTS, food=PIECES_OF_FOOD, swarm=False,
+              processes=None):
+    """ Runs every combination of the grid once per seed in a pool of
+    processes, one per core by default. Returns the rows of the results
+    table in the order of the grid """
+
+    runs = []
+    for number, (settings, seed) in enumerate(expand_grid(grid, seeds)):
+        runs.append({"run": number, "seed": seed, "turns": turns,
+                     "rings": rings, "ants": ants, "food": food,
+                     "swarm": swarm, "settings": settings})
+
+    # Fail before starting the pool on a misspelled setting
+    Settings().override(dict((path, values[0])
+                             for path, values in grid.items() if values))
+
+    if processes == 1:
+        return [run_experiment(run) for run in runs]
+
+    pool = multiprocessing.Pool(processes)
+
+    try:
+        return pool.map(run_experiment, runs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def write_table(rows, path="-"):
+    """ Writes the results as csv, to stdout for - """
+
+    names = sorted(set(itertools.chain(*rows)) -
+                   set(COLUMNS) - set(METRICS))
+
+    output = sys.stdout if path == "-" else open(path, "w")
+
+    try:
+        writer = csv.DictWriter(output, list(COLUMNS) + names + list(METRICS))
+        writer.writeheader()
+        writer.writerows(rows)
+    finally:
+        if output is not sys.stdout:
+            output.close()
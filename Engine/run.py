@@ -0,0 +1,369 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Simulation runner
+
+########################################################################
+
+Description
+-----------
+Runs the simulation, with or without a window.
+Headless runs never import Tkinter, so they can be used on servers:
+
+    python -m Engine.run --headless --turns 1000 --snapshot-every 100 \
+        --snapshot-file snapshots.jsonl
+
+Headless runs can draw frames with the RasterEngine, as PNG images or as
+one uncompressed RGB stream:
+
+    python -m Engine.run --headless --frames frames/%06d.png --frames-every 10
+    python -m Engine.run --headless --frames frames.rgb --frames-every 10 """
+
+import argparse
+import json
+import sys
+
+from time import time
+
+from Engine.World import World
+from Engine.FrameScheduler import FrameScheduler
+from Engine.Profiler import Profiler
+from Engine.LibSnapshot import write_snapshot, restore_snapshot
+from Engine.LibImage import FrameWriter
+from Engine.GameSettings import TURNS, SWARM_ENGINE, SEED
+from Engine.GameSettings import TICKS_PER_FRAME, TARGET_FPS
+
+
+def parse_args(argv=None):
+    """ Returns the parsed command line arguments """
+
+    parser = argparse.ArgumentParser(description="Runs the HexACO simulation")
+
+    parser.add_argument("--headless", action="store_true",
+                        help="run without a window")
+    parser.add_argument("--turns", type=int, default=TURNS,
+                        help="number of turns, 0 runs until interrupted")
+    parser.add_argument("--swarm", action="store_true", default=SWARM_ENGINE,
+                        help="advance all ants with the swarm engine")
+    parser.add_argument("--seed", type=int, default=SEED,
+                        help="seed of the random streams, runs with the "
+                             "same seed are the same")
+    parser.add_argument("--ticks-per-frame", type=int,
+                        default=TICKS_PER_FRAME,
+                        help="turns simulated per drawn frame")
+    parser.add_argument("--fps", type=float, default=TARGET_FPS,
+                        help="target frame rate, the turns per frame are "
+                             "adapted to it, 0 for a fixed number of turns")
+    parser.add_argument("--checkpoint-every", type=int, default=0,
+                        help="write the world to the checkpoint file every "
+                             "this many turns")
+    parser.add_argument("--checkpoint", default="hexaco.snapshot",
+                        help="file the checkpoints are written to")
+    parser.add_argument("--restore", default=None,
+                        help="continue the run saved in a checkpoint, "
+                             "use the same settings, the seed may differ")
+    parser.add_argument("--record-pheromones", default=None, metavar="FILE",
+                        help="write the pheromone levels to a history file")
+    parser.add_argument("--record-every", type=int, default=1,
+                        help="record the pheromone levels every this many "
+                             "turns")
+    parser.add_argument("--frames", default=None, metavar="PATH",
+                        help="draw frames without a window, a .rgb file "
+                             "gets an uncompressed stream, else PNG images "
+                             "are written to PATH %% turn, e.g. "
+                             "frames/%%06d.png")
+    parser.add_argument("--frames-every", type=int, default=1,
+                        help="draw a frame every this many turns")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the time spent per phase at the end")
+    parser.add_argument("--profile-file", default=None,
+                        help="file the timings of every tick are written "
+                             "to as json lines, implies --profile")
+    parser.add_argument("--snapshot-every", type=int, default=0,
+                        help="write a snapshot every this many turns")
+    parser.add_argument("--snapshot-file", default=None,
+                        help="file the snapshots are written to as json "
+                             "lines, stdout if not given")
+
+    return parser.parse_args(argv)
+
+
+def summarize_stats(game_engine):
+    """ Returns the found, carried and returned food of all ants """
+
+    totals = {"found_food": 0, "carrying_food": 0, "returned_food": 0}
+
+    for obj in game_engine.objects.values():
+        if 'ai' in obj.components:
+            stats = obj.components['ai'].stats
+
+            for key in totals:
+                totals[key] += getattr(stats, key)
+
+    return totals
+
+
+def snapshot(game_engine, turn):
+    """ Returns a json serializable snapshot of the simulation """
+
+    ants = []
+    food = []
+
+    for obj in game_engine.objects.values():
+        components = obj.components
+
+        if 'ai' in components:
+            ants.append(list(components['position'].xyz()))
+
+        if 'food' in components:
+            food.append({"xyz": list(components['position'].xyz()),
+                         "amount": components['food'].amount})
+
+    return {"turn": turn,
+            "stats": summarize_stats(game_engine),
+            "ants": ants,
+            "food": food}
+
+
+def run_headless(turns=TURNS, swarm=SWARM_ENGINE,
+                 snapshot_every=0, snapshot_file=None, profiler=None,
+                 seed=SEED, checkpoint_every=0, checkpoint_path=None,
+                 restore_path=None, record_path=None, record_every=1,
+                 frames_path=None, frames_every=1):
+    """ Runs the simulation without a window, returns the number of ticks,
+    the number of seconds they took and the summed stats of all ants.
+    An enabled profiler replaces the one of the game engine.
+    Every checkpoint_every turns the world is written to checkpoint_path,
+    a run restored from restore_path continues at the turn it was saved
+    and stops without a tick when that turn is not before turns.
+    With a record_path the pheromone levels of every record_every turns
+    are written to that history file. With a frames_path a frame of every
+    frames_every turns is drawn, see Engine.LibImage.FrameWriter """
+
+    world = World(swarm=swarm, seed=seed)
+    game_engine = world.game_engine
+
+    raster_engine = None
+    frame_writer = None
+    if frames_path is not None:
+        from Engine.RasterEngine import RasterEngine
+
+        raster_engine = RasterEngine()
+        game_engine.callback_for_new_object(raster_engine.add_component)
+        game_engine.callback_for_removed_object(
+            raster_engine.remove_component)
+        raster_engine.callback_before_draw(
+            game_engine.pheromone_engine.update_colors)
+
+        frame_writer = FrameWriter(frames_path)
+
+    world.initialize()
+
+    tick = 0
+    if restore_path is not None:
+        tick = restore_snapshot(game_engine, restore_path)
+
+    if profiler is not None:
+        game_engine.profiler = profiler
+
+    if record_path is not None:
+        game_engine.pheromone_engine.start_recording(record_path,
+                                                     record_every, tick)
+
+    first_tick = tick
+    start = time()
+
+    try:
+        while not turns or tick < turns:
+            game_engine.update()
+            tick += 1
+
+            if snapshot_every and tick % snapshot_every == 0:
+                snapshot_file.write(json.dumps(snapshot(game_engine, tick)))
+                snapshot_file.write("\n")
+
+            if checkpoint_every and tick % checkpoint_every == 0:
+                write_snapshot(game_engine, checkpoint_path, tick)
+
+            if raster_engine is not None and tick % frames_every == 0:
+                raster_engine.updateScreen()
+                frame_writer.write(raster_engine.frame(), tick)
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        game_engine.pheromone_engine.stop_recording()
+
+        if frame_writer is not None:
+            frame_writer.close()
+
+    seconds = time() - start
+
+    return tick - first_tick, seconds, summarize_stats(game_engine)
+
+
+def run_window(turns=TURNS, swarm=SWARM_ENGINE,
+               ticks_per_frame=TICKS_PER_FRAME, target_fps=TARGET_FPS,
+               profiler=None, seed=SEED, checkpoint_every=0,
+               checkpoint_path=None, restore_path=None, record_path=None,
+               record_every=1):
+    """ Runs the simulation in a window, drawing a frame after every
+    ticks_per_frame turns or, with a target_fps, as often as that rate.
+    The drawing time of a frame is profiled as part of the next tick.
+    Checkpoints, restoring and recording are the same as in run_headless """
+
+    try:
+        from Tkinter import Tk
+    except ImportError:
+        from tkinter import Tk
+
+    from Engine.GraphicsEngine import GraphicsEngine
+
+    root = Tk()
+
+    # Create the engines
+    world = World(swarm=swarm, seed=seed)
+    game_engine = world.game_engine
+    graphics_engine = GraphicsEngine(master=root)
+
+    # Set all constants
+    graphics_engine.set_hex_radius()
+
+    # Alert other engines when a new game_object is added
+    game_engine.callback_for_new_object(graphics_engine.add_component)
+    game_engine.callback_for_removed_object(graphics_engine.remove_component)
+
+    # Derive the tile colors only for drawn frames
+    graphics_engine.callback_before_draw(
+        game_engine.pheromone_engine.update_colors)
+
+    # Initialize all engines
+    world.initialize()
+
+    # The turn is kept in a list so update can count it
+    tick = [0]
+    if restore_path is not None:
+        tick[0] = restore_snapshot(game_engine, restore_path)
+
+    if profiler is not None:
+        game_engine.profiler = profiler
+
+    if record_path is not None:
+        game_engine.pheromone_engine.start_recording(record_path,
+                                                     record_every, tick[0])
+
+    def update():
+        """ Advances one turn and writes the checkpoint when due """
+
+        game_engine.update()
+        tick[0] += 1
+
+        if checkpoint_every and tick[0] % checkpoint_every == 0:
+            write_snapshot(game_engine, checkpoint_path, tick[0])
+
+    scheduler = FrameScheduler(ticks_per_frame, target_fps)
+
+    i = max(turns - tick[0], 0) if turns else -1
+
+    print("Starting main game loop")
+
+    try:
+        while i != 0:
+
+            i -= scheduler.advance(update, i)
+            graphics_engine.set_turn_text(i)
+
+            start = time()
+            updated = graphics_engine.updateScreen()
+            seconds = time() - start
+
+            scheduler.rendered(seconds)
+
+            if game_engine.profiler.enabled:
+                game_engine.profiler.record('render', seconds)
+                game_engine.profiler.count('canvas_updates', updated)
+
+    finally:
+        game_engine.pheromone_engine.stop_recording()
+
+
+def run_main_headless(args, profiler):
+    """ Runs the headless simulation of the command line arguments and
+    reports the ticks per second """
+
+    snapshot_file = None
+    if args.snapshot_every:
+        snapshot_file = open(args.snapshot_file, "w") \
+            if args.snapshot_file else sys.stdout
+
+    try:
+        ticks, seconds, stats = run_headless(args.turns, args.swarm,
+                                             args.snapshot_every,
+                                             snapshot_file, profiler,
+                                             args.seed, args.checkpoint_every,
+                                             args.checkpoint, args.restore,
+                                             args.record_pheromones,
+                                             args.record_every, args.frames,
+                                             args.frames_every)
+    finally:
+        if snapshot_file not in (None, sys.stdout):
+            snapshot_file.close()
+
+    rate = ticks / seconds if seconds > 0 else float("inf")
+
+    sys.stderr.write("%d ticks in %.2f s, %.1f ticks/sec\n" %
+                     (ticks, seconds, rate))
+    sys.stderr.write("%s\n" % json.dumps(stats))
+
+
+def main(argv=None):
+    """ Runs the simulation as described by the command line arguments """
+
+    args = parse_args(argv)
+
+    profiler = None
+    profile_file = None
+
+    if args.profile or args.profile_file:
+        profile_file = open(args.profile_file, "w") \
+            if args.profile_file else None
+
+        profiler = Profiler()
+        profiler.enable(profile_file)
+
+    try:
+        if args.headless:
+            run_main_headless(args, profiler)
+        else:
+            run_window(args.turns, args.swarm,
+                       args.ticks_per_frame, args.fps, profiler,
+                       args.seed, args.checkpoint_every, args.checkpoint,
+                       args.restore, args.record_pheromones,
+                       args.record_every)
+    finally:
+        if profile_file is not None:
+            profile_file.close()
+
+    if profiler is not None:
+        sys.stderr.write("%s\n" % profiler.format_report())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Benchmark Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..bench import run_case, compare_results, find_regressions
+from ..bench import run_decay_case
+from ..bench import StubCanvas, create_stub_graphics_engine
+from ..bench.benchmark import tracemalloc
+
+
+def make_results(tick, ai):
+    """ Returns results of a single case with the given timings """
+
+    return {"results": [{"rings": 15, "ants": 150, "swarm": False,
+                         "create_map": 1.0, "create_colony": 1.0,
+                         "tick": tick, "phases": {"ai": ai}}]}
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test object for the benchmark"""
+
+    #######################################################
+
+    def test_run_case(self):
+        """ A small case times every phase, only the tiles with pheromone
+        count as holder updates """
+
+        result = run_case(rings=4, ants=10, turns=2, render=False)
+
+        self.assertEqual(result["rings"], 4)
+        self.assertEqual(result["ants"], 10)
+        self.assertIn('ai', result["phases"])
+        self.assertIn('pheromone_holders', result["phases"])
+        self.assertEqual(result["counters"]["holder_updates"], 3)
+
+    def test_run_decay_case(self):
+        """ The decay of a trail is timed both ways """
+
+        result = run_decay_case(rings=10, trail=1000, turns=2)
+
+        self.assertEqual(result["tiles"], 271)
+        self.assertEqual(result["trail"], 271)
+        self.assertGreaterEqual(result["active"], 0.0)
+        self.assertGreaterEqual(result["all"], 0.0)
+
+    def test_run_case_raster(self):
+        """ Drawing with the raster engine is timed as render phase """
+
+        result = run_case(rings=4, ants=10, turns=2, raster=True)
+
+        self.assertIn('render', result["phases"])
+        self.assertNotIn('canvas_calls', result["counters"])
+
+    def test_stub_graphics_engine(self):
+        """ The stub graphics engine is constructed on a stub canvas """
+
+        graphics_engine = create_stub_graphics_engine()
+
+        self.assertIsInstance(graphics_engine.win, StubCanvas)
+        self.assertIs(graphics_engine.master, graphics_engine.win)
+        self.assertEqual(graphics_engine.updateScreen(), 0)
+
+    @unittest.skipIf(tracemalloc is None, "tracemalloc is not available")
+    def test_run_case_memory(self):
+        """ The memory of a case is measured per game object """
+
+        result = run_case(rings=4, ants=10, turns=1, render=False,
+                          memory=True)
+
+        memory = result["memory"]
+        self.assertEqual(memory["objects"], 37 + 10 + 1 + 5)
+        self.assertGreater(memory["bytes_per_object"], 0)
+        self.assertEqual(memory["bytes_per_object"],
+                         float(memory["bytes"]) / memory["objects"])
+
+    def test_compare_results(self):
+        """ Timings of the same case are compared """
+
+        rows = compare_results(make_results(1.0, 0.5),
+                               make_results(2.0, 0.5))
+
+        self.assertIn((15, 150, False, "tick", 1.0, 2.0), rows)
+        self.assertIn((15, 150, False, "phases.ai", 0.5, 0.5), rows)
+
+    def test_find_regressions(self):
+        """ Only timings slower than the threshold are regressions """
+
+        regressions = find_regressions(make_results(1.0, 0.5),
+                                       make_results(1.1, 1.0), 0.2)
+
+        self.assertEqual(regressions,
+                         [(15, 150, False, "phases.ai", 0.5, 1.0)])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
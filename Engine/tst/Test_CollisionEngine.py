@@ -0,0 +1,135 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Collision Engine Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..CollisionEngine import CollisionEngine
+from ..GameObjectFactory import GameObjectFactory
+
+
+class TestCollisionEngine(unittest.TestCase):
+    """Test object for CollisionEngine"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.coll_eng = CollisionEngine()
+        self.coll_eng.set_map_size(4)
+
+        self.factory = GameObjectFactory(None)
+
+    def create_ant(self, xyz=(0, 0, 0)):
+        """ Returns an ant added to the collision engine """
+
+        ant = self.factory.create_ant()
+        ant.components['position'].set_position_xyz(xyz)
+        self.coll_eng.add_component(ant)
+
+        return ant
+
+    #######################################################
+
+    def test_collision_on_same_tile(self):
+        """ Objects on the same tile center collide with each other """
+
+        ant1 = self.create_ant((1, -1, 0))
+        ant2 = self.create_ant((1, -1, 0))
+        ant3 = self.create_ant((0, 0, 0))
+
+        self.coll_eng.update()
+
+        self.assertEqual(
+            ant1.components['collision'].objects_collided_with, [ant2])
+        self.assertEqual(
+            ant2.components['collision'].objects_collided_with, [ant1])
+        self.assertEqual(
+            ant3.components['collision'].objects_collided_with, [])
+
+    def test_no_collision_off_center(self):
+        """ Objects between tile centers do not collide """
+
+        ant1 = self.create_ant((0.5, -0.5, 0))
+        ant2 = self.create_ant((0.5, -0.5, 0))
+
+        self.coll_eng.update()
+
+        self.assertEqual(
+            ant1.components['collision'].objects_collided_with, [])
+        self.assertEqual(self.coll_eng.get_collisions(), [])
+
+    def test_moved_object_leaves_cell(self):
+        """ Only moved objects change cell, they leave their old group """
+
+        ant1 = self.create_ant((1, -1, 0))
+        ant2 = self.create_ant((1, -1, 0))
+        self.coll_eng.update()
+
+        ant2.components['position'].set_position_xyz((1.5, -1.5, 0))
+        self.coll_eng.update()
+
+        self.assertEqual(
+            ant1.components['collision'].objects_collided_with, [])
+        self.assertEqual(
+            ant2.components['collision'].objects_collided_with, [])
+
+        ant2.components['position'].set_position_xyz((1, -1, 0))
+        self.coll_eng.update()
+
+        self.assertEqual(
+            ant1.components['collision'].objects_collided_with, [ant2])
+
+    def test_get_collisions(self):
+        """ Collisions are reported as cell and members """
+
+        ant1 = self.create_ant((0, 1, -1))
+        ant2 = self.create_ant((0, 1, -1))
+        self.create_ant((0, 0, 0))
+
+        self.coll_eng.update()
+
+        collisions = self.coll_eng.get_collisions()
+
+        self.assertEqual(len(collisions), 1)
+        cell, members = collisions[0]
+        self.assertEqual(cell, 3)
+        self.assertEqual(members, [ant1, ant2])
+
+    def test_set_map_size_rebuckets(self):
+        """ Changing the map size buckets all objects again """
+
+        ant1 = self.create_ant((1, -1, 0))
+        ant2 = self.create_ant((1, -1, 0))
+        self.coll_eng.update()
+
+        self.coll_eng.set_map_size(5)
+        self.assertEqual(self.coll_eng.get_collisions(), [])
+
+        self.coll_eng.update()
+        self.assertEqual(
+            ant1.components['collision'].objects_collided_with, [ant2])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,99 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Experiment Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..experiment import expand_grid, run_sweep
+from ..experiment.__main__ import parse_grid
+from ..GameSettings import ANT_DEFAULTS
+
+LISTEN = "ANT_DEFAULTS.BEHAVIOUR.listen_to_pheromone"
+
+
+class TestExperiment(unittest.TestCase):
+    """Test object for the experiment runner"""
+
+    #######################################################
+
+    def test_expand_grid(self):
+        """ Every combination is run once per seed """
+
+        runs = expand_grid({"b": [1, 2], "a": ["x"]}, seeds=(0, 1))
+
+        self.assertEqual(runs, [({"a": "x", "b": 1}, 0),
+                                ({"a": "x", "b": 1}, 1),
+                                ({"a": "x", "b": 2}, 0),
+                                ({"a": "x", "b": 2}, 1)])
+
+    def test_sweep_leaves_game_settings(self):
+        """ Runs use settings of their own, GameSettings is not changed """
+
+        listen = ANT_DEFAULTS["BEHAVIOUR"]["listen_to_pheromone"]
+
+        rows = run_sweep({LISTEN: [0.1], "MAPSIZE": [5]}, (1,), 5, 4, 3, 1,
+                         processes=1)
+
+        self.assertEqual(rows[0]["rings"], 5)
+        self.assertEqual(rows[0][LISTEN], 0.1)
+        self.assertEqual(ANT_DEFAULTS["BEHAVIOUR"]["listen_to_pheromone"],
+                         listen)
+
+    def test_unknown_setting(self):
+        """ Misspelled settings are refused before running """
+
+        with self.assertRaises(ValueError):
+            run_sweep({"ANT_DEFAULTS.BEHAVIOR.listen": [1.0]}, processes=1)
+
+    def test_run_sweep(self):
+        """ The rows of a sweep are in the order of the grid, the same in
+        the pool as in this process """
+
+        arguments = ({LISTEN: [0.2, 0.9]}, (3,), 20, 4, 10, 2)
+
+        rows = run_sweep(*arguments, processes=1)
+
+        self.assertEqual([row[LISTEN] for row in rows], [0.2, 0.9])
+        self.assertEqual([row["run"] for row in rows], [0, 1])
+
+        for row in rows:
+            self.assertEqual(row["returned_food_per_tick"],
+                             row["returned_food"] / 20.0)
+
+        pooled = run_sweep(*arguments, processes=2)
+
+        for row, pooled_row in zip(rows, pooled):
+            del row["seconds"], pooled_row["seconds"]
+            self.assertEqual(row, pooled_row)
+
+    def test_parse_grid(self):
+        """ Values on the command line are read as json """
+
+        self.assertEqual(parse_grid([LISTEN + "=0.5,1", "a.b=x"]),
+                         {LISTEN: [0.5, 1], "a.b": ["x"]})
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
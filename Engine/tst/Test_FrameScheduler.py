@@ -0,0 +1,96 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Frame Scheduler Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..FrameScheduler import FrameScheduler
+
+
+class FakeClock(object):
+    """ Clock advancing a fixed time on every turn """
+
+    def __init__(self, seconds_per_tick):
+        self.now = 0.0
+        self.seconds_per_tick = seconds_per_tick
+
+    def __call__(self):
+        return self.now
+
+    def tick(self):
+        """ Called as update of a turn """
+        self.now += self.seconds_per_tick
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Test object for FrameScheduler"""
+
+    def test_fixed_ticks_per_frame(self):
+        """ Without target frame rate a fixed number of turns is run """
+
+        clock = FakeClock(0.01)
+        scheduler = FrameScheduler(ticks_per_frame=5, target_fps=0,
+                                   clock=clock)
+
+        self.assertEqual(scheduler.advance(clock.tick), 5)
+        self.assertAlmostEqual(clock.now, 0.05)
+
+    def test_max_ticks(self):
+        """ No more turns than left are run """
+
+        clock = FakeClock(0.01)
+        scheduler = FrameScheduler(ticks_per_frame=5, clock=clock)
+
+        self.assertEqual(scheduler.advance(clock.tick, 3), 3)
+        self.assertEqual(scheduler.advance(clock.tick, 0), 0)
+
+    def test_target_fps(self):
+        """ With a target frame rate the turns fill the frame """
+
+        clock = FakeClock(0.0625)
+        scheduler = FrameScheduler(target_fps=2, clock=clock)
+
+        self.assertEqual(scheduler.advance(clock.tick), 8)
+
+    def test_target_fps_leaves_time_to_draw(self):
+        """ The time needed to draw is subtracted from the frame """
+
+        clock = FakeClock(0.0625)
+        scheduler = FrameScheduler(target_fps=2, clock=clock)
+        scheduler.render_seconds = 0.25
+
+        self.assertEqual(scheduler.advance(clock.tick), 4)
+
+    def test_target_fps_at_least_one_tick(self):
+        """ Slow turns still advance the simulation every frame """
+
+        clock = FakeClock(1.0)
+        scheduler = FrameScheduler(target_fps=20, clock=clock)
+
+        self.assertEqual(scheduler.advance(clock.tick), 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
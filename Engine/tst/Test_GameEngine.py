@@ -72,7 +72,7 @@ class Testgame_engine(unittest.TestCase):  # pylint: disable=R0904
 
     def tearDown(self):  # pylint: disable=C0103
         "This method is called after each test case"
-        self.game_eng.objects = {}
+        pass
 
     #######################################################
 
@@ -139,6 +139,14 @@ class Testgame_engine(unittest.TestCase):  # pylint: disable=R0904
         calls = len(self.game_eng.game_object_factory.create_tile.mock_calls)
         self.assertEqual(calls, 7)
 
+    def test_create_map_neighbour_table(self):
+        """ Test if creating a map builds the neighbour table """
+
+        self.game_eng.create_map(3)
+
+        table = self.game_eng.get_neighbour_table()
+        self.assertEqual(table.shape, (19, 6))
+
     def test_update(self):
         """ Test the update call """
 
@@ -153,5 +161,160 @@ class Testgame_engine(unittest.TestCase):  # pylint: disable=R0904
 
         self.assertTrue(len(self.game_eng.objects) > 0)
 
+    def test_members_tracked_per_component(self):
+        """ Test if objects are members of their component types only """
+
+        tile = self.game_eng.game_object_factory.create_tile()
+        ant = self.game_eng.game_object_factory.create_ant()
+
+        self.game_eng.add_game_object(tile)
+        self.game_eng.add_game_object(ant)
+
+        self.assertEqual(self.game_eng.get_members('ai'), [ant])
+        self.assertEqual(self.game_eng.get_members('position'), [tile, ant])
+        self.assertEqual(self.game_eng.get_members('unknown'), [])
+
+    def test_systems_run_in_registration_order(self):
+        """ Test if the systems are updated in the declared order """
+
+        calls = []
+        self.game_eng.systems = []
+        self.game_eng.register_system('first', lambda: calls.append(1))
+        self.game_eng.register_system('second', lambda: calls.append(2))
+
+        self.game_eng.update()
+
+        self.assertEqual(calls, [1, 2])
+
+    def test_profiled_update(self):
+        """ Test if a profiled update times every system """
+
+        self.game_eng.systems = []
+        self.game_eng.register_system('first', lambda: None)
+        self.game_eng.register_system('second', lambda: None)
+
+        self.game_eng.profiler.enable()
+        self.game_eng.update()
+        self.game_eng.profiler.disable()
+
+        report = self.game_eng.profiler.report()
+
+        self.assertEqual(report["ticks"], 1)
+        self.assertEqual(sorted(report["phases"]), ['first', 'second'])
+        self.assertIn('collisions', report["counters"])
+
+    def test_default_system_order(self):
+        """ Test the order in which the default systems are updated """
+
+        names = [name for name, system in self.game_eng.systems]
+
+        self.assertEqual(names, ['pheromone_actors', 'collision', 'ai',
+                                 'move', 'pheromone_holders',
+                                 'pheromone_history'])
+
+    def test_update_ai_only_members(self):
+        """ Test if only objects owning an ai component are updated """
+
+        ant = GameObject(None)
+        ant.components['ai'] = MagicMock()
+        tile = GameObject(None)
+        tile.components['render'] = MagicMock()
+
+        self.game_eng.add_game_object(ant)
+        self.game_eng.add_game_object(tile)
+
+        self.game_eng.update_ai()
+
+        ant.components['ai'].update.assert_called_once_with()
+        self.assertFalse(tile.components['render'].update.called)
+
+    def test_remove_game_object(self):
+        """ A removed ant leaves every engine and is reused for the next """
+
+        self.game_eng.initialize_engines()
+        self.game_eng.initialize_objects(rings=4, ants=3, pieces_of_food=1)
+        self.game_eng.update()
+
+        ant = self.game_eng.get_members('ai')[0]
+        self.game_eng.remove_game_object(ant)
+
+        self.assertNotIn(str(ant.object_id), self.game_eng.objects)
+        self.assertNotIn(ant, self.game_eng.get_members('ai'))
+        self.assertNotIn(ant, self.game_eng.collision_engine.colliders)
+        self.assertNotIn(ant, self.game_eng.pheromone_engine.actors)
+
+        self.game_eng.update()
+
+        self.assertIs(self.game_eng.game_object_factory.create_ant(), ant)
+
+    def test_remove_swarm_ant(self):
+        """ Ants of the swarm engine can not be removed """
+
+        game_eng = GameEngine(swarm=True)
+        game_eng.initialize_engines()
+        game_eng.initialize_objects(rings=4, ants=3, pieces_of_food=1)
+
+        ant = [obj for obj in game_eng.objects.values()
+               if 'ai' in obj.components][0]
+
+        with self.assertRaises(ValueError):
+            game_eng.remove_game_object(ant)
+
+    def test_get_stats(self):
+        """ The stats of every ant are returned, with or without swarm """
+
+        for swarm in (False, True):
+            game_eng = GameEngine(swarm=swarm)
+            game_eng.initialize_engines()
+            game_eng.initialize_objects(rings=4, ants=3, pieces_of_food=1)
+
+            stats = game_eng.get_stats()
+
+            self.assertEqual(len(stats), 3)
+            self.assertEqual([each.found_food for each in stats], [0, 0, 0])
+
+    def test_counters_with_swarm(self):
+        """ The ants of the swarm are counted as centered actors and
+        colliders, on the first tick both modes count the same """
+
+        counters = []
+
+        for swarm in (False, True):
+            game_eng = GameEngine(swarm=swarm, seed=3)
+            game_eng.initialize()
+
+            game_eng.profiler.enable()
+            game_eng.update()
+            game_eng.profiler.disable()
+
+            counters.append(game_eng.profiler.report()["counters"])
+
+        self.assertGreater(counters[0]["centered_actors"]["mean"], 0)
+        self.assertGreater(counters[0]["collisions"]["mean"], 0)
+
+        for name in ("centered_actors", "collisions"):
+            self.assertEqual(counters[1][name], counters[0][name])
+
+    def test_update_with_swarm(self):
+        """ Test if all ants are adopted and advanced by the swarm engine """
+
+        game_eng = GameEngine(swarm=True)
+        game_eng.initialize()
+
+        ants = [obj for obj in game_eng.objects.values()
+                if 'ai' in obj.components]
+
+        self.assertEqual(len(ants), game_eng.swarm_engine.size)
+        self.assertTrue(all('pheromone_actor' not in ant.components
+                            for ant in ants))
+        self.assertEqual(game_eng.get_members('ai'), [])
+
+        for i in range(4):
+            game_eng.update()
+
+        moved = [ant.components['position'].xyz() for ant in ants]
+        self.assertTrue(any(xyz != moved[0] for xyz in moved) or
+                        game_eng.swarm_engine.size < 2)
+
 if __name__ == '__main__':
     unittest.main(verbosity=1)
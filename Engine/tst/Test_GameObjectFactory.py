@@ -70,5 +70,58 @@ class TestGameObjectFactory(unittest.TestCase):
 
         self.assertNotEqual(obj1.object_id, obj2.object_id)
 
+    def test_released_ant_reused(self):
+        """ A released ant is created again in its initial state """
+
+        factory = GameObjectFactory(None)
+
+        ant = factory.create_ant()
+        ant.components['position'].set_position_xyz((1, -1, 0))
+        ant.components['ai'].interested_in = "home"
+        ant.components['ai'].stats.found_food = 3
+        ant.components['pheromone_actor'].deposit["home"] = 5.0
+        ant.components['render'].fill = "#000066"
+
+        factory.release(ant)
+        reused = factory.create_ant()
+
+        self.assertIs(reused, ant)
+        self.assertEqual(reused.components['position'].xyz(), [0, 0, 0])
+        self.assertEqual(reused.components['position'].orientation, 3)
+        self.assertEqual(reused.components['ai'].interested_in, "food")
+        self.assertEqual(reused.components['ai'].stats.found_food, 0)
+        self.assertEqual(reused.components['pheromone_actor'].deposit,
+                         {"food": 0.0, "home": 0.0})
+        self.assertEqual(reused.components['render'].fill, "#001100")
+        self.assertIsNot(factory.create_ant(), ant)
+
+    def test_released_food_reused(self):
+        """ Released food is reused, tiles are not pooled """
+
+        factory = GameObjectFactory(None)
+
+        food = factory.create_food()
+        food.components['food'].set_start_amount(10)
+        factory.release(food)
+        factory.release(factory.create_tile())
+
+        self.assertIs(factory.create_food(), food)
+        self.assertEqual(food.components['food'].amount, 0)
+        self.assertEqual(factory.pools, {"ant": [], "food": []})
+
+    def test_components_have_no_dict(self):
+        """ Objects and components keep their attributes in slots """
+
+        ant = self.gameObjFact.create_ant()
+
+        self.assertFalse(hasattr(ant, '__dict__'))
+        self.assertFalse(hasattr(ant.components['position'].pos, '__dict__'))
+
+        for component in ant.components.values():
+            self.assertFalse(hasattr(component, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            ant.components['ai'].stats.eaten_food = 1
+
 if __name__ == '__main__':
     unittest.main(verbosity=1)
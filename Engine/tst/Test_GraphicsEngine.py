@@ -26,7 +26,6 @@ Description
 """
 
 import unittest
-from sys import version_info
 from mock import MagicMock
 
 from copy import deepcopy
@@ -70,18 +69,17 @@ class TestGraphicsEngine(unittest.TestCase):
 
     def tearDown(self):
         "This method is called after each test case"
-        self.graph_eng.objects = []
+        self.graph_eng.clear_objects()
 
     #######################################################
 
-    @unittest.skipIf(version_info < (3, 0),
-                     "singleton construction does not work in 2.7")
-    def test_singleton_property(self):
-        """ Test if the singleton pattern is hold """
-        graph_eng_1 = GraphicsEngine(None)
-        graph_eng_2 = GraphicsEngine(None)
+    def test_shared_instance(self):
+        """ Test if the shared instance is the same for every call """
+        graph_eng_1 = GraphicsEngine.instance(None)
+        graph_eng_2 = GraphicsEngine.instance(None)
 
         self.assertEqual(id(graph_eng_1), id(graph_eng_2))
+        self.assertNotEqual(id(graph_eng_1), id(self.graph_eng))
 
     def test_test_class_constants(self):
         """ Assure the constants used by the test class are correct """
@@ -208,5 +206,51 @@ class TestGraphicsEngine(unittest.TestCase):
         mthd = self.graph_eng.win.itemconfigure
         mthd.assert_called_with(self.graph_eng.turn_text, text="Some text")
 
+    def test_place_batch_equals_place_object_xyz(self):
+        """ Placing a batch gives the coordinates of placing every
+        object on its own """
+
+        self.graph_eng.add_component(self.dummy_game_object)
+
+        rend_comp = self.dummy_game_object.components['render']
+        batch = self.graph_eng.batches[tuple(rend_comp.polygon)]
+
+        xyz = [(0, 0, 0), (1, -1, 0), (-2, 3, -1)]
+        placed = self.graph_eng.place_batch(batch, xyz)
+
+        self.assertEqual(placed.tolist(),
+                         [self.graph_eng.place_object_xyz(rend_comp.polygon,
+                                                          *coord)
+                          for coord in xyz])
+
+    def test_update_screen_only_changed_items(self):
+        """ Only moved objects and changed fills are drawn again,
+        static objects are never moved """
+
+        self.graph_eng.win = MagicMock()
+
+        moving = GameObject(None)
+        moving.components['position'] = PositionComponent(None)
+        moving.components['render'] = RenderComponent(None)
+
+        static = GameObject(None)
+        static.components['position'] = PositionComponent(None)
+        static.components['render'] = RenderComponent(None)
+        static.components['render'].static = True
+
+        self.graph_eng.add_component(moving)
+        self.graph_eng.add_component(static)
+
+        self.assertEqual(self.graph_eng.updateScreen(), 0)
+
+        moving.components['position'].set_position_xyz((1, -1, 0))
+        static.components['position'].set_position_xyz((1, -1, 0))
+        self.assertEqual(self.graph_eng.updateScreen(), 1)
+
+        static.components['render'].fill = "#123456"
+        self.assertEqual(self.graph_eng.updateScreen(), 1)
+        self.graph_eng.win.itemconfig.assert_called_with(
+            static.components['render'].renderID, fill="#123456")
+
 if __name__ == '__main__':
     unittest.main(verbosity=1)
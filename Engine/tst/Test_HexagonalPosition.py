@@ -23,6 +23,7 @@
 """
 import unittest
 from ..HexagonalPosition import HexagonalPosition
+from ..LibHexagonalPosition import TOPLEFT, TOP
 
 
 class TestHexPos(unittest.TestCase):  # pylint: disable=R0904
@@ -130,4 +131,62 @@ class TestHexPos(unittest.TestCase):  # pylint: disable=R0904
 
         self.assertEqual(self.pos.x, 0)
         self.assertEqual(self.pos.y, 0)
-        self.assertEqual(self.pos.z, 0)
\ No newline at end of file
+        self.assertEqual(self.pos.z, 0)
+
+    def test_ring_side_tile_from_xyz(self):
+        """Test if ring, side and tile follow a set xyz position"""
+
+        self.pos.set_position_xyz(-1, 3, -2)
+        self.assertEqual((self.pos.ring, self.pos.side, self.pos.tile),
+                         (3, 2, 1))
+
+        self.pos.set_position_xyz(1, -1, 0)
+        self.assertEqual((self.pos.ring, self.pos.side, self.pos.tile),
+                         (1, 0, 0))
+
+    def test_ring_side_tile_from_rst(self):
+        """Test if ring, side and tile follow a set rst position"""
+
+        self.pos.set_position_rst(2, 4, 1)
+
+        self.assertEqual((self.pos.ring, self.pos.side, self.pos.tile),
+                         (2, 4, 1))
+
+    ####################################################################
+
+    def test_center_of_tile(self):
+        """Test if only tile centers are centers of tiles"""
+
+        self.pos.set_position_xyz(2, -1, -1)
+        self.assertTrue(self.pos.center_of_tile())
+
+        self.pos.set_position_xyz(1.5, -1, -0.5)
+        self.assertFalse(self.pos.center_of_tile())
+
+    def test_move(self):
+        """Test if moving in a direction changes the position"""
+
+        result = self.pos.move(TOP, 0.5)
+
+        self.assertTrue(result)
+        self.assertEqual(self.pos.xyz, (0.5, 0.0, -0.5))
+
+    def test_move_off_map(self):
+        """Test if moving off the map does not change the position"""
+
+        self.pos.set_position_xyz(3, 0, -3)
+
+        result = self.pos.move(TOP, 0.5, max_coord=3)
+
+        self.assertFalse(result)
+        self.assertEqual(self.pos.xyz, (3.0, 0.0, -3.0))
+
+    def test_move_no_drift(self):
+        """Test if many small moves end exactly on a tile center"""
+
+        for i in range(1000):
+            self.pos.move(TOPLEFT, 0.1, max_coord=1000)
+
+        self.assertEqual(self.pos.xyz, (100.0, -100.0, 0.0))
+        self.assertTrue(self.pos.center_of_tile())
+
@@ -329,6 +329,103 @@ class TestLibHexPos(unittest.TestCase):  # pylint: disable=R0904
         self.assertEqual(2, side)
         self.assertEqual(0, tile)
 
+    def test_calc_rst_between_tiles(self):
+        """Test ring/side/tile calculation halfway between two tiles """
+
+        xyz = (1.5, -1.0, -0.5)
+        (ring, side, tile) = calc_ring_side_tile_from_xyz(xyz)
+
+        self.assertEqual(1.5, ring)
+        self.assertEqual(0, side)
+        self.assertEqual(0.5, tile)
+
+    def test_calc_rst_corner_between_tiles(self):
+        """Test the side halfway between two corner tiles """
+
+        self.assertEqual(calc_side_from_xyz((1.5, -1.5, 0)), 0)
+        self.assertEqual(calc_side_from_xyz((-0.5, 0.5, 0)), 3)
+        self.assertEqual(calc_side_from_xyz((0.5, 0, -0.5)), 1)
+
+    def test_ring_side_tile_table(self):
+        """Test if all tile centers are in the table """
+
+        table = get_ring_side_tile_table(4)
+
+        for ring in range(4):
+            for side in range(6):
+                for tile in range(ring):
+                    xyz = calc_xyz_from_rst(ring, side, tile)
+                    self.assertEqual(table[xyz], (ring, side, tile))
+
+    ####################################################################
+
+    def test_tile_count(self):
+        """ Test the number of tiles of known map sizes """
+
+        self.assertEqual(calc_tile_count(1), 1)
+        self.assertEqual(calc_tile_count(2), 7)
+        self.assertEqual(calc_tile_count(3), 19)
+
+    def test_tile_index_follows_map_creation_order(self):
+        """ Tiles are numbered in the order they are created """
+
+        index = 1
+        for ring in range(1, 4):
+            for side in range(6):
+                for tile in range(ring):
+                    self.assertEqual(calc_tile_index_from_rst(ring, side, tile),
+                                     index)
+                    index += 1
+
+    def test_tile_index_tables_bijection(self):
+        """ Every tile index maps to a coordinate and back """
+
+        rings = 5
+        index_of_xy, xyz_of_index = get_tile_index_tables(rings)
+
+        self.assertEqual(len(xyz_of_index), calc_tile_count(rings))
+        self.assertEqual((index_of_xy >= 0).sum(), calc_tile_count(rings))
+
+        for index, xyz in enumerate(xyz_of_index.tolist()):
+            self.assertEqual(sum(xyz), 0)
+            self.assertEqual(calc_tile_index_from_xyz(xyz, rings), index)
+
+    def test_tile_index_from_xyz_floats(self):
+        """ Float coordinates of a tile center give the tile index """
+
+        index = calc_tile_index_from_xyz((-1.0, 3.0, -2.0), 5)
+        self.assertEqual(index, calc_tile_index_from_rst(3, 2, 1))
+
+    def test_tile_index_from_xyz_off_map(self):
+        """ Coordinates outside of the map give -1 """
+
+        self.assertEqual(calc_tile_index_from_xyz((3, -3, 0), 3), -1)
+        self.assertEqual(calc_tile_index_from_xyz((2, 1, -3), 3), -1)
+
+    def test_neighbour_table_matches_get_neighbour_xyz(self):
+        """ The neighbour table holds the tile index of every neighbour """
+
+        rings = 4
+        table = get_neighbour_table(rings)
+        xyz_of_index = get_tile_index_tables(rings)[1]
+
+        self.assertEqual(table.shape, (calc_tile_count(rings), 6))
+
+        for index, xyz in enumerate(xyz_of_index.tolist()):
+            for direction in range(6):
+                neighbour_xyz = get_neighbour_xyz(xyz, direction)
+                self.assertEqual(table[index, direction],
+                                 calc_tile_index_from_xyz(neighbour_xyz, rings))
+
+    def test_neighbour_table_off_map(self):
+        """ Neighbours of the outer ring outside of the map are OFF_MAP """
+
+        table = get_neighbour_table(2)
+        corner = calc_tile_index_from_xyz((1, -1, 0), 2)
+
+        self.assertEqual(table[corner, TOPLEFT], OFF_MAP)
+        self.assertEqual(table[corner, BOTTOMRIGHT], 0)
+
 # When this file is called as main, autorun the unittests
 if __name__ == '__main__':
     unittest.main(verbosity=1)
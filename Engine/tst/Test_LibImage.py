@@ -0,0 +1,121 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Image Library Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+
+import numpy
+
+from ..LibImage import encode_png, FrameStream, FrameWriter, PNG_SIGNATURE
+
+
+def decode_png(data):
+    """ Returns the RGB array of a PNG written by encode_png """
+
+    width, height = struct.unpack(">II", data[16:24])
+
+    chunks = b""
+    position = len(PNG_SIGNATURE)
+    while position < len(data):
+        length = struct.unpack(">I", data[position:position + 4])[0]
+        chunk_type = data[position + 4:position + 8]
+        if chunk_type == b"IDAT":
+            chunks += data[position + 8:position + 8 + length]
+        position += 12 + length
+
+    scanlines = numpy.frombuffer(zlib.decompress(chunks), dtype=numpy.uint8)
+
+    return scanlines.reshape(height, 1 + 3 * width)[:, 1:]\
+        .reshape(height, width, 3)
+
+
+class TestLibImage(unittest.TestCase):
+    """Test object for LibImage"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.directory = tempfile.mkdtemp()
+
+        self.rgb = numpy.zeros((3, 4, 3), dtype=numpy.uint8)
+        self.rgb[1, 2] = (255, 10, 7)
+
+    def tearDown(self):
+        "This method is called after each test case"
+        shutil.rmtree(self.directory)
+
+    #######################################################
+
+    def test_encode_png(self):
+        """ A PNG holds the pixels of the array """
+
+        data = encode_png(self.rgb)
+
+        self.assertTrue(data.startswith(PNG_SIGNATURE))
+        self.assertEqual(data[12:16], b"IHDR")
+        self.assertTrue(data.endswith(b"IEND\xaeB`\x82"))
+        self.assertEqual(decode_png(data).tolist(), self.rgb.tolist())
+
+    def test_frame_stream(self):
+        """ Frames are appended without header """
+
+        path = os.path.join(self.directory, "frames.rgb")
+
+        stream = FrameStream(path)
+        stream.write(self.rgb)
+        stream.write(self.rgb)
+
+        with self.assertRaises(ValueError):
+            stream.write(numpy.zeros((2, 2, 3)))
+
+        stream.close()
+
+        self.assertEqual(stream.frames, 2)
+        self.assertEqual(os.path.getsize(path), 2 * self.rgb.size)
+
+    def test_frame_writer_png(self):
+        """ PNG frames are named by turn """
+
+        writer = FrameWriter(os.path.join(self.directory, "%03d.png"))
+        writer.write(self.rgb, 7)
+        writer.close()
+
+        self.assertEqual(os.listdir(self.directory), ["007.png"])
+
+    def test_frame_writer_needs_turn(self):
+        """ PNG frames without a place for the turn would overwrite
+        each other """
+
+        with self.assertRaises(ValueError):
+            FrameWriter(os.path.join(self.directory, "frame.png"))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,75 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Palette Library Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from math import sqrt
+
+import numpy
+
+from ..LibPalette import get_pheromone_palette, pheromone_buckets
+from ..LibPalette import pheromone_color, food_color
+
+
+class TestLibPalette(unittest.TestCase):
+    """Test object for LibPalette"""
+
+    def test_pheromone_color(self):
+        """ The palette holds the colors of the square roots of the
+        levels, with a constant green """
+
+        for home, food in ((0.0, 0.0), (7.0, 100.0), (1e6, 2.5)):
+            red = int(min(sqrt(home), 255))
+            blue = int(min(sqrt(food), 255))
+
+            self.assertEqual(pheromone_color(home, food),
+                             "#%02x%02x%02x" % (red, 10, blue))
+
+    def test_pheromone_buckets(self):
+        """ Levels with the same square root share a bucket """
+
+        buckets = pheromone_buckets(numpy.array([0.0, 3.9, 4.0, 1e9]),
+                                    numpy.array([0.0, 0.0, 0.0, 1.0]))
+
+        self.assertEqual(buckets.tolist(), [0, 256, 512, 255 * 256 + 1])
+
+    def test_palette_is_shared(self):
+        """ The palette is built once """
+
+        self.assertIs(get_pheromone_palette(), get_pheromone_palette())
+        self.assertEqual(len(get_pheromone_palette()), 256 * 256)
+
+    def test_food_color(self):
+        """ Full food is bright, empty food is black """
+
+        self.assertEqual(food_color(10, 10), "#ff7f00")
+        self.assertEqual(food_color(5, 10), "#7f3f00")
+        self.assertEqual(food_color(0, 10), "#000000")
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
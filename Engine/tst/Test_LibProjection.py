@@ -0,0 +1,161 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Projection Library Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+import numpy
+
+from ..LibProjection import project_xyz, polygon_offsets, place_polygons
+from ..LibProjection import PolygonBatch
+from ..LibPolygons import create_triangle
+from ..HexagonalPosition import HexagonalPosition
+from ..SwarmEngine import SwarmEngine
+from ..GameObjectFactory import GameObjectFactory
+from Engine.Components import RenderComponent
+
+
+class TestLibProjection(unittest.TestCase):
+    """Test object for LibProjection"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.center = [400, 300]
+        self.x_offset = 15.0
+        self.y_offset = 8.5
+
+    def project(self, x, y, z):
+        """ The projection of a single coordinate, as GraphicsEngine does """
+
+        return [self.center[0] + self.x_offset * y,
+                self.center[1] - self.y_offset * (2 * x + y)]
+
+    #######################################################
+
+    def test_project_xyz_equals_single_projection(self):
+        """ Projecting an array equals projecting every coordinate """
+
+        xyz = [(0, 0, 0), (1, 0, -1), (-2, 3, -1), (0.5, -0.5, 0)]
+
+        screen = project_xyz(xyz, self.center, self.x_offset, self.y_offset)
+
+        self.assertEqual(screen.tolist(),
+                         [self.project(*coord) for coord in xyz])
+
+    def test_project_single_coordinate(self):
+        """ A single coordinate gives a single row """
+
+        screen = project_xyz((0, 0, 0), self.center, 1.0, 1.0)
+
+        self.assertEqual(screen.tolist(), [[400.0, 300.0]])
+
+    def test_place_polygons(self):
+        """ The polygon offsets are added to every screen coordinate """
+
+        offsets = polygon_offsets(create_triangle(2))
+        screen = numpy.array([[10.0, 20.0], [0.0, 0.0]])
+
+        placed = place_polygons(screen, offsets)
+
+        self.assertEqual(placed.tolist(),
+                         [[10, 18, 12, 22, 8, 22],
+                          [0, -2, 2, 2, -2, 2]])
+
+    def test_batch_moved(self):
+        """ Only objects whose coordinates changed are moved, objects
+        never drawn are always moved """
+
+        batch = PolygonBatch(create_triangle(2))
+        positions = [HexagonalPosition(None) for i in range(3)]
+
+        batch.add(RenderComponent(None), positions[0], (0, 0, 0))
+        batch.add(RenderComponent(None), positions[1], (0, 0, 0))
+        batch.add(RenderComponent(None), positions[2])
+
+        positions[1].set_position_xyz(1, -1, 0)
+
+        self.assertEqual(batch.moved(batch.gather()).tolist(), [1, 2])
+        self.assertEqual(batch.moved(batch.gather()).tolist(), [])
+
+    def test_batch_remove(self):
+        """ A removed object is no longer gathered """
+
+        batch = PolygonBatch(create_triangle(2))
+        renders = [RenderComponent(None) for i in range(2)]
+        position = HexagonalPosition(None)
+        position.set_position_xyz(1, -1, 0)
+
+        batch.add(renders[0], HexagonalPosition(None))
+        batch.add(renders[1], position)
+
+        self.assertTrue(batch.remove(renders[0]))
+        self.assertFalse(batch.remove(renders[0]))
+
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(batch.gather().tolist(), [[1.0, -1.0, 0.0]])
+        self.assertEqual(batch.moved(batch.gather()).tolist(), [0])
+
+    def test_batch_grows(self):
+        """ The rows of many objects keep their placed coordinates when
+        the batch grows and after a removal """
+
+        batch = PolygonBatch(create_triangle(2))
+        renders = [RenderComponent(None) for i in range(100)]
+
+        for index, rend in enumerate(renders):
+            batch.add(rend, HexagonalPosition(None), (index, -index, 0))
+
+        self.assertGreaterEqual(batch.capacity, 100)
+
+        self.assertTrue(batch.remove(renders[10]))
+
+        self.assertEqual(len(batch.placed), 99)
+        self.assertEqual(batch.placed[:, 0].tolist(),
+                         [i for i in range(100) if i != 10])
+
+    def test_batch_gathers_swarm_rows(self):
+        """ Positions of swarm ants are read from the swarm arrays """
+
+        swarm = SwarmEngine()
+        factory = GameObjectFactory(None)
+        batch = PolygonBatch(create_triangle(2))
+
+        for i in range(3):
+            ant = factory.create_ant()
+            swarm.add_component(ant)
+            batch.add(ant.components['render'],
+                      ant.components['position'].pos)
+
+        swarm.steps[1] = (1000, -1000, 0)
+
+        self.assertEqual(batch.gather().tolist(),
+                         [[0.0, 0.0, 0.0], [1.0, -1.0, 0.0],
+                          [0.0, 0.0, 0.0]])
+        self.assertIs(batch.swarm_rows[0], swarm)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
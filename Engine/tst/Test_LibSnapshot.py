@@ -0,0 +1,163 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Snapshot library Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from ..GameEngine import GameEngine
+from ..LibSnapshot import write_snapshot, read_snapshot, restore_snapshot
+from ..LibSnapshot import collect_snapshot
+from ..run import run_headless
+
+
+class TestLibSnapshot(unittest.TestCase):
+    """Test object for the snapshot library"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "world.snapshot")
+        self.ants = []
+
+    def tearDown(self):
+        "This method is called after each test case"
+        shutil.rmtree(self.directory)
+
+    def create_world(self, seed=5, turns=0, swarm=False):
+        """ Returns a seeded game engine advanced by turns """
+
+        game_engine = GameEngine(swarm=swarm, seed=seed)
+        game_engine.initialize()
+
+        for _ in range(turns):
+            game_engine.update()
+
+        self.ants = [obj for obj in game_engine.objects.values()
+                     if 'ai' in obj.components]
+
+        return game_engine
+
+    #######################################################
+
+    def test_read_maps_arrays(self):
+        """ The arrays of a written snapshot are memory mapped """
+
+        game_engine = self.create_world(turns=3)
+        write_snapshot(game_engine, self.path, turn=3)
+
+        header, arrays = read_snapshot(self.path)
+
+        self.assertEqual(header["turn"], 3)
+        self.assertIsInstance(arrays["ants.position"], numpy.memmap)
+        self.assertEqual(arrays["ants.position"].shape, (len(self.ants), 3))
+
+        levels = game_engine.pheromone_engine.field.levels["food"]
+        self.assertEqual(arrays["tiles.food"].tolist(), levels.tolist())
+
+    def test_restore_continues_run(self):
+        """ A restored world continues exactly like the saved one """
+
+        game_engine = self.create_world(turns=15)
+        write_snapshot(game_engine, self.path, turn=15)
+
+        continuous = run_headless(turns=30, seed=5)[2]
+        restored = run_headless(turns=30, seed=5, restore_path=self.path)
+
+        self.assertEqual(restored[0], 15)
+        self.assertEqual(restored[2], continuous)
+
+    def test_restore_into_other_seed(self):
+        """ A world built with another seed, so with its nest elsewhere,
+        continues exactly like the saved one """
+
+        for swarm in (False, True):
+            game_engine = self.create_world(seed=1, turns=15, swarm=swarm)
+            write_snapshot(game_engine, self.path, turn=15)
+
+            for _ in range(15):
+                game_engine.update()
+
+            restored = self.create_world(seed=2, swarm=swarm)
+            restore_snapshot(restored, self.path)
+
+            for _ in range(15):
+                restored.update()
+
+            expected = collect_snapshot(game_engine)[1]
+            arrays = collect_snapshot(restored)[1]
+
+            for name in sorted(expected):
+                self.assertEqual(arrays[name].tolist(),
+                                 expected[name].tolist(), name)
+
+            self.assertEqual(sorted(restored.pheromone_engine.holders),
+                             sorted(game_engine.pheromone_engine.holders))
+
+    def test_restore_other_settings(self):
+        """ A snapshot of a world with other settings is refused """
+
+        write_snapshot(self.create_world(swarm=True), self.path)
+
+        with self.assertRaises(ValueError):
+            restore_snapshot(self.create_world(), self.path)
+
+    def test_checkpoints_written(self):
+        """ A headless run writes checkpoints every n turns """
+
+        run_headless(turns=4, seed=5, checkpoint_every=2,
+                     checkpoint_path=self.path)
+
+        self.assertEqual(read_snapshot(self.path)[0]["turn"], 4)
+
+    def test_restore_past_turns(self):
+        """ A run restored at or after its last turn stops at once """
+
+        run_headless(turns=4, seed=5, checkpoint_every=4,
+                     checkpoint_path=self.path)
+
+        self.assertEqual(run_headless(turns=4, seed=5,
+                                      restore_path=self.path)[0], 0)
+        self.assertEqual(run_headless(turns=2, seed=5,
+                                      restore_path=self.path)[0], 0)
+
+    def test_restore_mismatch(self):
+        """ A snapshot of a different world is refused """
+
+        game_engine = self.create_world()
+        write_snapshot(game_engine, self.path)
+
+        del game_engine.objects[str(self.ants[-1].object_id)]
+
+        with self.assertRaises(ValueError):
+            restore_snapshot(game_engine, self.path)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -79,20 +79,28 @@ class TestPheromoneEngine(unittest.TestCase):
 
     def setUp(self):
         "This method is called befire each test case"
-        pass
+        self.phero_eng = PheromoneEngine()
 
     def tearDown(self):
         "This method is called after each test case"
-        self.phero_eng.__init__()
+        PheromoneEngine.reset_instance()
 
     #######################################################
 
-    def test_singleton_property(self):
-        """ Test if the singleton pattern is hold """
+    def test_engines_are_independent(self):
+        """ Every constructed engine is a new engine """
         phero_eng_1 = PheromoneEngine()
         phero_eng_2 = PheromoneEngine()
 
+        self.assertNotEqual(id(phero_eng_1), id(phero_eng_2))
+
+    def test_shared_instance(self):
+        """ Test if the shared instance is the same for every call """
+        phero_eng_1 = PheromoneEngine.instance()
+        phero_eng_2 = PheromoneEngine.instance()
+
         self.assertEqual(id(phero_eng_1), id(phero_eng_2))
+        self.assertNotEqual(id(phero_eng_1), id(self.phero_eng))
 
     def test_add_holder_valid(self):
         """ Test if adding a valid object succeeds """
@@ -212,7 +220,8 @@ class TestPheromoneEngine(unittest.TestCase):
 
         center_tile = self.dummy_phero_holder()
         center_tile.components['position'].set_position_xyz((0, 0, 0))
-        center_tile.components['pheromone_holder'].level = 1.0
+        center_tile.components['pheromone_holder'].levels = \
+            {"food": 1.0, "home": 1.0}
 
         center_pos = center_tile.components['position'].pos
         objects = dict()
@@ -262,6 +271,56 @@ class TestPheromoneEngine(unittest.TestCase):
 
         self.assertEqual(holder.components['pheromone_holder'].levels["home"], 1.0)
 
+    def test_field_colors(self):
+        """ Test if the colors of the field equal the colors
+        of the individual levels """
+
+        for i in range(3):
+            holder = self.dummy_phero_holder()
+            holder.components['position'].set_position_xyz((i, -i, 0))
+            holder.components['pheromone_holder'].levels["food"] = 10.0 ** i
+            holder.components['pheromone_holder'].levels["home"] = 7.0 * i
+            self.phero_eng.add_component(holder)
+
+        colors = self.phero_eng.field_colors()
+
+        for key, holder in self.phero_eng.holders.items():
+            levels = holder.components['pheromone_holder'].levels
+            self.assertEqual(colors[key],
+                             self.phero_eng.pheromone_levels_to_color(levels))
+
+    def test_update_colors_only_changed_buckets(self):
+        """ Fills are set when holders are new or their levels moved to
+        another bucket of the palette """
+
+        holders = []
+        for i in range(2):
+            holder = self.dummy_phero_holder()
+            holder.components['position'].set_position_xyz((i, -i, 0))
+            self.phero_eng.add_component(holder)
+            holders.append(holder)
+
+        self.assertEqual(self.phero_eng.update_colors(), 2)
+        self.assertEqual(holders[0].components['render'].fill, "#000a00")
+
+        holders[0].components['pheromone_holder'].levels["home"] = 0.9
+        holders[1].components['pheromone_holder'].levels["home"] = 4.0
+
+        self.assertEqual(self.phero_eng.update_colors(), 1)
+        self.assertEqual(holders[1].components['render'].fill, "#020a00")
+
+    def test_update_holders_does_not_color(self):
+        """ Colors are derived when drawing, not in the tick """
+
+        holder = self.dummy_phero_holder()
+        holder.components['pheromone_holder'].levels["home"] = 100.0
+        self.phero_eng.add_component(holder)
+
+        self.phero_eng.update_holders()
+
+        self.assertEqual(holder.components['render'].fill, "#ffffff")
+        self.assertFalse(holder.components['render'].dirty)
+
     def test_update_actors(self):
         """ Test if the actor gets the proper levels """
 
@@ -270,7 +329,8 @@ class TestPheromoneEngine(unittest.TestCase):
 
         center_tile = self.dummy_phero_holder()
         center_tile.components['position'].set_position_xyz((0, 0, 0))
-        center_tile.components['pheromone_holder'].level = 1.0
+        center_tile.components['pheromone_holder'].levels = \
+            {"food": 1.0, "home": 1.0}
 
         objects[center_tile.object_id] = center_tile
 
@@ -321,7 +381,8 @@ class TestPheromoneEngine(unittest.TestCase):
 
         center_tile = self.dummy_phero_holder()
         center_tile.components['position'].set_position_xyz((0, 0, 0))
-        center_tile.components['pheromone_holder'].level = 1.0
+        center_tile.components['pheromone_holder'].levels = \
+            {"food": 1.0, "home": 1.0}
 
         objects[center_tile.object_id] = center_tile
 
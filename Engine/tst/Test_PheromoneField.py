@@ -0,0 +1,179 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Pheromone Field Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+import numpy
+
+from ..PheromoneField import PheromoneField, PheromoneLevels
+from Engine.Components import PheromoneHolderComponent
+
+
+class TestPheromoneField(unittest.TestCase):
+    """Test object for PheromoneField"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.field = PheromoneField(7)
+
+    #######################################################
+
+    def test_size(self):
+        """ Every slot has a level for every pheromone type """
+
+        self.assertEqual(self.field.size, 7)
+
+        for kind in ("food", "home"):
+            self.assertEqual(len(self.field.levels[kind]), 7)
+
+    def test_update_equals_holder_update(self):
+        """ The vectorized decay must give the same levels as
+        the decay of a single holder """
+
+        decay = {'food': {'relative': 0.02, 'abs_minimum': 5},
+                 'home': {'relative': 0.5, 'abs_minimum': 0}}
+
+        starts = [-1.0, 0.0, 3.0, 100.0, 1234.5]
+
+        for index, start in enumerate(starts):
+            self.field.set_levels(index, {"food": start, "home": start})
+            self.field.set_decay(index, decay)
+
+        self.field.update()
+
+        for index, start in enumerate(starts):
+            holder = PheromoneHolderComponent(None)
+            holder.decay = decay
+            holder.levels = {"food": start, "home": start}
+            holder.update()
+
+            self.assertEqual(self.field.levels["food"][index],
+                             holder.levels["food"])
+            self.assertEqual(self.field.levels["home"][index],
+                             holder.levels["home"])
+
+    def test_invalid_decay_does_not_decay(self):
+        """ A slot without decay description keeps its level """
+
+        index = 3
+        self.field.set_levels(index, {"food": 10.0, "home": 20.0})
+        self.field.set_decay(index, 0.0)
+
+        self.field.update()
+
+        self.assertEqual(self.field.levels["food"][index], 10.0)
+        self.assertEqual(self.field.levels["home"][index], 20.0)
+
+    def test_levels_view(self):
+        """ The view reads and writes the slot of the field """
+
+        index = 2
+        view = PheromoneLevels(self.field, index)
+
+        view["home"] += 2.5
+
+        self.assertEqual(self.field.levels["home"][index], 2.5)
+        self.assertEqual(dict(view), {"food": 0.0, "home": 2.5})
+
+    def test_levels_view_unknown_type(self):
+        """ Unknown pheromone types raise a KeyError like a dict """
+
+        view = PheromoneLevels(self.field, 0)
+
+        with self.assertRaises(KeyError):
+            view["sugar"] += 1.0
+
+    def test_bound_holder_is_view(self):
+        """ A bound holder keeps its levels and reads them from the field """
+
+        holder = PheromoneHolderComponent(None)
+        holder.levels = {"food": 7.0, "home": 8.0}
+
+        index = 6
+        holder.bind(self.field, index)
+
+        self.assertEqual(self.field.levels["food"][index], 7.0)
+
+        self.field.levels["home"][index] = 1.0
+        self.assertEqual(holder.levels["home"], 1.0)
+
+        holder.levels = {"food": 2.0, "home": 3.0}
+        self.assertEqual(self.field.levels["food"][index], 2.0)
+
+    def test_writes_activate_slots(self):
+        """ Slots written through the field or a view become active """
+
+        self.field.set_levels(1, {"food": 1.0})
+        PheromoneLevels(self.field, 4)["home"] = 2.0
+        self.field.add_levels("food", numpy.array([5, 5, 1]),
+                              numpy.array([1.0, 1.0, 1.0]))
+
+        self.assertEqual(sorted(self.field.get_active_keys().tolist()),
+                         [1, 4, 5])
+
+    def test_decayed_slots_leave_active_set(self):
+        """ Slots that decayed to zero are no longer decayed """
+
+        self.field.set_uniform_decay([0.0, 0.0], [1.0, 1.0])
+        self.field.set_levels(2, {"food": 1.0, "home": 2.0})
+        self.field.set_levels(3, {"food": 1.0})
+
+        self.field.update()
+
+        self.assertEqual(self.field.get_active_keys().tolist(), [2])
+        self.assertEqual(self.field.active.tolist(),
+                         [False, False, True, False, False, False, False])
+
+    def test_sparse_update_equals_update_all(self):
+        """ Decaying the active slots gives the levels of decaying all """
+
+        field = PheromoneField(100)
+        reference = PheromoneField(100)
+
+        for each in (field, reference):
+            each.set_uniform_decay([0.1, 0.5], [0.5, 0.0])
+            each.add_levels("food", numpy.arange(0, 10), numpy.arange(10.0))
+            each.add_levels("home", numpy.arange(5, 8), numpy.ones(3))
+
+        for turn in range(5):
+            field.update()
+            reference.update_all()
+
+        for kind in field.kinds:
+            self.assertEqual(field.levels[kind].tolist(),
+                             reference.levels[kind].tolist())
+
+    def test_refresh_active(self):
+        """ Levels written into the arrays are found by refresh_active """
+
+        self.field.levels["home"][6] = 3.0
+        self.field.refresh_active()
+
+        self.assertEqual(self.field.get_active_keys().tolist(), [6])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,119 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Pheromone History Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from ..PheromoneHistory import PheromoneRecorder, read_history
+from ..PheromoneField import PheromoneField
+from ..LibHexagonalPosition import calc_tile_count
+from ..run import run_headless
+
+
+class TestPheromoneHistory(unittest.TestCase):
+    """Test object for the pheromone history"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "pheromones.history")
+        self.field = PheromoneField(calc_tile_count(3))
+
+    def tearDown(self):
+        "This method is called after each test case"
+        shutil.rmtree(self.directory)
+
+    #######################################################
+
+    def test_record_every_stride(self):
+        """ Only every stride ticks a frame is appended """
+
+        recorder = PheromoneRecorder(self.path, 3, stride=2)
+
+        for tick in range(1, 6):
+            self.field.levels["food"][:] = tick
+            self.field.levels["home"][2] = -tick
+            recorder.record(self.field)
+
+        recorder.close()
+
+        header, tile_xyz, levels = read_history(self.path)
+
+        self.assertEqual(header["rings"], 3)
+        self.assertEqual(header["stride"], 2)
+        self.assertIsInstance(levels, numpy.memmap)
+        self.assertEqual(levels.shape, (2, 2, calc_tile_count(3)))
+        self.assertEqual(levels[:, 0, 0].tolist(), [2.0, 4.0])
+        self.assertEqual(levels[1, 1, 2], -4.0)
+
+        self.assertEqual(tile_xyz.shape, (calc_tile_count(3), 3))
+        self.assertEqual(tile_xyz[0].tolist(), [0, 0, 0])
+
+    def test_read_without_frames(self):
+        """ A history without frames reads as an empty level array """
+
+        PheromoneRecorder(self.path, 3).close()
+
+        levels = read_history(self.path)[2]
+
+        self.assertEqual(levels.shape, (0, 2, calc_tile_count(3)))
+
+    def test_partial_frame_ignored(self):
+        """ A frame that is still being written is not read """
+
+        recorder = PheromoneRecorder(self.path, 3)
+        recorder.record(self.field)
+        recorder.history.write(b"\0" * 8)
+        recorder.close()
+
+        self.assertEqual(len(read_history(self.path)[2]), 1)
+
+    def test_not_a_history(self):
+        """ Other files are refused """
+
+        with open(self.path, "wb") as other:
+            other.write(b"\0" * 64)
+
+        with self.assertRaises(ValueError):
+            read_history(self.path)
+
+    def test_headless_run_records(self):
+        """ A headless run records the levels after every tick """
+
+        run_headless(turns=4, seed=2, record_path=self.path)
+
+        levels = read_history(self.path)[2]
+
+        self.assertEqual(len(levels), 4)
+        self.assertGreater(levels[-1].sum(), 0.0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
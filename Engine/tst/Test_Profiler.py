@@ -0,0 +1,102 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Profiler Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import json
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from ..Profiler import Profiler, histogram_bucket
+
+
+class TestProfiler(unittest.TestCase):
+    """Test object for Profiler"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.profiler = Profiler(window=3)
+
+    #######################################################
+
+    def test_disabled_by_default(self):
+        """ A new profiler is disabled """
+
+        self.assertFalse(self.profiler.enabled)
+
+    def test_time_returns_result(self):
+        """ Timing a function returns its result and records the phase """
+
+        result = self.profiler.time('sum', sum, [1, 2])
+        self.profiler.end_tick()
+
+        self.assertEqual(result, 3)
+        self.assertEqual(len(self.profiler.timings['sum']), 1)
+
+    def test_rolling_window(self):
+        """ Only the last window ticks are kept """
+
+        for seconds in (4.0, 1.0, 2.0, 3.0):
+            self.profiler.record('phase', seconds)
+            self.profiler.count('ants', 2)
+            self.profiler.end_tick()
+
+        report = self.profiler.report()
+
+        self.assertEqual(report["ticks"], 4)
+        self.assertEqual(report["phases"]["phase"]["count"], 3)
+        self.assertEqual(report["phases"]["phase"]["max"], 3.0)
+        self.assertEqual(report["phases"]["phase"]["p50"], 2.0)
+        self.assertEqual(report["counters"]["ants"]["mean"], 2.0)
+
+    def test_stream(self):
+        """ Every tick is written as a json line """
+
+        stream = StringIO()
+        self.profiler.enable(stream)
+
+        self.profiler.record('phase', 0.5)
+        self.profiler.count('collisions', 3)
+        self.profiler.end_tick()
+
+        line = json.loads(stream.getvalue())
+
+        self.assertEqual(line, {"tick": 1,
+                                "seconds": {"phase": 0.5},
+                                "counters": {"collisions": 3}})
+
+    def test_histogram_bucket(self):
+        """ Buckets are powers of two microseconds """
+
+        self.assertEqual(histogram_bucket(0.0), 0)
+        self.assertEqual(histogram_bucket(5e-6), 2)
+        self.assertEqual(histogram_bucket(100.0), 20)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,83 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Random Streams Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..RandomStreams import RandomStreams, RandomStream
+from ..LibCommon import highest_in_list
+
+
+class TestRandomStreams(unittest.TestCase):
+    """Test object for RandomStreams"""
+
+    def test_same_seed_same_draws(self):
+        """ Streams with the same seed draw the same numbers """
+
+        first = RandomStreams(3)
+        second = RandomStreams(3)
+
+        self.assertEqual(first.ai.random(), second.ai.random())
+        self.assertEqual(first.map.randint(0, 100), second.map.randint(0, 100))
+        self.assertEqual(first.food.dice(5).tolist(),
+                         second.food.dice(5).tolist())
+
+    def test_streams_are_independent(self):
+        """ Drawing from one stream does not change another """
+
+        first = RandomStreams(3)
+        second = RandomStreams(3)
+
+        for i in range(10):
+            first.ai.random()
+
+        self.assertEqual(first.food.random(), second.food.random())
+
+    def test_batched_draws(self):
+        """ Batched draws are arrays within the bounds """
+
+        stream = RandomStream(1)
+
+        dice = stream.dice(100)
+        directions = stream.integers(0, 5, 100)
+
+        self.assertEqual(len(dice), 100)
+        self.assertTrue(((dice >= 0.0) & (dice < 1.0)).all())
+        self.assertEqual(set(directions.tolist()), set(range(6)))
+
+    def test_highest_in_list_tie_break(self):
+        """ Ties are broken by the given stream """
+
+        levels = [1.0, 3.0, 0.0, 3.0, 3.0, 2.0]
+
+        first = [highest_in_list(levels, RandomStream(5)) for i in range(3)]
+        second = [highest_in_list(levels, RandomStream(5)) for i in range(3)]
+
+        self.assertEqual(first, second)
+        self.assertIn(first[0], (1, 3, 4))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,211 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+
+########################################################################
+
+ Raster Engine Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..RasterEngine import RasterEngine, rasterize_polygon, color_to_rgb
+from ..GameObject import GameObject
+from ..GameObjectFactory import GameObjectFactory
+from ..Components import RenderComponent
+from ..Components import PositionComponent
+
+
+class TestRasterEngine(unittest.TestCase):
+    """Test object for RasterEngine"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.raster_eng = RasterEngine(80, 60, hex_radius=6)
+        self.factory = GameObjectFactory(None)
+
+    def create_object(self, xyz=(0, 0, 0), fill="#ff0000", static=False):
+        """ Returns an object with a 5 by 5 square polygon """
+
+        obj = GameObject(None)
+        obj.components['position'] = PositionComponent(obj)
+        obj.components['position'].set_position_xyz(xyz)
+        obj.components['render'] = RenderComponent(obj)
+        obj.components['render'].polygon = [-2, -2, 2, -2, 2, 2, -2, 2]
+        obj.components['render'].fill = fill
+        obj.components['render'].static = static
+
+        self.raster_eng.add_component(obj)
+
+        return obj
+
+    def pixel(self, xyz):
+        """ Returns the RGB of the pixel at the center of a coordinate """
+
+        pixel_x, pixel_y = self.raster_eng.project([xyz])
+        return tuple(self.raster_eng.frame()[pixel_y[0], pixel_x[0]].tolist())
+
+    #######################################################
+
+    def test_rasterize_polygon(self):
+        """ Every pixel of a square is covered, including its edge """
+
+        offset_x, offset_y = rasterize_polygon([-1, -1, 1, -1, 1, 1, -1, 1])
+
+        self.assertEqual(sorted(zip(offset_x.tolist(), offset_y.tolist())),
+                         [(x, y) for x in (-1, 0, 1) for y in (-1, 0, 1)])
+
+    def test_rasterize_triangle(self):
+        """ Pixels outside a triangle are not covered """
+
+        offset_x, offset_y = rasterize_polygon([0, -2, 2, 2, -2, 2])
+        pixels = set(zip(offset_x.tolist(), offset_y.tolist()))
+
+        self.assertIn((0, 0), pixels)
+        self.assertIn((2, 2), pixels)
+        self.assertNotIn((2, -2), pixels)
+
+    def test_color_to_rgb(self):
+        """ Color strings of the render components are converted """
+
+        self.assertEqual(color_to_rgb("#ff0a00"), (255, 10, 0))
+
+        with self.assertRaises(ValueError):
+            color_to_rgb("red")
+
+    def test_draw_static_and_moving(self):
+        """ Moving objects are drawn over static ones, the background
+        shows everywhere else """
+
+        self.create_object((0, 0, 0), "#0000ff", static=True)
+        self.create_object((1, -1, 0), "#0000ff", static=True)
+        ant = self.create_object((0, 0, 0), "#ff0000")
+
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(self.pixel((0, 0, 0)), (255, 0, 0))
+        self.assertEqual(self.pixel((1, -1, 0)), (0, 0, 255))
+        self.assertEqual(tuple(self.raster_eng.frame()[0, 0].tolist()),
+                         (0, 0, 0))
+
+        ant.components['position'].set_position_xyz((1, -1, 0))
+        self.assertEqual(self.raster_eng.updateScreen(), 1)
+
+        self.assertEqual(self.pixel((0, 0, 0)), (0, 0, 255))
+        self.assertEqual(self.pixel((1, -1, 0)), (255, 0, 0))
+
+    def test_fill_and_visibility_changes(self):
+        """ Changed fills are drawn, hidden objects are not """
+
+        tile = self.create_object((0, 0, 0), "#0000ff", static=True)
+        ant = self.create_object((1, -1, 0), "#ff0000")
+
+        tile.components['render'].fill = "#00ff00"
+        ant.components['render'].visible = False
+
+        self.assertEqual(self.raster_eng.updateScreen(), 2)
+
+        self.assertEqual(self.pixel((0, 0, 0)), (0, 255, 0))
+        self.assertEqual(self.pixel((1, -1, 0)), (0, 0, 0))
+
+    def test_callback_before_draw(self):
+        """ Registered methods are called before every frame """
+
+        tile = self.create_object((0, 0, 0), "#0000ff", static=True)
+
+        def color_tile():
+            tile.components['render'].fill = "#00ff00"
+
+        self.raster_eng.callback_before_draw(color_tile)
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(self.pixel((0, 0, 0)), (0, 255, 0))
+
+    def test_remove_component(self):
+        """ Removed objects are no longer drawn """
+
+        tile = self.create_object((0, 0, 0), "#0000ff", static=True)
+        ant = self.create_object((1, -1, 0), "#ff0000")
+
+        self.raster_eng.remove_component(tile)
+        self.raster_eng.remove_component(ant)
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(self.raster_eng.objects, [])
+        self.assertEqual(self.raster_eng.frame().sum(), 0)
+
+    def test_objects_off_image_are_clipped(self):
+        """ Objects partly or fully off the image do not wrap around """
+
+        self.create_object((-20, 0, 20), "#ff0000")
+        self.create_object((3, 0, -3), "#ff0000")
+
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(self.raster_eng.frame()[:, 0].sum(), 0)
+
+    def test_factory_objects(self):
+        """ Tiles, ants, food and the nest of the factory can be drawn """
+
+        for obj in (self.factory.create_tile(), self.factory.create_ant(),
+                    self.factory.create_food(), self.factory.create_nest()):
+            self.raster_eng.add_component(obj)
+
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(len(self.raster_eng.statics), 1)
+        self.assertGreater(self.raster_eng.frame().sum(), 0)
+
+    def test_dirty_flags_are_kept(self):
+        """ Drawing a frame leaves the dirty flags of the render
+        components to the GraphicsEngine """
+
+        tile = self.create_object((0, 0, 0), "#0000ff", static=True)
+        ant = self.create_object((1, -1, 0), "#ff0000")
+
+        tile.components['render'].fill = "#00ff00"
+        ant.components['render'].fill = "#00ff00"
+
+        self.assertEqual(self.raster_eng.updateScreen(), 2)
+        self.assertEqual(self.raster_eng.updateScreen(), 0)
+
+        self.assertEqual(tile.components['render'].dirty, set(['fill']))
+        self.assertEqual(ant.components['render'].dirty, set(['fill']))
+
+    def test_many_objects(self):
+        """ Colors stay with their objects when the rows grow and after
+        a removal """
+
+        tiles = [self.create_object((0, 0, 0), "#0000%02x" % i, static=True)
+                 for i in range(40)]
+        ants = [self.create_object((1, -1, 0), "#%02x0000" % i)
+                for i in range(40)]
+
+        self.raster_eng.remove_component(tiles[-1])
+        self.raster_eng.remove_component(ants[-1])
+        self.raster_eng.updateScreen()
+
+        self.assertEqual(self.pixel((0, 0, 0)), (0, 0, 38))
+        self.assertEqual(self.pixel((1, -1, 0)), (38, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
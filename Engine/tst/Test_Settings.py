@@ -0,0 +1,113 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Settings Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..Settings import Settings
+from ..World import World
+from ..GameSettings import MAPSIZE, ANT_DEFAULTS, POSITION_STEPS
+
+
+class TestSettings(unittest.TestCase):
+    """Test object for Settings"""
+
+    #######################################################
+
+    def test_defaults_and_derived(self):
+        """ Defaults come from GameSettings, derived values follow them """
+
+        settings = Settings(rings=4)
+
+        self.assertEqual(Settings().rings, MAPSIZE)
+        self.assertEqual(settings.tile_count, 37)
+        self.assertEqual(settings.max_coord, 3)
+        self.assertEqual(settings.max_steps, 3 * POSITION_STEPS)
+        self.assertEqual(settings.decay_relative.tolist(), [0.02, 0.02])
+
+    def test_settings_are_copies(self):
+        """ Changing settings does not change GameSettings """
+
+        settings = Settings()
+        settings.ant_defaults["BEHAVIOUR"]["listen_to_pheromone"] = 0.0
+
+        self.assertNotEqual(ANT_DEFAULTS["BEHAVIOUR"]["listen_to_pheromone"],
+                            0.0)
+
+    def test_replace(self):
+        """ Replacing gives new settings with new derived values """
+
+        settings = Settings(rings=4)
+        bigger = settings.replace(rings=6)
+
+        self.assertEqual(settings.tile_count, 37)
+        self.assertEqual(bigger.tile_count, 91)
+
+        with self.assertRaises(ValueError):
+            settings.replace(mapsize=6)
+
+    def test_override_paths(self):
+        """ Paths name a setting or its GameSettings name and keys """
+
+        settings = Settings().override(
+            {"MAPSIZE": 4,
+             "TILE_DEFAULTS.DECAY.food.relative": 0.5,
+             "ant_defaults.FEEDING.speed": 3})
+
+        self.assertEqual(settings.rings, 4)
+        self.assertEqual(settings.decay_relative.tolist(), [0.5, 0.02])
+        self.assertEqual(settings.feeding_speed, 3)
+
+        with self.assertRaises(ValueError):
+            Settings().override({"ANT_DEFAULTS.BEHAVIOR.x": 1})
+
+        with self.assertRaises(ValueError):
+            Settings().override({"HEX_RADIUS": 1})
+
+    def test_worlds_with_different_settings(self):
+        """ Worlds in one process use their own settings """
+
+        small = World(rings=4, ants=5, seed=2)
+        large = World(small.settings.override(
+            {"MAPSIZE": 7, "ANT_DEFAULTS.SPEED": 0.25}))
+
+        for world in (small, large):
+            world.initialize()
+            world.run(10)
+
+        for world, max_coord, speed in ((small, 3, 0.5), (large, 6, 0.25)):
+            ants = world.game_engine.get_members('move')
+
+            self.assertEqual(len(ants), 5)
+            self.assertTrue(all(ant.components['move'].max_coord == max_coord
+                                for ant in ants))
+            self.assertTrue(all(ant.components['move'].speed == speed
+                                for ant in ants))
+            self.assertEqual(len(world.pheromone_engine.holders),
+                             world.settings.tile_count)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
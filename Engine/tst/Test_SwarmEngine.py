@@ -0,0 +1,227 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Swarm Engine Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..SwarmEngine import SwarmEngine
+from ..PheromoneEngine import PheromoneEngine
+from ..GameObjectFactory import GameObjectFactory
+from Engine.Components import SwarmAiComponent
+from Engine.Components import SwarmPositionComponent
+
+
+class TestSwarmEngine(unittest.TestCase):
+    """Test object for SwarmEngine"""
+
+    def setUp(self):
+        "This method is called before each test case"
+        self.swarm_eng = SwarmEngine()
+        self.swarm_eng.set_map_size(4)
+
+        self.phero_eng = PheromoneEngine()
+        self.phero_eng.set_map_size(4)
+
+        self.factory = GameObjectFactory(None)
+
+    def create_ant(self, xyz=(0, 0, 0), orientation=0):
+        """ Returns an ant adopted by the swarm """
+
+        ant = self.factory.create_ant()
+        ant.components['position'].set_position_xyz(xyz)
+        ant.components['position'].orientation = orientation
+        self.swarm_eng.add_component(ant)
+
+        return ant
+
+    def create_map(self):
+        """ Adds a tile for every position of the map """
+
+        self.phero_eng.add_component(self.factory.create_tile())
+
+        for ring in range(4):
+            for side in range(6):
+                for tile in range(ring):
+                    tile_obj = self.factory.create_tile()
+                    pos = tile_obj.components['position'].pos
+                    pos.set_position_rst(ring, side, tile)
+                    self.phero_eng.add_component(tile_obj)
+
+    #######################################################
+
+    def test_adopt_replaces_components_by_views(self):
+        """ An adopted ant reads its state from the swarm arrays """
+
+        ant = self.create_ant((1, -1, 0), orientation=2)
+
+        self.assertIsInstance(ant.components['ai'], SwarmAiComponent)
+        self.assertIsInstance(ant.components['position'],
+                              SwarmPositionComponent)
+        self.assertNotIn('pheromone_actor', ant.components)
+        self.assertNotIn('collision', ant.components)
+
+        self.assertEqual(ant.components['position'].xyz(), [1.0, -1.0, 0.0])
+        self.assertEqual(ant.components['position'].orientation, 2)
+        self.assertEqual(ant.components['ai'].interested_in, "food")
+        self.assertEqual(ant.components['move'].speed, 0.5)
+
+    def test_views_write_to_arrays(self):
+        """ Setting state through the views changes the swarm arrays """
+
+        ant = self.create_ant()
+
+        ant.components['position'].set_position_xyz((2, -1, -1))
+        ant.components['ai'].interested_in = "home"
+        ant.components['ai'].stats.returned_food += 3
+
+        self.assertEqual(self.swarm_eng.steps[0].tolist(),
+                         [2000, -1000, -1000])
+        self.assertEqual(self.swarm_eng.kinds[self.swarm_eng.interested[0]],
+                         "home")
+        self.assertEqual(self.swarm_eng.get_stats()["returned_food"], 3)
+
+    def test_adopt_many_ants(self):
+        """ The arrays grow when many ants are adopted """
+
+        for i in range(100):
+            self.create_ant()
+
+        self.assertEqual(self.swarm_eng.size, 100)
+        self.assertEqual(len(self.swarm_eng.ants), 100)
+
+    def test_move(self):
+        """ Ants move by their speed in the direction of their orientation """
+
+        ant = self.create_ant((0, 0, 0), orientation=1)
+
+        self.swarm_eng.move()
+
+        self.assertEqual(ant.components['position'].xyz(), [0.5, 0.0, -0.5])
+
+    def test_move_in_small_steps_reaches_center(self):
+        """ Positions are stored in steps, ten moves of a tenth of a tile
+        end exactly on the next tile center """
+
+        ant = self.create_ant((0, 0, 0), orientation=1)
+        ant.components['move'].speed = 0.1
+
+        for _ in range(10):
+            self.swarm_eng.move()
+
+        self.assertEqual(self.swarm_eng.steps[0].tolist(), [1000, 0, -1000])
+        self.assertEqual(self.swarm_eng.centered().tolist(), [0])
+
+    def test_move_turns_around_on_edge(self):
+        """ Ants trying to walk off the map turn around """
+
+        ant = self.create_ant((3, -3, 0), orientation=0)
+
+        self.swarm_eng.move()
+
+        self.assertEqual(ant.components['position'].xyz(), [3.0, -3.0, 0.0])
+        self.assertEqual(ant.components['position'].orientation, 3)
+
+    def test_update_deposit_levels_equals_ai_component(self):
+        """ The deposit decay of the swarm equals the one of the
+        ai component """
+
+        ant = self.create_ant()
+        self.swarm_eng.deposit[0] = (100.0, 20.0)
+
+        self.swarm_eng.update_deposit_levels(self.swarm_eng.centered())
+
+        reference = self.factory.create_ant()
+        deposit = reference.components['pheromone_actor'].deposit
+        deposit["food"], deposit["home"] = 100.0, 20.0
+        reference.components['ai'].update_pheromone_deposit_levels(
+            reference.components['ai'].pheromone_deposit_delta)
+
+        self.assertEqual(self.swarm_eng.deposit[0].tolist(),
+                         [deposit["food"], deposit["home"]])
+
+    def test_found_food_and_nest(self):
+        """ Ants on food pick it up, ants bringing it to the nest return it """
+
+        food = self.factory.create_food()
+        food.components['food'].set_start_amount(10)
+        self.swarm_eng.add_component(food)
+
+        ant = self.create_ant()
+        centered = self.swarm_eng.centered()
+        self.swarm_eng.act_on_collisions(
+            centered, self.swarm_eng.tile_keys(self.swarm_eng.steps[centered]))
+
+        self.assertEqual(ant.components['ai'].interested_in, "home")
+        self.assertEqual(ant.components['ai'].stats.carrying_food, 1)
+        self.assertEqual(food.components['food'].amount, 9)
+
+        self.swarm_eng.found_nest(0)
+
+        self.assertEqual(ant.components['ai'].interested_in, "food")
+        self.assertEqual(ant.components['ai'].stats.returned_food, 1)
+        self.assertEqual(ant.components['ai'].stats.carrying_food, 0)
+
+    def test_choose_orientation_follows_pheromone(self):
+        """ Ants always listening to pheromones walk to the highest level """
+
+        self.create_map()
+        self.phero_eng.holders[self.phero_eng.get_holder_key((0, 1, -1))]\
+            .components['pheromone_holder'].levels["food"] = 5.0
+
+        self.create_ant()
+        self.swarm_eng.listen_to_pheromone[0] = 1.0
+
+        centered = self.swarm_eng.centered()
+        keys = self.swarm_eng.tile_keys(self.swarm_eng.steps[centered])
+        self.swarm_eng.choose_orientations(centered, keys, self.phero_eng)
+
+        self.assertEqual(self.swarm_eng.orientation[0], 2)
+
+    def test_deposit_pheromones(self):
+        """ Centered ants deposit on their tile, others do not """
+
+        self.create_map()
+
+        self.create_ant((0, 0, 0))
+        self.create_ant((0.5, -0.5, 0))
+        self.swarm_eng.deposit[:2] = (0.0, 4.0)
+
+        self.swarm_eng.deposit_pheromones(self.phero_eng)
+
+        levels = self.phero_eng.field.levels["home"]
+        self.assertEqual(levels[self.phero_eng.get_holder_key((0, 0, 0))], 4.0)
+        self.assertEqual(levels.sum(), 4.0)
+
+    def test_ant_not_adopted_twice(self):
+        """ Adding an adopted ant again does not adopt it again """
+
+        ant = self.create_ant()
+        self.swarm_eng.add_component(ant)
+
+        self.assertEqual(self.swarm_eng.size, 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
@@ -0,0 +1,109 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ World Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import unittest
+
+from ..World import World
+from ..GameEngine import GameEngine
+from ..run import summarize_stats
+
+
+class TestWorld(unittest.TestCase):
+    """Test object for World"""
+
+    #######################################################
+
+    def test_worlds_own_their_engines(self):
+        """ Worlds share none of their engines """
+
+        first = World(rings=4, ants=5, seed=1)
+        second = World(rings=4, ants=5, seed=1, swarm=True)
+
+        self.assertIsNot(first.game_engine, second.game_engine)
+        self.assertIsNot(first.pheromone_engine, second.pheromone_engine)
+        self.assertIsNot(first.collision_engine, second.collision_engine)
+        self.assertIsNone(first.swarm_engine)
+        self.assertIsNotNone(second.swarm_engine)
+
+    def test_worlds_side_by_side(self):
+        """ Worlds advanced in turns give the same result as a world
+        advanced on its own """
+
+        worlds = [World(rings=6, ants=20, seed=seed) for seed in (4, 4, 5)]
+
+        for world in worlds:
+            world.initialize()
+
+        for _ in range(40):
+            for world in worlds:
+                world.update()
+
+        alone = World(rings=6, ants=20, seed=4)
+        alone.initialize()
+        alone.run(40)
+
+        self.assertEqual(alone.turn, 40)
+        self.assertEqual(len(worlds[0].game_engine.objects),
+                         len(alone.game_engine.objects))
+
+        stats = [summarize_stats(world.game_engine) for world in worlds]
+        self.assertEqual(stats[0], summarize_stats(alone.game_engine))
+        self.assertEqual(stats[0], stats[1])
+
+    def test_epsilon_setting(self):
+        """ Ants slower than the epsilon of the settings do not move,
+        with and without the swarm engine """
+
+        for swarm in (False, True):
+            world = World(rings=4, ants=5, seed=1, swarm=swarm,
+                          epsilon=1.0)
+            world.initialize()
+
+            ants = [obj for obj in world.game_engine.objects.values()
+                    if 'ai' in obj.components]
+            start = [ant.components['position'].xyz() for ant in ants]
+
+            world.run(3)
+
+            self.assertEqual([ant.components['position'].xyz()
+                              for ant in ants], start)
+
+    def test_shared_game_engine(self):
+        """ The shared instance is kept until it is reset """
+
+        shared = GameEngine.instance()
+
+        self.assertIs(GameEngine.instance(), shared)
+        self.assertIsNot(GameEngine(), shared)
+
+        GameEngine.reset_instance()
+
+        self.assertIsNot(GameEngine.instance(), shared)
+        GameEngine.reset_instance()
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
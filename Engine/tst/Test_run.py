@@ -0,0 +1,130 @@
+"""
+
+    This file is part of HexACO.
+
+    HexACO is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    HexACO is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with HexACO.  If not, see <http://www.gnu.org/licenses/>.
+
+########################################################################
+
+ Simulation runner Test Class
+
+########################################################################
+
+Description
+-----------
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from ..run import parse_args, run_headless
+from ..LibSnapshot import read_snapshot
+from ..GameSettings import NUMBER_OF_ANTS
+
+
+class TestRun(unittest.TestCase):
+    """Test object for the simulation runner"""
+
+    #######################################################
+
+    def test_parse_args(self):
+        """ The command line arguments of a headless run """
+
+        args = parse_args(["--headless", "--turns", "10",
+                           "--snapshot-every", "5"])
+
+        self.assertTrue(args.headless)
+        self.assertEqual(args.turns, 10)
+        self.assertEqual(args.snapshot_every, 5)
+        self.assertIsNone(args.snapshot_file)
+
+    def test_run_headless(self):
+        """ A headless run performs the requested number of ticks """
+
+        ticks, seconds, stats = run_headless(turns=3)
+
+        self.assertEqual(ticks, 3)
+        self.assertGreaterEqual(seconds, 0.0)
+        self.assertEqual(sorted(stats),
+                         ["carrying_food", "found_food", "returned_food"])
+
+    def run_seeded(self, seed, turns=20):
+        """ Returns the arrays of a checkpoint of a seeded run, the
+        positions, pheromone levels and stats of the world """
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            path = os.path.join(directory, "world.snapshot")
+            run_headless(turns=turns, seed=seed, checkpoint_every=turns,
+                         checkpoint_path=path)
+
+            arrays = read_snapshot(path)[1]
+            return dict((name, array.tolist())
+                        for name, array in arrays.items())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_run_headless_seeded(self):
+        """ Runs with the same seed are the same, runs with another seed
+        differ """
+
+        first = self.run_seeded(11)
+        other = self.run_seeded(12)
+
+        self.assertEqual(first, self.run_seeded(11))
+        self.assertNotEqual(first["ants.position"], other["ants.position"])
+        self.assertNotEqual(first["tiles.home"], other["tiles.home"])
+
+    def test_run_headless_snapshots(self):
+        """ Snapshots are written as json lines every n turns """
+
+        snapshots = StringIO()
+
+        run_headless(turns=4, snapshot_every=2, snapshot_file=snapshots)
+
+        lines = snapshots.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+
+        snapshot = json.loads(lines[1])
+        self.assertEqual(snapshot["turn"], 4)
+        self.assertEqual(len(snapshot["ants"]), NUMBER_OF_ANTS)
+        self.assertIn("stats", snapshot)
+
+    def test_run_headless_frames(self):
+        """ Frames are drawn every n turns without changing the run """
+
+        directory = tempfile.mkdtemp()
+
+        try:
+            path = os.path.join(directory, "%02d.png")
+            stats = run_headless(turns=4, seed=5, frames_path=path,
+                                 frames_every=2)[2]
+
+            self.assertEqual(sorted(os.listdir(directory)),
+                             ["02.png", "04.png"])
+            self.assertEqual(stats, run_headless(turns=4, seed=5)[2])
+        finally:
+            shutil.rmtree(directory)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=1)
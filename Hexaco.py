@@ -23,44 +23,12 @@
 
 Description
 -----------
-Creates all software components and manages the main game loop """
+Creates all software components and manages the main game loop,
+see Engine/run.py for running without a window """
 
-from Engine import GraphicsEngine
-from Engine import GameEngine
-from Engine.GameSettings import TURNS
+import sys
 
-try:
-    from Tkinter import *
-except ImportError:
-    from tkinter import *
+from Engine.run import main
 
-from time import sleep
-
-ROOT = Tk()
-
-# Create the engines
-GAME_ENGINE = GameEngine()
-GRAPHICS_ENGINE = GraphicsEngine(master=ROOT)
-
-# Set all constants
-GRAPHICS_ENGINE.set_hex_radius()
-
-# Alert other engines when a new game_object is added
-GAME_ENGINE.callback_for_new_object(GRAPHICS_ENGINE.add_component)
-
-# Initialize all engines
-GAME_ENGINE.initialize()
-
-i = TURNS or -1
-
-print ("Starting main game loop")
-
-while i is not 0:
-
-    i -= 1
-    GRAPHICS_ENGINE.set_turn_text(i)
-
-    GAME_ENGINE.update()
-
-    GRAPHICS_ENGINE.updateScreen()
-    sleep(0.)
+if __name__ == '__main__':
+    main(sys.argv[1:])